@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+点阵字体直接导入
+- 解析 BDF 文件，或通过 FreeType 读取 TTF/OTF 内嵌的位图 strike
+- 不经过缩放/栅格化，按基线放入字符格后直接进入描边、量化、打包流程
+- 尺寸匹配的点阵字体（如 Spleen 8x16 / 16x32 / 32x64）像素级还原
+"""
+import numpy as np
+import freetype
+import os
+
+from ft_bitmap import bitmap_mask
+
+
+def parse_bdf(bdf_path):
+    """
+    解析 BDF 点阵字体。
+    返回 dict：ascent / descent / bbox(w, h, xoff, yoff) / glyphs，
+    glyphs 为 {码位: (bool 位图[h, w], xoff, yoff, dwidth)}。
+    """
+    font = {"ascent": None, "descent": None, "bbox": None, "glyphs": {}}
+    with open(bdf_path, "r", encoding="latin-1") as f:
+        lines = iter(f.read().splitlines())
+    for line in lines:
+        key, _, rest = line.partition(" ")
+        if key == "FONTBOUNDINGBOX":
+            font["bbox"] = tuple(int(v) for v in rest.split())
+        elif key == "FONT_ASCENT":
+            font["ascent"] = int(rest)
+        elif key == "FONT_DESCENT":
+            font["descent"] = int(rest)
+        elif key == "STARTCHAR":
+            encoding, dwidth, bbx = -1, None, None
+            for line in lines:
+                key, _, rest = line.partition(" ")
+                if key == "ENCODING":
+                    encoding = int(rest.split()[0])
+                elif key == "DWIDTH":
+                    dwidth = int(rest.split()[0])
+                elif key == "BBX":
+                    bbx = tuple(int(v) for v in rest.split())
+                elif key == "BITMAP":
+                    break
+            gw, gh, xoff, yoff = bbx if bbx else font["bbox"]
+            rows = [next(lines).strip() for _ in range(gh)]
+            bitmap = np.zeros((gh, gw), dtype=bool)
+            if gh and gw:
+                # 每行十六进制，按字节左对齐，高位为最左像素
+                nbytes = (gw + 7) // 8
+                raw = bytes.fromhex("".join(r[:nbytes * 2].ljust(nbytes * 2, "0") for r in rows))
+                data = np.frombuffer(raw, dtype=np.uint8).reshape(gh, nbytes)
+                bitmap = np.unpackbits(data, axis=1)[:, :gw].astype(bool)
+            if encoding >= 0:
+                font["glyphs"][encoding] = (bitmap, xoff, yoff, dwidth if dwidth is not None else gw)
+    if font["bbox"] is None:
+        raise ValueError(f"{bdf_path}: 缺少 FONTBOUNDINGBOX")
+    if font["ascent"] is None or font["descent"] is None:
+        # 未给出 FONT_ASCENT/DESCENT 时按字体包围盒推算
+        font["descent"] = -font["bbox"][3]
+        font["ascent"] = font["bbox"][1] - font["descent"]
+    return font
+
+
+def load_strike(font_path, out_size):
+    """
+    通过 FreeType 读取内嵌位图 strike：选择高度不超过字符格的最大 strike。
+    返回 (face, ascent, descent)，字形由 strike_glyph 按需加载。
+    """
+    face = freetype.Face(font_path)
+    if face.num_fixed_sizes == 0:
+        raise ValueError(f"{font_path}: 字体不包含内嵌位图 strike")
+    sizes = [(s.height, i) for i, s in enumerate(face.available_sizes)]
+    fitting = [si for si in sizes if si[0] <= out_size[1]]
+    _, index = max(fitting) if fitting else min(sizes)
+    face.select_size(index)
+    ascent = face.size.ascender >> 6
+    descent = -(face.size.descender >> 6)
+    return face, ascent, descent
+
+
+def strike_glyph(face, char):
+    face.load_char(char, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_MONO)
+    glyph = face.glyph
+    bitmap = bitmap_mask(glyph.bitmap)
+    return bitmap, glyph.bitmap_left, glyph.bitmap_top - bitmap.shape[0], glyph.advance.x >> 6
+
+
+def place_bitmap(bitmap, xoff, yoff, ascent, descent, line_width, out_size):
+    """
+    按基线把点阵字形放入字符格：字体行框（line_width x ascent+descent）在字符格中居中，
+    尺寸正好相等时即为原始点阵位置。返回 0/255 灰度画布。
+    """
+    w, h = out_size
+    canvas = np.zeros((h, w), dtype=np.uint8)
+    gh, gw = bitmap.shape
+    origin_x = (w - line_width) // 2
+    top = (h - (ascent + descent)) // 2
+    x0 = origin_x + xoff
+    y0 = top + ascent - (yoff + gh)
+    # 裁剪到画布范围
+    sx0, sy0 = max(0, -x0), max(0, -y0)
+    dx0, dy0 = max(0, x0), max(0, y0)
+    dx1, dy1 = min(w, x0 + gw), min(h, y0 + gh)
+    if dx1 > dx0 and dy1 > dy0:
+        canvas[dy0:dy1, dx0:dx1][bitmap[sy0:sy0 + dy1 - dy0, sx0:sx0 + dx1 - dx0]] = 255
+    return canvas
+
+
+def is_bitmap_font(font_path):
+    """BDF，或不可缩放、只含内嵌 strike 的字体"""
+    if font_path.lower().endswith(".bdf"):
+        return True
+    try:
+        face = freetype.Face(font_path)
+    except Exception:
+        return False
+    return not face.is_scalable and face.num_fixed_sizes > 0
+
+
+def render_bitmap_font_canvases(chars, font_path, out_size):
+    """
+    读取点阵字体并定位到字符格，返回 (画布列表, 描述信息)。缺字输出空白并提示。
+    """
+    canvases = []
+    if font_path.lower().endswith(".bdf"):
+        font = parse_bdf(font_path)
+        line_width = font["bbox"][0]
+        for c in chars:
+            glyph = font["glyphs"].get(ord(c))
+            if glyph is None:
+                print(f"⚠️ 字符 {c!r} (U+{ord(c):04X}) 不在 {os.path.basename(font_path)} 中，输出空白")
+                canvases.append(np.zeros((out_size[1], out_size[0]), dtype=np.uint8))
+                continue
+            bitmap, xoff, yoff, _ = glyph
+            canvases.append(place_bitmap(bitmap, xoff, yoff, font["ascent"], font["descent"], line_width, out_size))
+        info = f"bdf {line_width}x{font['ascent'] + font['descent']}"
+    else:
+        face, ascent, descent = load_strike(font_path, out_size)
+        line_width = face.size.max_advance >> 6
+        for c in chars:
+            bitmap, xoff, yoff, _ = strike_glyph(face, c)
+            canvases.append(place_bitmap(bitmap, xoff, yoff, ascent, descent, line_width, out_size))
+        info = f"strike {line_width}x{ascent + descent}"
+    return canvases, info
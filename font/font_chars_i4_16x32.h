@@ -4,73 +4,73 @@
 #include <stdint.h>
 
 // I4 Font: white(0xF), gray(0xA/0x6), black/transparent(0x0). Size 16x32, 2 pixels per byte.
-// font_pixel_size=31, outline_width=2, var_coords=[85, 400]
+// font_pixel_size=26, outline_width=2, var_coords={'wdth': 85, 'wght': 400}
 
 static const uint8_t char_0_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
-    0x08, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x80,
-    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x80, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x80, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x00, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x00, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x00, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x00, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x00, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x00, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x00, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x00, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x80, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x80, 0x08, 0x8F, 0xFF, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
+    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
+    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0x88,
     0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xF8, 0x88, 0x08, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xF8, 0x80, 0x08, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xF8, 0x80, 0x08, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xF8, 0x80, 0x08, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xF8, 0x80, 0x08, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xF8, 0x80, 0x08, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xF8, 0x80, 0x08, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xF8, 0x88, 0x08, 0x8F, 0xFF, 0x88,
     0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xF8, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0x8F, 0xFF, 0xF8, 0x88, 0xFF, 0xFF, 0x88,
     0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
     0x08, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x80,
     0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
     0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
 };
 
 static const uint8_t char_1_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x88, 0x88, 0x88, 0x88, 0xFF, 0x88, 0x00, 0x00,
-    0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00,
-    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00,
-    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00,
-    0x88, 0xFF, 0x88, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x08, 0x88, 0x88, 0x88, 0xFF, 0xF8, 0x80, 0x00,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
+    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
+    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
+    0x08, 0x8F, 0xFF, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x08, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x08, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -79,103 +79,103 @@ static const uint8_t char_1_16x32_i4[256] = {
 static const uint8_t char_2_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
-    0x08, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x80,
-    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
+    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
+    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0x88,
     0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x80, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x80, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x00, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x00, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x08, 0x88, 0xFF, 0xF8, 0x88,
-    0x00, 0x00, 0x00, 0x88, 0x88, 0xFF, 0xF8, 0x88,
-    0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0x88, 0x80,
-    0x00, 0x00, 0x08, 0x88, 0xFF, 0xF8, 0x88, 0x80,
-    0x00, 0x00, 0x88, 0x88, 0xFF, 0xF8, 0x88, 0x00,
-    0x00, 0x08, 0x88, 0x8F, 0xFF, 0x88, 0x80, 0x00,
-    0x00, 0x88, 0x88, 0xFF, 0xF8, 0x88, 0x80, 0x00,
-    0x00, 0x88, 0x8F, 0xFF, 0x88, 0x88, 0x00, 0x00,
-    0x08, 0x88, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00,
-    0x88, 0x88, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x00,
-    0x88, 0x8F, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0x88,
+    0x88, 0x8F, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x08, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x80,
+    0x00, 0x08, 0x88, 0x8F, 0xFF, 0xF8, 0x88, 0x80,
+    0x00, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x00,
+    0x08, 0x88, 0x8F, 0xFF, 0xF8, 0x88, 0x80, 0x00,
+    0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88,
+    0x88, 0x8F, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88,
+    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
     0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
-    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
     0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88,
     0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
 };
 
 static const uint8_t char_3_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
-    0x08, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x80,
-    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
     0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x80, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x80, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x00, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xF8, 0x88,
-    0x00, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xF8, 0x88,
-    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
-    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x00, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88,
-    0x00, 0x08, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x00, 0x88, 0x88, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x00, 0x08, 0x88, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x00, 0x08, 0x88, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x80, 0x88, 0x88, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0x88,
     0x88, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
-    0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x80,
-    0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
+    0x88, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
+    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
+    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0x88, 0x88, 0x80, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x80,
+    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
 };
 
 static const uint8_t char_4_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0x88, 0xF8, 0x88, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0x88, 0x00,
-    0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0x88, 0x00,
-    0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0x88, 0x00,
-    0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x00,
-    0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x00,
-    0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x00,
-    0x00, 0x88, 0x8F, 0xFF, 0x8F, 0xFF, 0x88, 0x00,
-    0x00, 0x88, 0x8F, 0xFF, 0x8F, 0xFF, 0x88, 0x00,
-    0x08, 0x88, 0xFF, 0xF8, 0x8F, 0xFF, 0x88, 0x00,
-    0x08, 0x88, 0xFF, 0xF8, 0x8F, 0xFF, 0x88, 0x00,
-    0x88, 0x8F, 0xFF, 0x88, 0x8F, 0xFF, 0x88, 0x00,
-    0x88, 0x8F, 0xFF, 0x88, 0x8F, 0xFF, 0x88, 0x00,
-    0x88, 0xFF, 0xF8, 0x88, 0x8F, 0xFF, 0x88, 0x00,
-    0x88, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0x88, 0x88,
-    0x8F, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0x88, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xF8, 0x80,
+    0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xF8, 0x80,
+    0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
+    0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80,
+    0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80,
+    0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x80,
+    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x80,
+    0x08, 0x88, 0x8F, 0xFF, 0x8F, 0xFF, 0xF8, 0x80,
+    0x08, 0x88, 0xFF, 0xFF, 0x8F, 0xFF, 0xF8, 0x80,
+    0x88, 0x8F, 0xFF, 0xF8, 0x8F, 0xFF, 0xF8, 0x80,
+    0x88, 0x8F, 0xFF, 0x88, 0x8F, 0xFF, 0xF8, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x8F, 0xFF, 0xF8, 0x88,
+    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
     0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
     0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
-    0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88, 0x88,
-    0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x00,
+    0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80,
+    0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -185,102 +185,102 @@ static const uint8_t char_5_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80,
-    0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80,
-    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80,
-    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80,
-    0x08, 0x8F, 0xF8, 0x88, 0x88, 0x88, 0x88, 0x80,
-    0x88, 0x8F, 0xF8, 0x88, 0x88, 0x88, 0x88, 0x80,
-    0x88, 0x8F, 0xF8, 0x80, 0x00, 0x00, 0x00, 0x00,
-    0x88, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00, 0x00,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0x00,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0x80,
-    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x00, 0x08, 0x88, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x00, 0x00, 0x88, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x00, 0x08, 0x88, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x00, 0x08, 0x88, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x80, 0x88, 0x8F, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88,
+    0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88,
+    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
+    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
+    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
+    0x08, 0x8F, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88,
+    0x08, 0x8F, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88,
+    0x08, 0x8F, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x00,
+    0x08, 0x8F, 0xFF, 0x88, 0xF8, 0x88, 0x88, 0x80,
     0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
-    0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x80,
-    0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0x8F, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0x88, 0x88, 0x80, 0x88, 0x8F, 0xFF, 0xF8,
+    0x88, 0x88, 0x88, 0x80, 0x08, 0x8F, 0xFF, 0xF8,
+    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
+    0x08, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x80,
+    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
     0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
 };
 
 static const uint8_t char_6_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
-    0x00, 0x08, 0x88, 0x88, 0x8F, 0xFF, 0x88, 0x00,
-    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x00,
-    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x00,
-    0x08, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x00,
-    0x08, 0x8F, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x00,
-    0x88, 0x8F, 0xFF, 0x88, 0x88, 0x00, 0x00, 0x00,
-    0x88, 0x8F, 0xF8, 0x88, 0x80, 0x00, 0x00, 0x00,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0x00,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0x80,
-    0x88, 0xFF, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x80,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80,
+    0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80,
+    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x80,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x08, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x80,
+    0x88, 0x8F, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x00,
+    0x88, 0x8F, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x00,
+    0x88, 0xFF, 0xFF, 0x88, 0xFF, 0x88, 0x88, 0x80,
+    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
     0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0xFF, 0xFF, 0x88,
-    0x8F, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x8F, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x80, 0x08, 0x88, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x80, 0x08, 0x88, 0xFF, 0xF8,
-    0x88, 0xFF, 0x88, 0x80, 0x00, 0x88, 0xFF, 0xF8,
-    0x88, 0xFF, 0x88, 0x80, 0x08, 0x88, 0xFF, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0xFF, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0x8F, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
-    0x08, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x80,
-    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0xF8,
+    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0xF8,
+    0x88, 0xFF, 0xF8, 0x88, 0x08, 0x88, 0xFF, 0xF8,
+    0x88, 0xFF, 0xF8, 0x88, 0x08, 0x88, 0xFF, 0xF8,
+    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0xF8,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0xF8,
+    0x88, 0x8F, 0xFF, 0xF8, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x08, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88,
+    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
 };
 
 static const uint8_t char_7_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
-    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88,
+    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
     0x88, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xF8, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xF8, 0x88,
     0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xF8, 0x88,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xF8, 0x80,
-    0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xF8, 0x80,
     0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0x88, 0x80,
-    0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0x88, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0xFF, 0xF8, 0x88, 0x00,
+    0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0x88, 0x80,
     0x00, 0x00, 0x08, 0x88, 0xFF, 0xF8, 0x88, 0x00,
-    0x00, 0x00, 0x08, 0x88, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x88, 0xFF, 0xF8, 0x88, 0x00,
+    0x00, 0x00, 0x88, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
     0x00, 0x00, 0x88, 0x8F, 0xFF, 0x88, 0x80, 0x00,
-    0x00, 0x00, 0x88, 0x8F, 0xF8, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0xFF, 0xF8, 0x88, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0xFF, 0xF8, 0x80, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0xFF, 0x88, 0x80, 0x00, 0x00,
+    0x00, 0x00, 0x88, 0xFF, 0xFF, 0x88, 0x80, 0x00,
+    0x00, 0x08, 0x88, 0xFF, 0xF8, 0x88, 0x00, 0x00,
+    0x00, 0x08, 0x88, 0xFF, 0xF8, 0x88, 0x00, 0x00,
+    0x00, 0x88, 0x8F, 0xFF, 0xF8, 0x80, 0x00, 0x00,
     0x00, 0x88, 0x8F, 0xFF, 0x88, 0x80, 0x00, 0x00,
-    0x00, 0x88, 0x8F, 0xFF, 0x88, 0x00, 0x00, 0x00,
-    0x00, 0x88, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x00,
-    0x00, 0x88, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x00,
-    0x00, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x88, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00,
+    0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00,
+    0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -290,34 +290,34 @@ static const uint8_t char_8_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
-    0x08, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x80,
-    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
     0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0xF8, 0x80, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x80, 0x08, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xF8, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
-    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
+    0x88, 0x8F, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0x8F, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0x8F, 0xFF, 0xF8, 0x88, 0xFF, 0xF8, 0x88,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
     0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xF8, 0x88,
+    0x88, 0x8F, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0x88,
     0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x80, 0x08, 0x88, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x00, 0x08, 0x88, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x80, 0x88, 0x88, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
-    0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x80,
-    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
+    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x08, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88,
+    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
 };
 
@@ -325,34 +325,34 @@ static const uint8_t char_9_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
-    0x08, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x80,
-    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
+    0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
+    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0x88,
     0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x80, 0x08, 0x88, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x00, 0x08, 0x88, 0xFF, 0x88,
-    0x8F, 0xFF, 0x88, 0x80, 0x08, 0x88, 0xFF, 0x88,
-    0x88, 0xFF, 0x88, 0x80, 0x08, 0x88, 0xFF, 0xF8,
+    0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0x88,
+    0x88, 0xFF, 0xF8, 0x80, 0x08, 0x8F, 0xFF, 0xF8,
     0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0xF8,
     0x88, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0xF8,
-    0x88, 0xFF, 0xFF, 0xF8, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0xFF, 0x88,
-    0x08, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x00, 0x08, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xF8, 0x88,
-    0x00, 0x00, 0x00, 0x88, 0x88, 0xFF, 0xF8, 0x88,
-    0x00, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0x88, 0x80,
-    0x00, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x80,
-    0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
+    0x88, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0xF8,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
+    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0x8F, 0xFF, 0x88,
+    0x00, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0xFF, 0xF8, 0x88,
+    0x00, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x88,
+    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
     0x00, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x00,
-    0x00, 0x88, 0xFF, 0xF8, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x88, 0xF8, 0x88, 0x88, 0x88, 0x80, 0x00,
     0x00, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00,
-    0x00, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
 };
 
@@ -369,8 +369,9 @@ static const uint8_t char_u002D_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
     0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
-    0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00,
+    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x00,
     0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00,
     0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00,
     0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x00,
@@ -388,7 +389,6 @@ static const uint8_t char_u002D_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
 };
 
 static const uint8_t char_u0020_16x32_i4[256] = {
@@ -433,21 +433,20 @@ static const uint8_t char_u003A_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x88, 0x88, 0x80, 0x00, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00,
     0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x8F, 0xF8, 0x88, 0x00, 0x00,
+    0x00, 0x00, 0x88, 0xFF, 0xF8, 0x88, 0x00, 0x00,
     0x00, 0x00, 0x88, 0xFF, 0xFF, 0x88, 0x00, 0x00,
     0x00, 0x00, 0x88, 0xFF, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x8F, 0xF8, 0x88, 0x00, 0x00,
+    0x00, 0x00, 0x88, 0xFF, 0xF8, 0x88, 0x00, 0x00,
     0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x88, 0x88, 0x80, 0x00, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x88, 0x88, 0x80, 0x00, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00,
     0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x8F, 0xF8, 0x88, 0x00, 0x00,
+    0x00, 0x00, 0x88, 0xFF, 0xF8, 0x88, 0x00, 0x00,
     0x00, 0x00, 0x88, 0xFF, 0xFF, 0x88, 0x00, 0x00,
     0x00, 0x00, 0x88, 0xFF, 0xFF, 0x88, 0x00, 0x00,
     0x00, 0x00, 0x88, 0x8F, 0xF8, 0x88, 0x00, 0x00,
@@ -459,6 +458,7 @@ static const uint8_t char_u003A_16x32_i4[256] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
 };
 
 static const bitmap_i4_t i4_16x32[13] = {
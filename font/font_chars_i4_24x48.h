@@ -4,7 +4,7 @@
 #include <stdint.h>
 
 // I4 Font: white(0xF), gray(0xA/0x6), black/transparent(0x0). Size 24x48, 2 pixels per byte.
-// font_pixel_size=43, outline_width=2, var_coords=[50.0, 500.0]
+// font_pixel_size=43, outline_width=2, var_coords={'wdth': 100, 'wght': 400}
 
 static const uint8_t char_0_24x48_i4[576] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -13,43 +13,43 @@ static const uint8_t char_0_24x48_i4[576] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x8F, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00,
-    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
-    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x00,
+    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
     0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x80,
-    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80,
-    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
     0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
-    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x00,
-    0x00, 0x08, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x80, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
+    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -64,18 +64,18 @@ static const uint8_t char_1_24x48_i4[576] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
-    0x08, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
-    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
+    0x00, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
+    0x08, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
     0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
     0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
-    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
-    0x08, 0x8F, 0xFF, 0xF8, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
-    0x08, 0x8F, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
+    0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
+    0x08, 0x8F, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
     0x08, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
-    0x08, 0x88, 0x88, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
+    0x08, 0x88, 0x88, 0x88, 0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
@@ -115,40 +115,40 @@ static const uint8_t char_2_24x48_i4[576] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x88, 0x88, 0x8F, 0xF8, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x80, 0x00,
     0x00, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x00,
-    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
+    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
     0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80,
-    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
-    0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00, 0x00,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00,
     0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00, 0x00, 0x00,
     0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00, 0x00, 0x00,
     0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
     0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00, 0x00, 0x00, 0x00,
     0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88,
+    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
+    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
+    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
+    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
     0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88,
     0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -166,43 +166,43 @@ static const uint8_t char_3_24x48_i4[576] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x88, 0x88, 0x8F, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x00, 0x00,
     0x00, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00,
     0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
-    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
     0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
+    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
     0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
     0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
-    0x88, 0x88, 0x88, 0x88, 0x80, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80,
+    0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
     0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80,
-    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
     0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
     0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
     0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
-    0x08, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
-    0x00, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x80, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
+    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
+    0x00, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -217,41 +217,41 @@ static const uint8_t char_4_24x48_i4[576] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x80, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
     0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88,
-    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
-    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
-    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
-    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
-    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x88, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x88, 0x88,
+    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF,
+    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF,
+    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF,
+    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF,
+    0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x88, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x88, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x80, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -276,35 +276,35 @@ static const uint8_t char_5_24x48_i4[576] = {
     0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80,
     0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80,
     0x00, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80,
-    0x08, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80,
+    0x00, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80,
+    0x08, 0x88, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x08, 0x88, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00,
-    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x08, 0x8F, 0xFF, 0xFF, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x00,
-    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
-    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x00,
+    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
     0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88,
-    0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x08, 0x88, 0x88, 0x88, 0x88, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x80,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88,
+    0x08, 0x88, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
+    0x08, 0x88, 0x88, 0x88, 0x88, 0x80, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x00, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8,
+    0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8,
+    0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8,
+    0x88, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
     0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
-    0x08, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x00,
-    0x00, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x80, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
+    0x00, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -319,41 +319,41 @@ static const uint8_t char_6_24x48_i4[576] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
     0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
     0x00, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
     0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
-    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x80, 0x00,
-    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00,
-    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x00,
-    0x88, 0xFF, 0xFF, 0xF8, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
+    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00, 0x00,
+    0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
+    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0x88, 0x88, 0x88, 0x88, 0x00,
+    0x88, 0xFF, 0xFF, 0xF8, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x80,
     0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
     0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
-    0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
-    0x00, 0x08, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x80, 0x00,
+    0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
+    0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xF8,
+    0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8,
+    0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8,
+    0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8,
+    0x88, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xF8,
+    0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8,
+    0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
+    0x00, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x80,
+    0x00, 0x08, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x00,
     0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -372,38 +372,38 @@ static const uint8_t char_7_24x48_i4[576] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88,
     0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88,
+    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
+    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
+    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
     0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
-    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
-    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
-    0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -421,43 +421,43 @@ static const uint8_t char_8_24x48_i4[576] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x88, 0x88, 0x8F, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00,
-    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x00,
+    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
     0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80,
-    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
-    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
-    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
-    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
-    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
     0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80,
-    0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
-    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
-    0x08, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
+    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
+    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x08, 0x8F, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xF8, 0x88,
+    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
+    0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x80,
+    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88, 0x80,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
+    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x80,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
+    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8,
+    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8,
     0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
     0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88,
     0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
-    0x08, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
-    0x00, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x80, 0x00,
+    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x80,
+    0x00, 0x08, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x00,
     0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -472,43 +472,43 @@ static const uint8_t char_9_24x48_i4[576] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x88, 0x88, 0x8F, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x80, 0x00,
-    0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
-    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x00, 0x00,
+    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
+    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88,
     0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
-    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
-    0x08, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88,
-    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x8F, 0xFF, 0xFF, 0x88,
-    0x00, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
-    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x80,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0x88,
+    0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8,
+    0x8F, 0xFF, 0xFF, 0x88, 0x00, 0x00, 0x00, 0x00, 0x88, 0xFF, 0xFF, 0xF8,
+    0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8,
+    0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x88, 0x88, 0xFF, 0xFF, 0xF8,
+    0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8,
+    0x88, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8,
+    0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8,
+    0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
+    0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8,
+    0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0xFF, 0xFF, 0x88,
+    0x00, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x8F, 0xFF, 0xFF, 0x88,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0xFF, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0x88,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xF8, 0x88,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88,
     0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0x88, 0x80,
-    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xF8, 0x88, 0x80,
     0x00, 0x08, 0x88, 0x88, 0x88, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00,
-    0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00,
+    0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x80, 0x00,
     0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x80, 0x00, 0x00,
-    0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x00, 0x00, 0x00,
-    0x00, 0x08, 0x8F, 0xFF, 0xF8, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x88, 0x88, 0x00, 0x00,
+    0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xFF, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -537,15 +537,15 @@ static const uint8_t char_u002D_24x48_i4[576] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x88, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF8, 0x80, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -629,17 +629,18 @@ static const uint8_t char_u003A_24x48_i4[576] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xF8, 0x88, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -647,16 +648,15 @@ static const uint8_t char_u003A_24x48_i4[576] = {
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x8F, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0xFF, 0xFF, 0xF8, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x08, 0x88, 0x8F, 0xFF, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x88, 0x88, 0x88, 0x88, 0x80, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x08, 0x88, 0x88, 0x88, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
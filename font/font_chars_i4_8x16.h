@@ -4,61 +4,61 @@
 #include <stdint.h>
 
 // I4 Font: white(0xF), gray(0xA/0x6), black/transparent(0x0). Size 8x16, 2 pixels per byte.
-// font_pixel_size=14, outline_width=1, var_coords=[70, 300]
+// font_pixel_size=12, outline_width=1, var_coords={'wdth': 70, 'wght': 300}
 
 static const uint8_t char_0_8x16_i4[64] = {
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x00,
-    0x08, 0x88, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8,
-    0x8F, 0xF8, 0x8F, 0xF8,
-    0x8F, 0xF8, 0x88, 0xF8,
-    0x8F, 0xF8, 0x08, 0xF8,
-    0x8F, 0xF8, 0x08, 0xF8,
-    0x8F, 0xF8, 0x08, 0xF8,
-    0x8F, 0xF8, 0x08, 0xF8,
-    0x8F, 0xF8, 0x88, 0xF8,
-    0x8F, 0xF8, 0x8F, 0xF8,
-    0x88, 0xFF, 0xFF, 0xF8,
-    0x08, 0x8F, 0xF8, 0x88,
-    0x00, 0x88, 0x88, 0x00,
+    0x00, 0x00, 0x00, 0x00,
+    0x88, 0x88, 0x88, 0x00,
+    0x8F, 0xFF, 0xF8, 0x80,
+    0x8F, 0xFF, 0xFF, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0x8F, 0xFF, 0xFF, 0x80,
+    0x88, 0xFF, 0x88, 0x80,
+    0x08, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00,
 };
 
 static const uint8_t char_1_8x16_i4[64] = {
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
-    0x08, 0x88, 0x88, 0x00,
-    0x88, 0xFF, 0xF8, 0x00,
-    0x8F, 0xF8, 0xF8, 0x00,
-    0x88, 0x88, 0xF8, 0x00,
-    0x00, 0x08, 0xF8, 0x00,
-    0x00, 0x08, 0xF8, 0x00,
-    0x00, 0x08, 0xF8, 0x00,
-    0x00, 0x08, 0xF8, 0x00,
-    0x00, 0x08, 0xF8, 0x00,
-    0x00, 0x08, 0xF8, 0x00,
-    0x00, 0x08, 0xF8, 0x00,
-    0x00, 0x08, 0x88, 0x00,
+    0x00, 0x00, 0x00, 0x00,
+    0x08, 0x88, 0x80, 0x00,
+    0x88, 0xFF, 0x88, 0x00,
+    0x8F, 0xFF, 0xF8, 0x00,
+    0x8F, 0x8F, 0xF8, 0x00,
+    0x88, 0x8F, 0xF8, 0x00,
+    0x00, 0x8F, 0xF8, 0x00,
+    0x00, 0x8F, 0xF8, 0x00,
+    0x00, 0x8F, 0xF8, 0x00,
+    0x00, 0x8F, 0xF8, 0x00,
+    0x00, 0x8F, 0xF8, 0x00,
+    0x00, 0x88, 0x88, 0x00,
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
 };
 
 static const uint8_t char_2_8x16_i4[64] = {
     0x00, 0x00, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x00,
-    0x08, 0x88, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8,
-    0x8F, 0xF8, 0x8F, 0xF8,
-    0x8F, 0xF8, 0x88, 0xF8,
-    0x88, 0x88, 0x8F, 0xF8,
-    0x00, 0x08, 0x8F, 0xF8,
-    0x00, 0x88, 0xFF, 0x88,
-    0x08, 0x8F, 0xF8, 0x80,
-    0x08, 0xFF, 0x88, 0x00,
-    0x88, 0xFF, 0x88, 0x88,
-    0x8F, 0xFF, 0xFF, 0xFF,
-    0x88, 0x88, 0x88, 0x88,
+    0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00,
+    0x88, 0x88, 0x88, 0x00,
+    0x8F, 0xFF, 0xF8, 0x80,
+    0xFF, 0xFF, 0xFF, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0x88, 0x88, 0xFF, 0x80,
+    0x08, 0x8F, 0xFF, 0x80,
+    0x08, 0xFF, 0xF8, 0x80,
+    0x88, 0xFF, 0x88, 0x00,
+    0x8F, 0xF8, 0x88, 0x80,
+    0xFF, 0xFF, 0xFF, 0x80,
+    0x88, 0x88, 0x88, 0x80,
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
 };
@@ -66,37 +66,37 @@ static const uint8_t char_2_8x16_i4[64] = {
 static const uint8_t char_3_8x16_i4[64] = {
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x00,
-    0x08, 0x88, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8,
-    0x8F, 0xF8, 0x8F, 0xF8,
-    0x8F, 0xF8, 0x88, 0xF8,
-    0x88, 0x88, 0x8F, 0xF8,
-    0x08, 0xFF, 0xFF, 0x88,
-    0x08, 0x8F, 0xFF, 0xF8,
-    0x88, 0x88, 0x88, 0xF8,
-    0x8F, 0x88, 0x08, 0xF8,
-    0x8F, 0xF8, 0x88, 0xF8,
-    0x88, 0xFF, 0xFF, 0xF8,
-    0x08, 0x8F, 0xF8, 0x88,
-    0x00, 0x88, 0x88, 0x00,
+    0x00, 0x00, 0x00, 0x00,
+    0x88, 0x88, 0x88, 0x00,
+    0x8F, 0xFF, 0xF8, 0x80,
+    0xFF, 0xFF, 0xFF, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0x88, 0x88, 0xFF, 0x80,
+    0x08, 0xFF, 0xF8, 0x80,
+    0x88, 0x88, 0xFF, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0x8F, 0xFF, 0xFF, 0x80,
+    0x88, 0xFF, 0x88, 0x80,
+    0x08, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00,
 };
 
 static const uint8_t char_4_8x16_i4[64] = {
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x80,
-    0x00, 0x08, 0xFF, 0x80,
-    0x00, 0x88, 0xFF, 0x80,
-    0x00, 0x8F, 0xFF, 0x80,
-    0x08, 0x8F, 0x8F, 0x80,
-    0x08, 0xFF, 0x8F, 0x80,
-    0x88, 0xF8, 0x8F, 0x80,
-    0x8F, 0xF8, 0x8F, 0x88,
-    0x8F, 0xFF, 0xFF, 0xFF,
-    0x88, 0x88, 0x8F, 0x88,
-    0x00, 0x00, 0x8F, 0x80,
-    0x00, 0x00, 0x88, 0x80,
+    0x00, 0x00, 0x00, 0x00,
+    0x00, 0x08, 0x88, 0x00,
+    0x00, 0x88, 0xF8, 0x00,
+    0x08, 0x8F, 0xF8, 0x00,
+    0x08, 0xFF, 0xF8, 0x00,
+    0x88, 0xFF, 0xF8, 0x00,
+    0x8F, 0xF8, 0xF8, 0x00,
+    0xFF, 0x88, 0xF8, 0x88,
+    0xFF, 0xFF, 0xFF, 0xF8,
+    0x88, 0x88, 0xF8, 0x88,
+    0x00, 0x08, 0xF8, 0x00,
+    0x00, 0x08, 0x88, 0x00,
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
 };
@@ -105,55 +105,55 @@ static const uint8_t char_5_8x16_i4[64] = {
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
-    0x08, 0x88, 0x88, 0x88,
-    0x08, 0xFF, 0xFF, 0xF8,
-    0x08, 0xF8, 0x88, 0x88,
-    0x88, 0xF8, 0x88, 0x80,
-    0x8F, 0xFF, 0xFF, 0x88,
-    0x8F, 0xFF, 0xFF, 0xF8,
-    0x88, 0xF8, 0x88, 0xF8,
-    0x88, 0x88, 0x08, 0xFF,
-    0x8F, 0x88, 0x88, 0xF8,
-    0x8F, 0xF8, 0x8F, 0xF8,
-    0x88, 0xFF, 0xFF, 0xF8,
-    0x08, 0x8F, 0xF8, 0x88,
-    0x00, 0x88, 0x88, 0x00,
+    0x88, 0x88, 0x88, 0x80,
+    0x8F, 0xFF, 0xFF, 0x80,
+    0x8F, 0xFF, 0xFF, 0x80,
+    0x8F, 0x88, 0x88, 0x80,
+    0x8F, 0xFF, 0xF8, 0x80,
+    0xFF, 0xFF, 0xFF, 0x80,
+    0x88, 0x88, 0xFF, 0x80,
+    0xFF, 0x88, 0x8F, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0x8F, 0xFF, 0xFF, 0x80,
+    0x88, 0xFF, 0x88, 0x80,
+    0x08, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00,
 };
 
 static const uint8_t char_6_8x16_i4[64] = {
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x88, 0x80,
-    0x00, 0x88, 0x8F, 0x80,
-    0x08, 0x8F, 0xFF, 0x80,
+    0x00, 0x00, 0x00, 0x00,
+    0x08, 0x88, 0x88, 0x00,
+    0x88, 0xFF, 0xF8, 0x00,
+    0x8F, 0xFF, 0xF8, 0x00,
+    0x8F, 0xF8, 0x88, 0x00,
+    0xFF, 0xFF, 0xF8, 0x80,
+    0xFF, 0xFF, 0xFF, 0x80,
+    0xFF, 0x88, 0x8F, 0x80,
+    0xFF, 0x88, 0x8F, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0x8F, 0xFF, 0xFF, 0x80,
     0x88, 0xFF, 0x88, 0x80,
-    0x8F, 0xF8, 0x88, 0x80,
-    0x8F, 0xFF, 0xFF, 0x88,
-    0x8F, 0xFF, 0xFF, 0xF8,
-    0x8F, 0xF8, 0x88, 0xF8,
-    0x8F, 0xF8, 0x08, 0xFF,
-    0x8F, 0xF8, 0x08, 0xFF,
-    0x8F, 0xF8, 0x88, 0xF8,
-    0x88, 0xFF, 0xFF, 0xF8,
-    0x08, 0x8F, 0xF8, 0x88,
-    0x00, 0x88, 0x88, 0x00,
+    0x08, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00,
 };
 
 static const uint8_t char_7_8x16_i4[64] = {
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
-    0x88, 0x88, 0x88, 0x88,
-    0x8F, 0xFF, 0xFF, 0xF8,
-    0x88, 0x88, 0x8F, 0xF8,
-    0x00, 0x00, 0x8F, 0xF8,
-    0x00, 0x08, 0x8F, 0x88,
-    0x00, 0x08, 0xFF, 0x80,
-    0x00, 0x08, 0xFF, 0x80,
-    0x00, 0x88, 0xF8, 0x80,
+    0x00, 0x00, 0x00, 0x00,
+    0x88, 0x88, 0x88, 0x80,
+    0xFF, 0xFF, 0xFF, 0x80,
+    0xFF, 0xFF, 0xFF, 0x80,
+    0x88, 0x88, 0xFF, 0x80,
+    0x00, 0x8F, 0xF8, 0x80,
     0x00, 0x8F, 0xF8, 0x00,
-    0x08, 0x8F, 0x88, 0x00,
-    0x08, 0xFF, 0x80, 0x00,
-    0x08, 0x88, 0x80, 0x00,
+    0x08, 0x8F, 0xF8, 0x00,
+    0x08, 0xFF, 0x88, 0x00,
+    0x88, 0xFF, 0x80, 0x00,
+    0x8F, 0xF8, 0x80, 0x00,
+    0x88, 0x88, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
 };
@@ -161,39 +161,39 @@ static const uint8_t char_7_8x16_i4[64] = {
 static const uint8_t char_8_8x16_i4[64] = {
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x00,
-    0x08, 0x88, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8,
-    0x8F, 0xF8, 0x8F, 0xF8,
-    0x8F, 0xF8, 0x88, 0xF8,
-    0x8F, 0xF8, 0x8F, 0xF8,
-    0x88, 0xFF, 0xFF, 0xF8,
-    0x8F, 0xFF, 0xFF, 0xF8,
-    0x8F, 0xF8, 0x88, 0xF8,
-    0x8F, 0x88, 0x08, 0xF8,
-    0x8F, 0xF8, 0x88, 0xF8,
-    0x88, 0xFF, 0xFF, 0xF8,
-    0x08, 0x8F, 0xF8, 0x88,
-    0x00, 0x88, 0x88, 0x00,
+    0x00, 0x00, 0x00, 0x00,
+    0x88, 0x88, 0x88, 0x00,
+    0x8F, 0xFF, 0xF8, 0x80,
+    0x8F, 0xFF, 0xFF, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0x8F, 0xF8, 0xFF, 0x80,
+    0x8F, 0xFF, 0xF8, 0x80,
+    0xFF, 0xFF, 0xFF, 0x80,
+    0xFF, 0x88, 0x8F, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0x8F, 0xFF, 0xFF, 0x80,
+    0x88, 0xFF, 0x88, 0x80,
+    0x08, 0x88, 0x80, 0x00,
+    0x00, 0x00, 0x00, 0x00,
 };
 
 static const uint8_t char_9_8x16_i4[64] = {
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
-    0x00, 0x08, 0x88, 0x00,
-    0x08, 0x88, 0xF8, 0x88,
-    0x88, 0xFF, 0xFF, 0xF8,
-    0x8F, 0xF8, 0x8F, 0xF8,
-    0x8F, 0xF8, 0x88, 0xF8,
-    0x8F, 0xF8, 0x88, 0xFF,
-    0x8F, 0xF8, 0x8F, 0xFF,
-    0x88, 0xFF, 0xFF, 0xF8,
-    0x08, 0x8F, 0xF8, 0xF8,
-    0x00, 0x88, 0x8F, 0xF8,
-    0x08, 0x88, 0xFF, 0xF8,
-    0x08, 0xFF, 0xFF, 0x88,
-    0x08, 0xF8, 0x88, 0x80,
-    0x08, 0x88, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00,
+    0x88, 0x88, 0x88, 0x00,
+    0x8F, 0xFF, 0xF8, 0x80,
+    0xFF, 0xFF, 0xFF, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0xFF, 0x88, 0x8F, 0x80,
+    0xFF, 0x88, 0xFF, 0x80,
+    0x8F, 0xFF, 0xFF, 0x80,
+    0x88, 0x88, 0xFF, 0x80,
+    0x88, 0x8F, 0xFF, 0x80,
+    0x8F, 0xFF, 0xF8, 0x80,
+    0x88, 0x88, 0x88, 0x00,
+    0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00,
 };
 
 static const uint8_t char_u002D_8x16_i4[64] = {
@@ -203,9 +203,9 @@ static const uint8_t char_u002D_8x16_i4[64] = {
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00,
     0x08, 0x88, 0x88, 0x80,
     0x08, 0xFF, 0xFF, 0x80,
+    0x08, 0xFF, 0xFF, 0x80,
     0x08, 0x88, 0x88, 0x80,
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
@@ -238,13 +238,13 @@ static const uint8_t char_u003A_8x16_i4[64] = {
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
     0x00, 0x00, 0x00, 0x00,
-    0x00, 0x88, 0x88, 0x00,
-    0x00, 0x8F, 0xF8, 0x00,
+    0x00, 0x88, 0x80, 0x00,
+    0x00, 0x8F, 0x88, 0x00,
     0x00, 0x8F, 0xF8, 0x00,
     0x00, 0x88, 0x88, 0x00,
     0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00,
-    0x00, 0x88, 0x88, 0x00,
+    0x00, 0x88, 0x80, 0x00,
+    0x00, 0x8F, 0x88, 0x00,
     0x00, 0x8F, 0xF8, 0x00,
     0x00, 0x8F, 0x88, 0x00,
     0x00, 0x88, 0x80, 0x00,
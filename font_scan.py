@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+字体目录字符覆盖扫描工具
+- 多进程并行读取目录下每个字体的 cmap（可选读取字形度量统计）
+- 报告指定字符集 / Unicode 区间的覆盖率与缺字
+- 结果按字体内容哈希缓存，字体未变化时再次扫描无需重新解析
+- 字体内容哈希本身按 (路径, 修改时间, 大小) 持久缓存，字体未变化时再次扫描无需重新读取整个文件
+"""
+import freetype
+import argparse
+import hashlib
+import json
+import os
+
+from font_shm import font_face, font_pool
+
+FONT_EXTS = (".ttf", ".otf", ".bdf")
+CACHE_VERSION = 1
+HASH_CACHE_PATH = ".font_hash_cache.json"
+
+# {缓存文件: {绝对路径: [修改时间, 大小, 哈希]}}，同一进程内只读一次磁盘
+_hash_stores = {}
+
+
+def _read_hashes(cache_path):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == CACHE_VERSION:
+            return data.get("fonts", {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _save_hashes(cache_path, entries):
+    # 与 osd_search_cache 相同：先合并其他进程写入的条目，再经进程独有的临时文件替换
+    for path, entry in _read_hashes(cache_path).items():
+        entries.setdefault(path, entry)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": CACHE_VERSION, "fonts": entries}, f)
+    os.replace(tmp_path, cache_path)
+
+
+def font_hash(font_path, cache_path=HASH_CACHE_PATH):
+    """
+    字体内容的 SHA-1。按 (绝对路径, 修改时间, 大小) 缓存在进程内与 cache_path 中，
+    文件未变化时不再读取；cache_path 为空时只在进程内缓存
+    """
+    st = os.stat(font_path)
+    path = os.path.abspath(font_path)
+    stamp = [st.st_mtime_ns, st.st_size]
+    if cache_path not in _hash_stores:
+        _hash_stores[cache_path] = _read_hashes(cache_path) if cache_path else {}
+    entries = _hash_stores[cache_path]
+    entry = entries.get(path)
+    if entry is not None and entry[:2] == stamp:
+        return entry[2]
+    h = hashlib.sha1()
+    with open(font_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    entries[path] = stamp + [h.hexdigest()]
+    if cache_path:
+        try:
+            _save_hashes(cache_path, entries)
+        except OSError as e:
+            print(f"⚠️ 字体哈希缓存写入失败: {e}")
+    return entries[path][2]
+
+
+def codepoints_to_ranges(codepoints):
+    """有序码位压缩为 [[start, end], ...]，便于缓存"""
+    ranges = []
+    for cp in sorted(codepoints):
+        if ranges and cp == ranges[-1][1] + 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    return ranges
+
+
+def ranges_to_codepoints(ranges):
+    codepoints = set()
+    for start, end in ranges:
+        codepoints.update(range(start, end + 1))
+    return codepoints
+
+
+def parse_ranges(text):
+    """解析 '0x20-0x7E,0x400-0x4FF,0x3000' 形式的 Unicode 区间"""
+    codepoints = set()
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            codepoints.update(range(int(start, 0), int(end, 0) + 1))
+        else:
+            codepoints.add(int(part, 0))
+    return codepoints
+
+
+def _glyph_metrics_summary(face, coverage):
+    # 以字体单位统计 advance / 高度，判断是否等宽以及数字是否等宽（OSD 时间戳不抖动）
+    advances = []
+    heights = []
+    for cp in coverage:
+        face.load_char(chr(cp), freetype.FT_LOAD_NO_SCALE)
+        m = face.glyph.metrics
+        if m.horiAdvance:
+            advances.append(m.horiAdvance)
+        heights.append(m.height)
+    digit_advances = set()
+    for d in "0123456789":
+        if ord(d) in coverage:
+            face.load_char(d, freetype.FT_LOAD_NO_SCALE)
+            digit_advances.add(face.glyph.metrics.horiAdvance)
+    return {
+        "advance_min": min(advances) if advances else 0,
+        "advance_max": max(advances) if advances else 0,
+        "advance_mean": round(sum(advances) / len(advances), 1) if advances else 0,
+        "height_max": max(heights) if heights else 0,
+        "tabular_digits": len(digit_advances) == 1,
+    }
+
+
+def scan_font(font_path, with_metrics=False, digest=None):
+    """扫描单个字体：只读 cmap 与头部信息，可选统计字形度量"""
+    face = font_face(font_path)
+    coverage = {code for code, _ in face.get_chars()}
+    axes = []
+    if face.has_multiple_masters:
+        try:
+            axes = [axis.tag for axis in face.get_variation_info().axes]
+        except Exception:
+            axes = []
+    entry = {
+        "hash": digest or font_hash(font_path),
+        "family": face.family_name.decode("utf-8", "replace") if face.family_name else "",
+        "style": face.style_name.decode("utf-8", "replace") if face.style_name else "",
+        "num_glyphs": face.num_glyphs,
+        "units_per_em": face.units_per_EM,
+        "scalable": face.is_scalable,
+        "fixed_width": face.is_fixed_width,
+        "axes": axes,
+        "coverage": codepoints_to_ranges(coverage),
+    }
+    if with_metrics and face.is_scalable:
+        entry["metrics"] = _glyph_metrics_summary(face, coverage)
+    return entry
+
+
+def _scan_job(job):
+    path, with_metrics, digest = job
+    try:
+        return path, scan_font(path, with_metrics, digest)
+    except Exception as e:
+        return path, {"hash": digest, "error": str(e)}
+
+
+def load_cache(cache_path):
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("fonts", {})
+
+
+def save_cache(cache_path, entries):
+    if not cache_path:
+        return
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump({"version": CACHE_VERSION, "fonts": entries}, f)
+
+
+def list_fonts(font_dir):
+    return sorted(
+        os.path.join(font_dir, name)
+        for name in os.listdir(font_dir)
+        if name.lower().endswith(FONT_EXTS)
+    )
+
+
+def scan_directory(font_dir, with_metrics=False, cache_path=None, workers=None):
+    """
+    并行扫描目录，返回 {font_path: entry}。
+    缓存以字体内容哈希为键，命中时不再打开字体。
+    """
+    cache = load_cache(cache_path)
+    results = {}
+    jobs = []
+    for path in list_fonts(font_dir):
+        digest = font_hash(path)
+        cached = cache.get(digest)
+        if cached is not None and "error" not in cached and (not with_metrics or "metrics" in cached or not cached.get("scalable")):
+            results[path] = cached
+        else:
+            jobs.append((path, with_metrics, digest))
+
+    if jobs:
+        # 字体只读入共享内存一次，worker 直接从内存创建 face
+        with font_pool([job[0] for job in jobs], workers) as pool:
+            for path, entry in pool.map(_scan_job, jobs):
+                results[path] = entry
+
+    if cache_path:
+        for entry in results.values():
+            if "error" not in entry:
+                cache[entry["hash"]] = entry
+        save_cache(cache_path, cache)
+    return results, len(jobs)
+
+
+def coverage_report(results, codepoints):
+    """按覆盖率降序返回 [(path, entry, covered, missing), ...]"""
+    report = []
+    for path, entry in results.items():
+        if "error" in entry:
+            continue
+        coverage = ranges_to_codepoints(entry["coverage"])
+        missing = sorted(cp for cp in codepoints if cp not in coverage)
+        report.append((path, entry, len(codepoints) - len(missing), missing))
+    report.sort(key=lambda r: (-r[2], os.path.basename(r[0])))
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="并行扫描字体目录的字符覆盖率（按字体哈希缓存）")
+    parser.add_argument("--font_dir", type=str, default="fonts", help="字体目录")
+    parser.add_argument("--chars", type=str, default="0123456789- :", help="需要覆盖的字符")
+    parser.add_argument("--ranges", type=str, default="", help="需要覆盖的 Unicode 区间，如 0x20-0x7E,0x400-0x4FF")
+    parser.add_argument("--metrics", action="store_true", help="同时统计字形度量（advance、高度、数字是否等宽）")
+    parser.add_argument("--cache", type=str, default=".font_scan_cache.json", help="缓存文件路径，空字符串表示不缓存")
+    parser.add_argument("--workers", type=int, default=None, help="并行进程数（默认 CPU 核数）")
+    parser.add_argument("--show_missing", type=int, default=16, help="每个字体最多列出的缺字数")
+    args = parser.parse_args()
+
+    codepoints = {ord(c) for c in args.chars} | parse_ranges(args.ranges)
+    results, scanned = scan_directory(args.font_dir, args.metrics, args.cache or None, args.workers)
+    print(f"🔍 {len(results)} 个字体，重新解析 {scanned} 个，其余命中缓存；目标 {len(codepoints)} 个码位")
+
+    for path, entry, covered, missing in coverage_report(results, codepoints):
+        pct = 100.0 * covered / len(codepoints) if codepoints else 100.0
+        kind = "var[" + ",".join(entry["axes"]) + "]" if entry["axes"] else ("scalable" if entry["scalable"] else "bitmap")
+        print(f"{pct:6.1f}%  {os.path.basename(path)}  ({entry['family']} {entry['style']}, {entry['num_glyphs']} glyphs, {kind})")
+        if "metrics" in entry:
+            m = entry["metrics"]
+            print(f"         advance {m['advance_min']}..{m['advance_max']} (mean {m['advance_mean']}) / {entry['units_per_em']} em, "
+                  f"height_max {m['height_max']}, fixed_width={entry['fixed_width']}, tabular_digits={m['tabular_digits']}")
+        if missing:
+            shown = " ".join(f"U+{cp:04X}" for cp in missing[:args.show_missing])
+            more = f" ... (+{len(missing) - args.show_missing})" if len(missing) > args.show_missing else ""
+            print(f"         missing: {shown}{more}")
+
+    for path, entry in results.items():
+        if "error" in entry:
+            print(f"⚠️ {os.path.basename(path)}: {entry['error']}")
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+跨字体自动选型工具
+- 候选 = fonts/ 下每个覆盖字符集的字体 × 轴参数（wdth/wght 网格）× 像素大小 × 描边宽度
+- 对整个字符集做向量化可读性评估：量化后最细笔画宽度、字形区分度、填充率
+- 先用少量探测字符评估并剔除被支配（Pareto dominated）的候选，再对幸存者评估全字符集
+- 评估在进程池中并行执行，字体经共享内存分发给各 worker（font_shm）
+"""
+import numpy as np
+import freetype
+import argparse
+import json
+import os
+
+from osd import render_glyphs_batch
+from font_scan import scan_directory, ranges_to_codepoints
+from font_shm import font_face, font_pool
+from osd_axes import axis_design_coords
+
+# 综合得分权重：笔画、区分度、填充率
+SCORE_WEIGHTS = (0.4, 0.35, 0.25)
+# 区分度达到该值（最小字形差异 / 平均笔画像素数）即视为满分
+DISTINCT_TARGET = 0.5
+PROBE_CHARS = "0183:"
+
+
+def axis_grid(face, tags=("wdth", "wght"), steps=4):
+    """为可变字体生成轴参数网格；非可变字体只有默认实例"""
+    if not face.has_multiple_masters:
+        return [{}]
+    axes = {a.tag: a for a in face.get_variation_info().axes}
+    grid = [{}]
+    for tag in tags:
+        if tag not in axes:
+            continue
+        a = axes[tag]
+        values = sorted({int(round(v)) for v in np.linspace(a.minimum, a.maximum, steps)} | {int(round(a.default))})
+        grid = [dict(g, **{tag: v}) for g in grid for v in values]
+    return grid
+
+
+def _fits(face, chars, px, out_size, outline_width):
+    face.set_pixel_sizes(0, px)
+    for c in chars:
+        face.load_char(c, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_NORMAL)
+        bitmap = face.glyph.bitmap
+        if bitmap.width + 2 * outline_width > out_size[0] or bitmap.rows + 2 * outline_width > out_size[1]:
+            return False
+    return True
+
+
+def fit_pixel_size(face, chars, out_size, outline_width, min_size=5, max_size=256):
+    """二分查找整个字符集都能放入字符格的最大像素大小，放不下返回 None"""
+    if not _fits(face, chars, min_size, out_size, outline_width):
+        return None
+    low, high, best = min_size + 1, min(max_size, out_size[1] * 2), min_size
+    while low <= high:
+        mid = (low + high) // 2
+        if _fits(face, chars, mid, out_size, outline_width):
+            best, low = mid, mid + 1
+        else:
+            high = mid - 1
+    return best
+
+
+def _run_lengths(mask):
+    """(N, h, w) 布尔数组的水平连续段：返回 (字形索引, 段长)"""
+    n, h, w = mask.shape
+    padded = np.zeros((n, h, w + 2), dtype=np.int8)
+    padded[:, :, 1:-1] = mask
+    d = np.diff(padded, axis=2)
+    starts = np.nonzero(d == 1)
+    ends = np.nonzero(d == -1)
+    return starts[0], ends[2] - starts[2]
+
+
+def legibility_metrics(levels):
+    """
+    对 (N, h, w) 的 I4 灰度级数组做整体评估，返回 (最细笔画, 区分度, 填充率)。
+    - 最细笔画：每个字形水平+垂直笔画段长的 25% 分位数，取全字符集最小值
+    - 区分度：任意两字形主体像素的最小汉明距离 / 平均主体像素数
+    - 填充率：非空字形的有效像素（主体+描边）占字符格比例的平均值
+    """
+    n, h, w = levels.shape
+    body = levels == 0xF
+    ink_counts = (levels > 0).reshape(n, -1).sum(axis=1)
+    body_counts = body.reshape(n, -1).sum(axis=1)
+    visible = body_counts > 0
+    if not visible.any():
+        return 0.0, 0.0, 0.0
+
+    g_h, len_h = _run_lengths(body)
+    g_v, len_v = _run_lengths(body.transpose(0, 2, 1))
+    gidx = np.concatenate([g_h, g_v])
+    lengths = np.concatenate([len_h, len_v])
+    order = np.lexsort((lengths, gidx))
+    counts = np.bincount(gidx, minlength=n)
+    offsets = np.cumsum(counts) - counts
+    quartile = lengths[order][(offsets + counts // 4)[visible]]
+    min_stroke = float(quartile.min())
+
+    flat = body[visible].reshape(int(visible.sum()), -1).astype(np.float32)
+    sizes = flat.sum(axis=1)
+    hamming = sizes[:, None] + sizes[None, :] - 2 * (flat @ flat.T)
+    np.fill_diagonal(hamming, np.inf)
+    distinct = float(hamming.min() / sizes.mean()) if len(sizes) > 1 else 1.0
+
+    fill = float((ink_counts[visible] / (w * h)).mean())
+    return min_stroke, distinct, fill
+
+
+def composite_score(metrics, out_size):
+    stroke, distinct, fill = metrics
+    target_stroke = max(1.0, out_size[1] / 16)
+    parts = (min(1.0, stroke / target_stroke), min(1.0, distinct / DISTINCT_TARGET), fill)
+    return sum(wt * p for wt, p in zip(SCORE_WEIGHTS, parts))
+
+
+def dominated(a, b):
+    """b 是否支配 a：各项都不差且至少一项更好"""
+    return all(y >= x for x, y in zip(a, b)) and any(y > x for x, y in zip(a, b))
+
+
+def pareto_front(candidates):
+    return [c for c in candidates if not any(dominated(c["metrics"], o["metrics"]) for o in candidates if o is not c)]
+
+
+def _render_levels(face, chars, out_size, px, outline_width):
+    face.set_pixel_sizes(0, px)
+    return render_glyphs_batch([face] * len(chars), chars, out_size, outline_width)
+
+
+def _open_face(font_path, axes):
+    face = font_face(font_path)
+    if axes:
+        face.set_var_design_coords(axis_design_coords(face, axes))
+    return face
+
+
+def _probe_job(job):
+    """阶段 1：拟合像素大小并用探测字符评估；返回候选列表"""
+    font_path, axes, chars, probe, out_size, outline_widths, size_steps = job
+    candidates = []
+    try:
+        face = _open_face(font_path, axes)
+        for ow in outline_widths:
+            fit = fit_pixel_size(face, chars, out_size, ow)
+            if fit is None:
+                continue
+            for px in range(fit, max(4, fit - size_steps), -1):
+                metrics = legibility_metrics(_render_levels(face, probe, out_size, px, ow))
+                candidates.append({"font": font_path, "axes": axes, "px": px, "outline_width": ow, "metrics": metrics})
+    except Exception as e:
+        print(f"⚠️ {os.path.basename(font_path)} {axes}: {e}")
+    return candidates
+
+
+def _full_job(candidate_and_args):
+    """阶段 2：对全字符集评估"""
+    candidate, chars, out_size = candidate_and_args
+    face = _open_face(candidate["font"], candidate["axes"])
+    metrics = legibility_metrics(_render_levels(face, chars, out_size, candidate["px"], candidate["outline_width"]))
+    return dict(candidate, metrics=metrics, score=composite_score(metrics, out_size))
+
+
+def select_fonts(font_dir, chars, out_size, outline_widths=(1, 2), axis_steps=4, size_steps=2,
+                 keep=16, workers=None, cache_path=None):
+    """返回按综合得分降序排列的候选列表，以及 (候选总数, 全量评估数)"""
+    codepoints = {ord(c) for c in chars}
+    results, _ = scan_directory(font_dir, cache_path=cache_path, workers=workers)
+    fonts = [
+        path for path, entry in results.items()
+        if "error" not in entry and entry["scalable"] and codepoints <= ranges_to_codepoints(entry["coverage"])
+    ]
+    probe = "".join(c for c in PROBE_CHARS if c in chars) or chars[:4]
+
+    jobs = []
+    for path in fonts:
+        face = freetype.Face(path)
+        for axes in axis_grid(face, steps=axis_steps):
+            jobs.append((path, axes, chars, probe, out_size, tuple(outline_widths), size_steps))
+
+    with font_pool(fonts, workers) as pool:
+        stage1 = [c for cs in pool.map(_probe_job, jobs) for c in cs]
+        # 被支配的候选直接剔除；再按探测得分保留前 keep 个作补充
+        front = pareto_front(stage1)
+        ranked = sorted(stage1, key=lambda c: -composite_score(c["metrics"], out_size))
+        survivors = front + [c for c in ranked[:keep] if c not in front]
+        final = list(pool.map(_full_job, [(c, chars, out_size) for c in survivors]))
+    final.sort(key=lambda c: -c["score"])
+    return final, (len(stage1), len(survivors))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="跨字体自动选型：按可读性评分选择字体、轴参数、像素大小与描边宽度")
+    parser.add_argument("--width", type=int, required=True, help="字体位图宽度")
+    parser.add_argument("--height", type=int, required=True, help="字体位图高度")
+    parser.add_argument("--font_dir", type=str, default="fonts", help="候选字体目录")
+    parser.add_argument("--chars", type=str, default="0123456789- :", help="需要生成的字符")
+    parser.add_argument("--outline_widths", type=int, nargs="+", default=[1, 2], help="候选描边宽度")
+    parser.add_argument("--axis_steps", type=int, default=4, help="每个轴的网格点数")
+    parser.add_argument("--size_steps", type=int, default=2, help="在拟合像素大小基础上向下尝试的档数")
+    parser.add_argument("--keep", type=int, default=16, help="阶段 1 除 Pareto 前沿外额外保留的候选数")
+    parser.add_argument("--workers", type=int, default=None, help="并行进程数（默认 CPU 核数）")
+    parser.add_argument("--top", type=int, default=10, help="显示前 N 名")
+    parser.add_argument("--json", type=str, default=None, help="将排名结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    out_size = (args.width, args.height)
+    ranking, (n_probe, n_full) = select_fonts(
+        args.font_dir, args.chars, out_size, args.outline_widths, args.axis_steps, args.size_steps,
+        args.keep, args.workers, cache_path=".font_scan_cache.json"
+    )
+    print(f"🔍 {n_probe} 个候选完成探测评估，{n_full} 个进入全字符集评估")
+    print(f"{'score':>6} {'stroke':>6} {'dist':>5} {'fill':>5}  px  ow  font / axes")
+    for c in ranking[:args.top]:
+        stroke, distinct, fill = c["metrics"]
+        axes = ",".join(f"{k}={v}" for k, v in c["axes"].items()) or "-"
+        print(f"{c['score']:6.3f} {stroke:6.1f} {distinct:5.2f} {fill:5.2f} {c['px']:3d} {c['outline_width']:3d}  {os.path.basename(c['font'])} / {axes}")
+    if ranking:
+        best = ranking[0]
+        print(f"✅ 推荐: {best['font']} axes={best['axes']} font_pixel_size={best['px']} outline_width={best['outline_width']}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(ranking, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+FreeType 位图零拷贝访问
+- freetype-py 的 bitmap.buffer 每次都逐字节构造 Python 列表，且长度按 rows * pitch 计算，
+  直接 reshape(rows, width) 在 pitch != width 时会错位
+- 这里通过 ctypes 把 FT_Bitmap 的内存直接包装为 NumPy 视图，按 pitch 取行，不生成中间列表
+- 视图只在下一次 load_char / 渲染之前有效，调用方需立即拷贝到自己的画布
+"""
+import ctypes
+import numpy as np
+import freetype
+
+_canvases = {}
+
+
+def bitmap_view(bitmap):
+    """返回 FreeType 位图内存的 (rows, abs(pitch)) uint8 视图，按从上到下的行顺序"""
+    ft = bitmap._FT_Bitmap
+    rows, pitch = ft.rows, ft.pitch
+    if rows == 0 or pitch == 0 or not ft.buffer:
+        return np.zeros((rows, abs(pitch)), dtype=np.uint8)
+    view = np.ctypeslib.as_array(ctypes.cast(ft.buffer, ctypes.POINTER(ctypes.c_ubyte)), shape=(rows * abs(pitch),))
+    view = view.reshape(rows, abs(pitch))
+    # pitch 为负时 buffer 从最底行开始
+    return view[::-1] if pitch < 0 else view
+
+
+def bitmap_array(bitmap):
+    """8 位灰度位图的 (rows, width) 视图（不拷贝）"""
+    return bitmap_view(bitmap)[:, :bitmap._FT_Bitmap.width]
+
+
+def bitmap_mask(bitmap, threshold=127):
+    """单色或 8 位灰度位图转换为 (rows, width) 的 bool 数组"""
+    ft = bitmap._FT_Bitmap
+    data = bitmap_view(bitmap)
+    if ft.pixel_mode == freetype.FT_PIXEL_MODE_MONO:
+        return np.unpackbits(data, axis=1)[:, :ft.width].astype(bool)
+    return data[:, :ft.width] > threshold
+
+
+def reuse_canvas(shape):
+    """按尺寸复用的预分配画布，返回前清零；下一次同尺寸调用会覆盖其内容"""
+    canvas = _canvases.get(shape)
+    if canvas is None:
+        canvas = _canvases[shape] = np.zeros(shape, dtype=np.uint8)
+    else:
+        canvas.fill(0)
+    return canvas
@@ -1,39 +1,55 @@
 from PIL import Image, ImageDraw, ImageFont
+from scipy.ndimage import grey_dilation
 import numpy as np
 import argparse
+import time
 
-def render_char_with_outline_i4_preserve_aspect(char, font_path, out_size, font_scale=1.3, outline_width=2):
-    w, h = out_size
-    font_size = int(min(w, h) * font_scale)
-    font = ImageFont.truetype(font_path, font_size)
+OUTLINE_FILL = 0x88
+BODY_FILL = 0xFF
 
-    # 创建大画布（避免字符边缘被裁剪）
-    canvas_size = (w * 4, h * 4)
-    img = Image.new("L", canvas_size, 0)
-    draw = ImageDraw.Draw(img)
 
-    # 获取字符边界
-    bbox = draw.textbbox((0, 0), char, font=font)
-    text_w, text_h = bbox[2] - bbox[0], bbox[3] - bbox[1]
-    text_x, text_y = bbox[0], bbox[1]
+def disk_footprint(outline_width):
+    r = outline_width
+    yy, xx = np.mgrid[-r:r + 1, -r:r + 1]
+    return xx * xx + yy * yy <= r * r
 
-    # 居中位置（根据 bbox 偏移修正）
-    center_x = (canvas_size[0] - text_w) // 2 - text_x
-    center_y = (canvas_size[1] - text_h) // 2 - text_y
 
-    # 描边（灰色）
-    for dx in range(-outline_width, outline_width + 1):
-        for dy in range(-outline_width, outline_width + 1):
-            if dx * dx + dy * dy <= outline_width * outline_width:
-                draw.text((center_x + dx, center_y + dy), char, font=font, fill=0x88)
+def outlined_glyph_image(char, font, outline_width):
+    """
+    只栅格化一次：font.getmask 得到紧凑的抗锯齿蒙版，四周补 outline_width，
+    用圆盘形最大值滤波得到描边，再把主体按蒙版透明度叠加在描边之上。
+    等价于原先在半径内每个偏移各画一次描边文字，返回裁剪到非零区域的 L 图像。
+    """
+    return outline_coverage(glyph_mask(char, font), outline_width)
 
-    # 主体（白色）
-    draw.text((center_x, center_y), char, font=font, fill=0xFF)
 
-    # 剪裁字符区域
-    cropped = img.crop(img.getbbox())
+def glyph_mask(char, font):
+    """font.getmask 的抗锯齿蒙版转为 (h, w) uint8 数组"""
+    core = font.getmask(char, mode="L")
+    gw, gh = core.size
+    if not (gw and gh):
+        return np.zeros((gh, gw), dtype=np.uint8)
+    return np.asarray(core, dtype=np.uint8).reshape(gh, gw)
 
-    # 保持比例缩放，并居中粘贴到目标尺寸图像
+
+def outline_coverage(glyph, outline_width):
+    """对字形蒙版做圆盘最大值滤波描边并叠加主体，返回裁剪到非零区域的 L 图像"""
+    gh, gw = glyph.shape
+    r = outline_width
+    mask = np.zeros((gh + 2 * r, gw + 2 * r), dtype=np.uint8)
+    mask[r:r + gh, r:r + gw] = glyph
+    alpha = mask / 255.0
+    img = np.zeros(mask.shape, dtype=np.float64)
+    if r > 0:
+        img = grey_dilation(mask, footprint=disk_footprint(r)) / 255.0 * OUTLINE_FILL
+    img = img * (1 - alpha) + BODY_FILL * alpha
+    out = Image.fromarray(np.round(img).astype(np.uint8), mode="L")
+    return out.crop(out.getbbox())
+
+
+def fit_to_cell(cropped, out_size):
+    """保持比例最近邻缩放，并居中粘贴到目标尺寸图像"""
+    w, h = out_size
     char_w, char_h = cropped.size
     scale = min(w / char_w, h / char_h)
     new_size = (int(char_w * scale), int(char_h * scale))
@@ -42,6 +58,34 @@ def render_char_with_outline_i4_preserve_aspect(char, font_path, out_size, font_
     final_img = Image.new("L", (w, h), 0)
     offset = ((w - new_size[0]) // 2, (h - new_size[1]) // 2)
     final_img.paste(resized, offset)
+    return final_img
+
+
+def outlined_glyph_image_redraw(char, font, outline_width, canvas_size):
+    """旧实现：在半径内每个偏移各画一次文字作为描边，仅用于 --benchmark 对比"""
+    img = Image.new("L", canvas_size, 0)
+    draw = ImageDraw.Draw(img)
+    bbox = draw.textbbox((0, 0), char, font=font)
+    x = (canvas_size[0] - (bbox[2] - bbox[0])) // 2 - bbox[0]
+    y = (canvas_size[1] - (bbox[3] - bbox[1])) // 2 - bbox[1]
+    for dx in range(-outline_width, outline_width + 1):
+        for dy in range(-outline_width, outline_width + 1):
+            if dx * dx + dy * dy <= outline_width * outline_width:
+                draw.text((x + dx, y + dy), char, font=font, fill=OUTLINE_FILL)
+    draw.text((x, y), char, font=font, fill=BODY_FILL)
+    return img.crop(img.getbbox())
+
+
+def render_char_with_outline_i4_preserve_aspect(char, font_path, out_size, font_scale=1.3, outline_width=2):
+    w, h = out_size
+    font_size = int(min(w, h) * font_scale)
+    font = ImageFont.truetype(font_path, font_size)
+
+    # 描边（灰色）+ 主体（白色），已剪裁到字符区域
+    cropped = outlined_glyph_image(char, font, outline_width)
+
+    # 保持比例缩放，并居中粘贴到目标尺寸图像
+    final_img = fit_to_cell(cropped, out_size)
 
     # 转为 numpy 并量化为 I4（0x0, 0x8, 0xF）
     arr = np.array(final_img)
@@ -70,29 +114,8 @@ def render_char_with_outline_i4(char, font_path, out_size, font_scale=1.3, outli
     font_size = int(min(w, h) * font_scale)
     font = ImageFont.truetype(font_path, font_size)
 
-    # 设定一个稍大的 canvas 来容纳字体并添加描边
-    canvas_size = (w * 2, h * 2)  # 增大背景大小，避免字体边缘被裁剪
-    img = Image.new("L", canvas_size, 0)  # 使用单通道灰度图
-    draw = ImageDraw.Draw(img)
-
-    # 获取文本尺寸
-    bbox = draw.textbbox((0, 0), char, font=font)
-    text_w, text_h = bbox[2] - bbox[0], bbox[3] - bbox[1]
-    x = (canvas_size[0] - text_w) // 2
-    y = (canvas_size[1] - text_h) // 2
-
-    # 描边（灰色，值 0x8）
-    for dx in range(-outline_width, outline_width + 1):
-        for dy in range(-outline_width, outline_width + 1):
-            if dx * dx + dy * dy <= outline_width * outline_width:
-                draw.text((x + dx, y + dy), char, font=font, fill=8 * 17)  # 灰色填充
-
-    # 主体（白色）
-    draw.text((x, y), char, font=font, fill=15 * 17)  # 白色填充
-
-    # 裁剪非零区域
-    bbox = img.getbbox()
-    cropped = img.crop(bbox)
+    # 描边（灰色，值 0x8）+ 主体（白色），已裁剪非零区域
+    cropped = outlined_glyph_image(char, font, outline_width)
 
     # 缩放到目标大小
     resized = cropped.resize((w, h), Image.Resampling.LANCZOS)
@@ -157,6 +180,29 @@ def export_chars_white_gray_i4_header(chars, font_path, out_size, outline_width=
     print(f"✅ I4 header saved: {header_filename}")
 
 
+def benchmark_outline(chars, font_path, out_size, outline_widths=(1, 2, 4, 6, 8), font_scale=1.3, repeat=3):
+    """对比单次栅格化 + 最大值滤波与逐偏移重绘的描边耗时，并统计两者结果差异"""
+    w, h = out_size
+    font = ImageFont.truetype(font_path, int(min(w, h) * font_scale))
+    print(f"{'r':>3} {'draws':>6} {'redraw ms':>10} {'mask ms':>8} {'speedup':>8} {'max diff':>9}")
+    for r in outline_widths:
+        draws = int(disk_footprint(r).sum()) + 1
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            old = [outlined_glyph_image_redraw(c, font, r, (w * 4, h * 4)) for c in chars]
+        t1 = time.perf_counter()
+        for _ in range(repeat):
+            new = [outlined_glyph_image(c, font, r) for c in chars]
+        t2 = time.perf_counter()
+        # 两种实现的抗锯齿叠加略有差别，统计同尺寸字形的最大像素差
+        diffs = [
+            int(np.abs(np.asarray(a, dtype=np.int16) - np.asarray(b, dtype=np.int16)).max())
+            for a, b in zip(old, new) if a.size == b.size
+        ]
+        old_ms, new_ms = (t1 - t0) * 1000 / repeat, (t2 - t1) * 1000 / repeat
+        print(f"{r:3d} {draws:6d} {old_ms:10.1f} {new_ms:8.1f} {old_ms / new_ms:7.1f}x {max(diffs) if diffs else '-':>9}")
+
+
 # 示例调用
 if __name__ == "__main__":
     # 使用 argparse 处理命令行参数
@@ -171,9 +217,16 @@ if __name__ == "__main__":
         '--font', type=str, required=True, help='Path to the font file (e.g., Roboto-Light.ttf)'
     )
 
+    parser.add_argument(
+        '--benchmark', type=int, default=0, choices=[0, 1], help='Compare outline speed against the per-offset redraw path'
+    )
+
     args = parser.parse_args()
     out_size = (args.width, args.height)
     font_path = args.font
+    if args.benchmark:
+        benchmark_outline("0123456789- :", font_path, out_size)
+        exit(0)
     export_chars_white_gray_i4_header(
         chars="0123456789- :",
         font_path=font_path,  # 替换为你自己的字体
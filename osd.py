@@ -14,35 +14,29 @@ import freetype
 import argparse
 import os
 
+from osd_atlas import build_atlas, atlas_cell, atlas_header_lines
+from bitmap_font import is_bitmap_font, render_bitmap_font_canvases
+from ft_bitmap import bitmap_array, reuse_canvas
+from osd_blit import supports as blit_supports, write_blit_header
+from osd_formats import FORMATS, distinct_levels, choose_format, build_palette, encode_glyph, decode_glyph, format_header_lines
+from osd_dedup import DEDUP_MODES, dedup_arrays, row_dict_header_lines, dedup_sizes
+from osd_search_cache import cached_search
+from osd_axes import AXIS_SEARCH_METHODS, DEFAULT_SEARCH_AXES, apply_var_coords, var_coords_key, var_coords_suffix, optimize_var_coords
+from osd_pixfmt import PIXEL_FORMATS, DEFAULT_BODY_COLOR, DEFAULT_OUTLINE_COLOR, pixel_format_description, pixel_format_header_lines
+
 def get_small_size_var_coords(w, h):
     # 针对小尺寸，优先选用最细最窄
     if w <= 10 or h <= 20:
-        return [70, 300]
+        return {"wdth": 70, "wght": 300}
     elif w <= 16 or h <= 32:
-        return [85, 400]
+        return {"wdth": 85, "wght": 400}
     return None
 
 def find_best_var_coords(font_path, canvas_size, outline_width, font_pixel_size, test_char='0',
-                         wdth_range=(50, 150), wght_range=(200, 900), wdth_step=5, wght_step=50):
-    face = freetype.Face(font_path)
-    results = []
-    for wdth in range(wdth_range[0], wdth_range[1]+1, wdth_step):
-        for wght in range(wght_range[0], wght_range[1]+1, wght_step):
-            try:
-                face.set_var_design_coords([float(wdth), float(wght)])
-                face.set_pixel_sizes(0, font_pixel_size)
-                face.load_char(test_char, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_NORMAL)
-                glyph = face.glyph
-                width = glyph.bitmap.width + 2 * outline_width
-                height = glyph.bitmap.rows + 2 * outline_width
-                if width <= canvas_size[0] and height <= canvas_size[1]:
-                    results.append(([float(wdth), float(wght)], width*height))
-            except Exception:
-                continue
-    if results:
-        # 面积最大优先
-        return sorted(results, key=lambda x: -x[1])[0][0]
-    return None
+                         tags=DEFAULT_SEARCH_AXES, method="descent", stats=None):
+    """在 tags 指定的轴上搜索放得下且位图面积最大的坐标，返回 {轴标签: 坐标} 或 None（见 osd_axes）"""
+    return optimize_var_coords(font_path, canvas_size, outline_width, font_pixel_size, tags=tags, method=method,
+                               test_char=test_char, stats=stats)
 
 
 def quantize(val):
@@ -61,20 +55,67 @@ def safe_char_name(c):
         return c
     return "u{:04X}".format(ord(c))
 
-def find_max_font_size(font_path, canvas_size, outline_width, var_coords=None, min_size=5, max_size=256, test_char='0'):
+_cmap_coverage_cache = {}
+
+def get_cmap_coverage(font_path):
+    """读取一次字体 cmap，返回其覆盖的码位集合（按路径缓存）"""
+    coverage = _cmap_coverage_cache.get(font_path)
+    if coverage is None:
+        face = freetype.Face(font_path)
+        coverage = frozenset(code for code, _ in face.get_chars())
+        _cmap_coverage_cache[font_path] = coverage
+    return coverage
+
+def select_glyph_fonts(chars, font_paths):
+    """
+    按回退顺序为每个字符选择第一个覆盖它的字体。
+    先合并各字体 cmap 为 码位->字体 索引，每个字符 O(1) 查找；
+    所有字体都不覆盖时退回主字体（渲染 .notdef）并给出提示。
+    """
+    index = {}
+    for path in reversed(font_paths):
+        index.update(dict.fromkeys(get_cmap_coverage(path), path))
+    selected = []
+    for c in chars:
+        path = index.get(ord(c))
+        if path is None:
+            print(f"⚠️ 字符 {c!r} (U+{ord(c):04X}) 不在任何字体中，将渲染 .notdef")
+            path = font_paths[0]
+        selected.append(path)
+    return selected
+
+def find_max_font_size(font_path, canvas_size, outline_width, var_coords=None, min_size=5, max_size=256, test_char='0',
+                       measured=None, stats=None):
+    """
+    在 [min_size, max_size] 上二分查找能放入字符格的最大像素大小。
+    测试字符的位图尺寸与字符格无关：measured 为同一字体的共享记录（例如监视模式中同一字体的各尺寸），
+    按 (轴参数, 测试字符, 像素大小) 保存位图尺寸，已测过的像素大小不再渲染；二分路径不变，结果与不共享时完全一致。
+    stats 不为 None 时把探测渲染次数累加到 stats["probes"]
+    """
     face = freetype.Face(font_path)
+    measured = {} if measured is None else measured
+    coords_key = var_coords_key(var_coords)
+    def measure(font_pixel_size):
+        # 返回 (位图宽, 位图高)，渲染失败为 None
+        key = (coords_key, test_char, font_pixel_size)
+        if key not in measured:
+            if stats is not None:
+                stats["probes"] = stats.get("probes", 0) + 1
+            try:
+                apply_var_coords(face, var_coords)
+                face.set_pixel_sizes(0, font_pixel_size)
+                face.load_char(test_char, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_NORMAL)
+                measured[key] = (face.glyph.bitmap.width, face.glyph.bitmap.rows)
+            except Exception:
+                measured[key] = None
+        return measured[key]
     def check_font_size_fit(font_pixel_size):
-        try:
-            if var_coords is not None:
-                face.set_var_design_coords(var_coords)
-            face.set_pixel_sizes(0, font_pixel_size)
-            face.load_char(test_char, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_NORMAL)
-            glyph = face.glyph
-            width = glyph.bitmap.width + 2 * outline_width
-            height = glyph.bitmap.rows + 2 * outline_width
-            return width <= canvas_size[0] and height <= canvas_size[1]
-        except Exception:
+        size = measure(font_pixel_size)
+        if size is None:
             return False
+        width = size[0] + 2 * outline_width
+        height = size[1] + 2 * outline_width
+        return width <= canvas_size[0] and height <= canvas_size[1]
     low = min_size
     high = max_size
     best = min_size
@@ -92,35 +133,13 @@ def simple_dilate_no_wrap(mask, width):
     structure = np.ones((width * 2 + 1, width * 2 + 1), dtype=bool)
     return binary_dilation(mask, structure=structure)
 
-def render_char_precise_position_with_clean_outline(
-    char,
-    font_path,
-    out_size,
-    font_pixel_size=None,
-    outline_width=1,
-    var_coords=None
-):
+def glyph_placement(char, glyph, out_size):
+    """计算字形位图在 out_size 画布中的左上角偏移 (offset_x, offset_y)"""
     w, h = out_size
-    canvas = np.zeros((h, w), dtype=np.uint8)
-
-    face = freetype.Face(font_path)
-    if var_coords is not None:
-        try:
-            face.set_var_design_coords(var_coords)
-        except Exception as e:
-            print(f"⚠️ 设置变量字体轴值失败: {e}")
-
-    face.set_pixel_sizes(0, font_pixel_size)
-    face.load_char(char, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_NORMAL)
-    glyph = face.glyph
-    bitmap = glyph.bitmap
-
-    bitmap_w, bitmap_h = bitmap.width, bitmap.rows
+    bitmap_w, bitmap_h = glyph.bitmap.width, glyph.bitmap.rows
     bitmap_left = glyph.bitmap_left
     bitmap_top = glyph.bitmap_top
 
-    arr = np.array(bitmap.buffer, dtype=np.uint8).reshape(bitmap_h, bitmap_w)
-
     # 字形 advance.x 单位为 1/64 像素，转换为像素单位
     advance_px = glyph.advance.x / 64
 
@@ -147,74 +166,402 @@ def render_char_precise_position_with_clean_outline(
         offset_y = int(round(canvas_center_y - glyph_center_y))
         offset_y = max(0, min(offset_y, h - bitmap_h))
 
-    # 将字形灰度拷贝到画布
-    canvas[offset_y:offset_y + bitmap_h, offset_x:offset_x + bitmap_w] = arr
+    return offset_x, offset_y
 
-    # 生成 mask 与描边
-    mask = canvas > 10
-    if outline_width > 0:
-        dilated = simple_dilate_no_wrap(mask, outline_width)
-    else:
-        dilated = mask.copy()
-    outline_mask = np.logical_and(dilated, np.logical_not(mask))
+def render_char_i4_levels(
+    char,
+    font_path,
+    out_size,
+    font_pixel_size=None,
+    outline_width=1,
+    var_coords=None
+):
+    """渲染单个字符并量化，返回 (h, w) 的 I4 灰度级数组（未打包）"""
+    face = open_face(font_path, font_pixel_size, var_coords)
+    return render_glyph_levels(face, char, out_size, outline_width)
 
-    result = np.zeros_like(canvas, dtype=np.uint8)
-    result[outline_mask] = 136  # 灰色描边
-    result[mask] = 255          # 白色字体
+def open_face(font_path, font_pixel_size, var_coords=None):
+    """打开字体并设置轴值与像素大小"""
+    face = freetype.Face(font_path)
+    try:
+        apply_var_coords(face, var_coords)
+    except Exception as e:
+        print(f"⚠️ 设置变量字体轴值失败: {e}")
 
-    # 量化为 4-bit (I4)
-    def quantize(val):
-        return 0xF if val >= 200 else 0x8 if val >= 100 else 0x0
+    face.set_pixel_sizes(0, font_pixel_size)
+    return face
 
-    flat = result.flatten()
-    quantized = np.array([quantize(p) for p in flat], dtype=np.uint8)
-    if len(quantized) % 2 != 0:
-        quantized = np.append(quantized, 0)
+def render_glyph_levels(face, char, out_size, outline_width=1):
+    """用已设置好轴值与像素大小的 face 渲染单个字符，返回 (h, w) 的 I4 灰度级数组"""
+    w, h = out_size
+    # 复用同尺寸画布；outline_and_quantize 返回新数组，不引用画布
+    canvas = reuse_canvas((h, w))
+    place_glyph(face, char, out_size, canvas)
+    return outline_and_quantize(canvas, outline_width)
+
+def render_glyphs_batch(faces, chars, out_size, outline_width=1):
+    """
+    faces[i] 渲染 chars[i]：逐字符只做定位拷贝，所有字符格叠成 (N, h, w) 后
+    一次完成描边与量化，返回 (N, h, w) 的 I4 灰度级数组
+    """
+    w, h = out_size
+    canvases = np.zeros((len(chars), h, w), dtype=np.uint8)
+    for face, c, canvas in zip(faces, chars, canvases):
+        place_glyph(face, c, out_size, canvas)
+    return outline_and_quantize_batch(canvases, outline_width)
+
+def fit_placement(char, glyph, out_size):
+    """
+    glyph_placement 加上超出字符格时的处理，返回 (offset_x, offset_y, crop_x, crop_y)：
+    位图从 (crop_x, crop_y) 起的部分放在字符格的 (offset_x, offset_y)
+    """
+    w, h = out_size
+    bitmap_w, bitmap_h = glyph.bitmap.width, glyph.bitmap.rows
+    offset_x, offset_y = glyph_placement(char, glyph, out_size)
+    crop_x = crop_y = 0
+    # 字形超出画布（常见于回退字体的宽字符）时居中裁剪，避免越界
+    if bitmap_w > w or bitmap_h > h:
+        crop_x = max(0, (bitmap_w - w) // 2)
+        crop_y = max(0, (bitmap_h - h) // 2)
+        offset_x = min(max(0, offset_x), w - min(bitmap_w - crop_x, w))
+        offset_y = min(max(0, offset_y), h - min(bitmap_h - crop_y, h))
+    return offset_x, offset_y, crop_x, crop_y
+
+def place_glyph(face, char, out_size, canvas):
+    """渲染字符并把位图定位拷贝到已清零的 (h, w) 画布"""
+    w, h = out_size
 
-    packed = [(quantized[i] << 4) | quantized[i + 1] for i in range(0, len(quantized), 2)]
-    return packed
+    face.load_char(char, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_NORMAL)
+    glyph = face.glyph
+    bitmap = glyph.bitmap
 
-def export_chars_black_white_gray_i4_header(chars, font_path, out_size, outline_width=1, font_pixel_size=None, var_coords=None):
+    bitmap_w, bitmap_h = bitmap.width, bitmap.rows
+
+    # 直接引用 FreeType 位图内存，只在拷贝到画布时复制一次
+    arr = bitmap_array(bitmap)
+
+    offset_x, offset_y, crop_x, crop_y = fit_placement(char, glyph, out_size)
+    if bitmap_w > w or bitmap_h > h:
+        print(f"⚠️ 字符 {char!r} 位图 {bitmap_w}x{bitmap_h} 超出 {w}x{h}，已裁剪")
+        arr = arr[crop_y:crop_y + h, crop_x:crop_x + w]
+        bitmap_h, bitmap_w = arr.shape
+
+    # 将字形灰度拷贝到画布
+    canvas[offset_y:offset_y + bitmap_h, offset_x:offset_x + bitmap_w] = arr
+
+def outline_and_quantize(canvas, outline_width=1):
+    """对已定位的 (h, w) 灰度画布做描边与 I4 量化，返回灰度级数组"""
+    return outline_and_quantize_batch(canvas[np.newaxis], outline_width)[0]
+
+def outline_and_quantize_batch(canvases, outline_width=1):
+    """
+    对 (N, h, w) 灰度画布整体描边与量化：主体(>10) -> 0xF，描边 -> 0x8（灰色 136 量化结果），其余 0x0。
+    膨胀结构元在 N 方向厚度为 1，各字符格之间互不影响，结果与逐字符处理一致
+    """
+    mask = canvases > 10
+    if outline_width > 0:
+        structure = np.ones((1, outline_width * 2 + 1, outline_width * 2 + 1), dtype=bool)
+        dilated = binary_dilation(mask, structure=structure)
+    else:
+        dilated = mask
+    levels = np.zeros(canvases.shape, dtype=np.uint8)
+    levels[dilated] = 0x8
+    levels[mask] = 0xF
+    return levels
+
+def pack_i4(levels):
+    # 每字节两个像素，高 4 位在前
+    return pack_i4_batch(levels[np.newaxis])[0]
+
+def pack_i4_batch(cells):
+    """(N, h, w) 灰度级整体打包为连续的 (N, ceil(h*w/2)) 缓冲，每个字符格内部连续打包（奇数像素时末尾补 0）"""
+    flat = np.asarray(cells, dtype=np.uint8).reshape(len(cells), -1)
+    if flat.shape[1] % 2:
+        flat = np.pad(flat, ((0, 0), (0, 1)))
+    return (flat[:, 0::2] << 4) | flat[:, 1::2]
+
+def unpack_i4(packed, w, h):
+    pixels = np.zeros(h * w, dtype=np.uint8)
+    for i, val in enumerate(packed):
+        pixels[i * 2] = (val >> 4) & 0xF
+        if i * 2 + 1 < pixels.size:
+            pixels[i * 2 + 1] = val & 0xF
+    return pixels.reshape((h, w))
+
+def render_char_precise_position_with_clean_outline(
+    char,
+    font_path,
+    out_size,
+    font_pixel_size=None,
+    outline_width=1,
+    var_coords=None
+):
+    levels = render_char_i4_levels(char, font_path, out_size, font_pixel_size=font_pixel_size,
+                                   outline_width=outline_width, var_coords=var_coords)
+    return pack_i4(levels)
+
+def collect_glyph_metrics(chars, font_path, out_size, font_pixel_size, var_coords=None, glyph_fonts=None):
+    """
+    记录每个字符的 advance、bearing 以及字符集内的字距调整对（像素单位），
+    供设备端按比例排版。origin_x 为笔位原点在字符格中的横坐标。
+    glyph_fonts 给出每个字符实际使用的字体（回退链），字距只在同一字体内计算。
+    """
+    glyph_fonts = glyph_fonts or [font_path] * len(chars)
+    faces = {}
+    for path in glyph_fonts:
+        if path in faces:
+            continue
+        face = freetype.Face(path)
+        if path == font_path:
+            try:
+                apply_var_coords(face, var_coords)
+            except Exception as e:
+                print(f"⚠️ 设置变量字体轴值失败: {e}")
+        face.set_pixel_sizes(0, font_pixel_size)
+        faces[path] = face
+
+    metrics = []
+    for c, path in zip(chars, glyph_fonts):
+        face = faces[path]
+        face.load_char(c, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_NORMAL)
+        glyph = face.glyph
+        # 与 place_glyph 相同的定位：超宽字形被居中裁剪时，字符格第 offset_x 列对应位图第 crop_x 列
+        offset_x, _, crop_x, _ = fit_placement(c, glyph, out_size)
+        metrics.append({
+            "advance": int(round(glyph.advance.x / 64)),
+            "bearing_x": glyph.bitmap_left,
+            "bearing_y": glyph.bitmap_top,
+            "origin_x": offset_x - crop_x - glyph.bitmap_left,
+        })
+
+    kerning = []
+    for i, left in enumerate(chars):
+        face = faces[glyph_fonts[i]]
+        if not face.has_kerning:
+            continue
+        for j, right in enumerate(chars):
+            if glyph_fonts[j] != glyph_fonts[i]:
+                continue
+            kern = int(round(face.get_kerning(left, right).x / 64))
+            if kern != 0:
+                kerning.append((i, j, kern))
+    return metrics, kerning
+
+def _c_int_type(values):
+    # 选择能容纳全部数值的最小有符号类型
+    if all(-128 <= v <= 127 for v in values):
+        return "int8_t"
+    return "int16_t"
+
+def glyph_metrics_lines(table_name, metrics, kerning, font_pixel_size, outline_width):
+    lines = [
+        f"// Proportional layout metrics in pixels at font_pixel_size={font_pixel_size} (outline_width={outline_width} not included).",
+        "// Draw cell at (pen_x - origin_x), then advance pen_x by advance + kerning.",
+    ]
+    for key in ("advance", "bearing_x", "bearing_y", "origin_x"):
+        values = [m[key] for m in metrics]
+        lines.append(f"static const {_c_int_type(values)} {table_name}_{key}[{len(values)}] = {{ {', '.join(str(v) for v in values)} }};")
+    lines.append(f"#define {table_name.upper()}_KERNING_COUNT {len(kerning)}")
+    if kerning:
+        # { 左字符索引, 右字符索引, 调整像素 }
+        values = [v for pair in kerning for v in pair]
+        lines.append(f"static const {_c_int_type(values)} {table_name}_kerning[{len(kerning)}][3] = {{")
+        for i, j, kern in kerning:
+            lines.append(f"    {{ {i}, {j}, {kern} }},")
+        lines.append("};")
+    lines.append("")
+    return lines
+
+def split_c_source(lines, header_name, types_header=None):
+    """
+    把单头文件内容拆分为 (.h 行, .c 行)：
+    static const 定义移入 .c（去掉 static，全局只存一份），.h 中改为 extern 声明；
+    宏、注释等其余内容保留在 .h。
+    """
+    h_lines, c_lines = [], []
+    if types_header:
+        c_lines.append(f'#include "{types_header}"')
+    c_lines.extend([f'#include "{header_name}"', ""])
+    definition = None
+    for line in lines:
+        if definition is not None:
+            c_lines.append(line)
+            if line.startswith("};"):
+                definition = None
+            continue
+        if line.startswith("static const ") and " = {" in line:
+            decl = line[len("static "):line.index(" = {")]
+            h_lines.append(f"extern {decl};")
+            c_lines.append(line[len("static "):])
+            if not line.rstrip().endswith("};"):
+                definition = decl
+            continue
+        h_lines.append(line)
+    if types_header:
+        # 让 .h 自身可独立包含：类型定义头文件放在 stdint.h 之后
+        h_lines.insert(h_lines.index("#include <stdint.h>") + 1, f'#include "{types_header}"')
+    return h_lines, c_lines
+
+def export_chars_black_white_gray_i4_header(chars, font_path, out_size, outline_width=1, font_pixel_size=None, var_coords=None, emit_metrics=False, atlas_align=None, out_format="i4", fallback_fonts=None, cells=None, out_dir=None, split_c=False, types_header=None, emit_blit=False, body_color=DEFAULT_BODY_COLOR, outline_color=DEFAULT_OUTLINE_COLOR, dedup="none"):
+    """
+    导出字体头文件，返回写入数据还原出的字符格（用于预览）。
+    atlas_align 不为 None 时输出单张 I4 图集 + 矩形表；
+    out_format 可选 i4 / i2 / i1m / i1，auto 按实际灰度级数自动选择；
+    也可为设备叠加层像素格式（argb1555 / argb4444 / argb8888 / ayuv / clut8），
+    按 body_color / outline_color（ARGB8888）在生成阶段一次性转换，设备端直接 memcpy / DMA；
+    fallback_fonts 为回退字体列表，主字体缺字时依次查找。
+    点阵字体（BDF / 内嵌 strike）不缩放，直接定位后进入描边与量化；
+    cells 不为 None 时直接写出这些预先生成的字符格（例如由 SDF 派生）；
+    out_dir 不为 None 时头文件写入该目录，否则写入当前目录；
+    split_c 为 True 时数据写入同名 .c 文件，.h 只保留 extern 声明与宏，
+    types_header 为声明 bitmap_*_t 等类型的头文件名（split_c 时必填，否则 .c 无法编译）；
+    emit_blit 为 True 时同时输出该尺寸与格式专用的 C 绘制函数（font_blit_*.h）；
+    dedup 为 glyph 时合并内容相同的字模数组，rows 时（仅逐字符 I4）改用共享行字典 + 行索引。
+    """
     w, h = out_size
+    bitmap_font = cells is None and is_bitmap_font(font_path)
 
-    if font_pixel_size is None:
+    if font_pixel_size is None and not bitmap_font and cells is None:
         print("🔍 Searching max font pixel size to fit canvas and outline...")
         font_pixel_size = find_max_font_size(font_path, out_size, outline_width, var_coords=var_coords)
         print(f"✅ Max font_pixel_size found: {font_pixel_size}")
 
-    var_suffix = ""
+    if cells is not None:
+        font_paths = [font_path]
+        glyph_fonts = [font_path] * len(chars)
+    elif bitmap_font:
+        canvases, bitmap_info = render_bitmap_font_canvases(chars, font_path, out_size)
+        cells = list(outline_and_quantize_batch(np.stack(canvases), outline_width))
+        print(f"🔲 点阵字体直接导入: {bitmap_info}")
+        if fallback_fonts:
+            print("⚠️ 点阵字体暂不支持回退字体链，已忽略 --fallback_fonts")
+            fallback_fonts = None
+        if emit_metrics:
+            print("⚠️ 点阵字体暂不输出比例排版度量，已忽略 --emit_metrics")
+            emit_metrics = False
+        font_paths = [font_path]
+        glyph_fonts = [font_path] * len(chars)
+    else:
+        font_paths = [font_path] + list(fallback_fonts or [])
+        glyph_fonts = select_glyph_fonts(chars, font_paths)
+        # 轴参数针对主字体调优，回退字体使用默认实例；每个字体只打开一次
+        faces = {gf: open_face(gf, font_pixel_size, var_coords if gf == font_path else None) for gf in dict.fromkeys(glyph_fonts)}
+        cells = list(render_glyphs_batch([faces[gf] for gf in glyph_fonts], chars, out_size, outline_width))
+    levels = distinct_levels(cells)
+    if out_format == "auto":
+        out_format = choose_format(levels)
+        print(f"🎨 灰度级 {[hex(v) for v in levels]} -> 输出格式 {out_format}")
+    elif out_format == "i1" and len(levels) > 2:
+        print(f"⚠️ i1 只能保存两级灰度，{len(levels)} 级灰度将合并为 0x{max(levels):X}")
+    elif out_format == "i2" and len([v for v in levels if v != 0]) > 3:
+        print(f"⚠️ i2 调色板最多 4 级灰度（含透明），{len(levels)} 级灰度改用 i4")
+        out_format = "i4"
+    if atlas_align is not None and out_format != "i4":
+        print(f"⚠️ 图集仅支持 I4，忽略输出格式 {out_format}")
+        out_format = "i4"
+    if dedup == "rows" and (atlas_align is not None or out_format != "i4"):
+        print("⚠️ 行字典仅支持逐字符 I4，改为字形级去重")
+        dedup = "glyph"
 
-    header_filename = f"font_chars_i4_{w}x{h}{var_suffix}.h"
+    var_suffix = ""
+    fmt_upper = out_format.upper()
+
+    header_filename = f"font_chars_{out_format}_{w}x{h}{var_suffix}.h"
+    if out_dir is not None:
+        header_filename = os.path.join(out_dir, header_filename)
+    if out_format in PIXEL_FORMATS:
+        description = pixel_format_description(out_format, out_size)
+    elif out_format == "i4":
+        description = f"// I4 Font: white(0xF), gray(0xA/0x6), black/transparent(0x0). Size {w}x{h}, 2 pixels per byte."
+    elif out_format == "i2":
+        description = f"// I2 Font: 2bpp palette indices, see i2_{w}x{h}_palette. Size {w}x{h}, 4 pixels per byte, rows byte-aligned."
+    elif out_format == "i1m":
+        description = f"// I1 Font + mask: 1bpp body(0xF) plane and 1bpp outline(0x8) plane. Size {w}x{h}, rows byte-aligned."
+    else:
+        description = f"// I1 Font: 1bpp, set bits use I1_{w}x{h}_ON_LEVEL. Size {w}x{h}, rows byte-aligned."
     lines = [
-        f"#ifndef FONT_I4_BLACK_WHITE_GRAY_{w}x{h}{var_suffix}_H",
-        f"#define FONT_I4_BLACK_WHITE_GRAY_{w}x{h}{var_suffix}_H",
+        f"#ifndef FONT_{fmt_upper}_BLACK_WHITE_GRAY_{w}x{h}{var_suffix}_H",
+        f"#define FONT_{fmt_upper}_BLACK_WHITE_GRAY_{w}x{h}{var_suffix}_H",
         "",
         "#include <stdint.h>",
         "",
-        f"// I4 Font: white(0xF), gray(0xA/0x6), black/transparent(0x0). Size {w}x{h}, 2 pixels per byte.",
-        f"// font_pixel_size={font_pixel_size}, outline_width={outline_width}, var_coords={var_coords}",
+        description,
+        f"// font_pixel_size={font_pixel_size}, outline_width={outline_width}, var_coords={var_coords}"
+        if not bitmap_font else f"// bitmap font {os.path.basename(font_path)} ({bitmap_info}), outline_width={outline_width}",
         "",
     ]
-    array_entries = []
-    for c in chars:
-        arr = render_char_precise_position_with_clean_outline(c, font_path, out_size, font_pixel_size=font_pixel_size, outline_width=outline_width, var_coords=var_coords)
-        name = f"char_{safe_char_name(c)}_{w}x{h}_i4{var_suffix}"
-        array_entries.append(f"    {{ .width = {w}, .height = {h}, .pdata = {name} }},")
-        lines.append(f"static const uint8_t {name}[{len(arr)}] = {{")
-        for i in range(0, len(arr), w // 2):
-            line = ", ".join(f"0x{val:02X}" for val in arr[i : i + w // 2])
-            lines.append("    " + line + ",")
-        lines.append("};\n")
-    lines.append(f"static const bitmap_i4_t i4_{w}x{h}{var_suffix}[{len(chars)}] = {{")
-    lines.extend(array_entries)
-    lines.append("};")
-    lines.append("")
-    lines.append(f"#endif // FONT_I4_BLACK_WHITE_GRAY_{w}x{h}{var_suffix}_H")
+    if atlas_align is not None:
+        atlas, rects = build_atlas(cells, stride_align=atlas_align)
+        lines.extend(atlas_header_lines(f"i4_{w}x{h}{var_suffix}", chars, atlas, rects, pack_i4(atlas)))
+        cells = [atlas_cell(atlas, rect, out_size) for rect in rects]
+        print(f"🧩 Atlas {atlas.shape[1]}x{atlas.shape[0]}: {atlas.size // 2} bytes (cells: {len(chars) * w * h // 2} bytes)")
+    elif out_format == "i4" and dedup == "rows":
+        lines.extend(row_dict_header_lines(f"i4_{w}x{h}{var_suffix}", chars, cells, safe_char_name))
+        data, table = dedup_sizes(cells)["i4_rows"]
+        print(f"📦 i4 row dictionary: {data + table} bytes (i4: {len(chars) * ((w * h + 1) // 2 + 12)} bytes)")
+    elif out_format == "i4":
+        array_entries = []
+        for c, arr in zip(chars, pack_i4_batch(np.stack(cells))):
+            name = f"char_{safe_char_name(c)}_{w}x{h}_i4{var_suffix}"
+            array_entries.append(f"    {{ .width = {w}, .height = {h}, .pdata = {name} }},")
+            lines.append(f"static const uint8_t {name}[{len(arr)}] = {{")
+            for i in range(0, len(arr), w // 2):
+                line = ", ".join(f"0x{val:02X}" for val in arr[i : i + w // 2])
+                lines.append("    " + line + ",")
+            lines.append("};\n")
+        lines.append(f"static const bitmap_i4_t i4_{w}x{h}{var_suffix}[{len(chars)}] = {{")
+        lines.extend(array_entries)
+        lines.append("};")
+        lines.append("")
+    elif out_format in PIXEL_FORMATS:
+        pixel_lines, total = pixel_format_header_lines(chars, cells, out_format, out_size, safe_char_name, body_color, outline_color)
+        lines.extend(pixel_lines)
+        print(f"📦 {out_format}: {total} bytes (i4: {len(chars) * w * h // 2} bytes)")
+    else:
+        palette = build_palette(levels) if out_format == "i2" else None
+        on_level = max(levels) if levels else 0xF
+        lines.extend(format_header_lines(chars, cells, out_format, out_size, safe_char_name, palette=palette, on_level=on_level))
+        # 预览使用解码后的数据，确保所见即所得
+        encoded = [encode_glyph(cell, out_format, palette) for cell in cells]
+        cells = [decode_glyph(planes, out_format, w, h, palette=palette, on_level=on_level) for planes in encoded]
+        total = sum(len(data) for planes in encoded for data in planes)
+        print(f"📦 {out_format}: {total} bytes (i4: {len(chars) * w * h // 2} bytes)")
+    if fallback_fonts:
+        lines.append("// Glyph source fonts: " + ", ".join(f"[{i}] {os.path.basename(p)}" for i, p in enumerate(font_paths)))
+        font_index = [font_paths.index(gf) for gf in glyph_fonts]
+        lines.append(f"static const uint8_t {out_format}_{w}x{h}{var_suffix}_font_index[{len(chars)}] = {{ {', '.join(str(i) for i in font_index)} }};")
+        lines.append("")
+    if emit_metrics:
+        metrics, kerning = collect_glyph_metrics(chars, font_path, out_size, font_pixel_size, var_coords=var_coords, glyph_fonts=glyph_fonts)
+        lines.extend(glyph_metrics_lines(f"{out_format}_{w}x{h}{var_suffix}", metrics, kerning, font_pixel_size, outline_width))
+    if dedup != "none":
+        lines, saved = dedup_arrays(lines)
+        print(f"♻️ 去重: 合并相同字模数组节省 {saved} bytes")
+    lines.append(f"#endif // FONT_{fmt_upper}_BLACK_WHITE_GRAY_{w}x{h}{var_suffix}_H")
+    if split_c:
+        lines, c_lines = split_c_source(lines, os.path.basename(header_filename), types_header)
+        source_filename = os.path.splitext(header_filename)[0] + ".c"
+        with open(source_filename, "w", encoding="utf-8") as f:
+            f.write("\n".join(c_lines) + "\n")
+        print(f"✅ {fmt_upper} source saved: {source_filename}")
     with open(header_filename, "w", encoding="utf-8") as f:
         f.write("\n".join(lines))
-    print(f"✅ I4 header saved: {header_filename}")
+    print(f"✅ {fmt_upper} header saved: {header_filename}")
+    if emit_blit:
+        if atlas_align is not None:
+            print("⚠️ 图集模式暂不生成专用绘制函数，已忽略 --emit_blit")
+        elif dedup == "rows":
+            print("⚠️ 行字典模式请使用生成的 _row() / _unpack() 访问函数，已忽略 --emit_blit")
+        elif out_format in PIXEL_FORMATS:
+            print(f"⚠️ {out_format} 数据已是设备像素格式，直接 memcpy / DMA 即可，已忽略 --emit_blit")
+        elif not blit_supports(out_format, out_size):
+            print(f"⚠️ {out_format} {w}x{h} 不支持专用绘制函数（奇数宽度 I4 数据不按行对齐）")
+        else:
+            blit_filename = write_blit_header(out_format, out_size, out_dir)
+            print(f"✅ Blit functions saved: {blit_filename}")
+    return cells
 
-def generate_preview_image(chars, font_path, out_size, outline_width, font_pixel_size, save_path, var_coords=None):
+def generate_preview_image(chars, font_path, out_size, outline_width, font_pixel_size, save_path, var_coords=None, cells=None, fallback_fonts=None):
     w, h = out_size
     margin = 4
     cols = 16
@@ -224,20 +571,20 @@ def generate_preview_image(chars, font_path, out_size, outline_width, font_pixel
 
     img = Image.new("RGBA", (preview_w, preview_h), (30, 30, 30, 255))
     draw = ImageDraw.Draw(img)
+    if cells is None:
+        glyph_fonts = select_glyph_fonts(chars, [font_path] + list(fallback_fonts or []))
 
     for idx, c in enumerate(chars):
-        packed = render_char_precise_position_with_clean_outline(
-            c, font_path, out_size, font_pixel_size=font_pixel_size, outline_width=outline_width, var_coords=var_coords
-        )
-
-        pixels = np.zeros(h * w, dtype=np.uint8)
-        for i, val in enumerate(packed):
-            high = (val >> 4) & 0xF
-            low = val & 0xF
-            pixels[i * 2] = high * 17
-            if i * 2 + 1 < pixels.size:
-                pixels[i * 2 + 1] = low * 17
-        pixels = pixels.reshape((h, w))
+        if cells is not None:
+            # 直接使用已生成的字符格（例如从图集中还原）
+            levels = cells[idx]
+        else:
+            packed = render_char_precise_position_with_clean_outline(
+                c, glyph_fonts[idx], out_size, font_pixel_size=font_pixel_size, outline_width=outline_width,
+                var_coords=var_coords if glyph_fonts[idx] == font_path else None
+            )
+            levels = unpack_i4(packed, w, h)
+        pixels = (levels * 17).astype(np.uint8)
 
         char_img = Image.fromarray(pixels, mode='L').convert("RGBA")
         datas = char_img.getdata()
@@ -262,20 +609,103 @@ def generate_preview_image(chars, font_path, out_size, outline_width, font_pixel
     img.save(save_path)
     print(f"✅ 字符预览图保存至: {save_path}")
 
-if __name__ == "__main__":
+def build_arg_parser():
+    # 后端模块依赖本模块的定位/膨胀函数，在函数内导入，避免循环导入
+    from osd_backends import BACKENDS
+
     parser = argparse.ArgumentParser(description="Variable Font（OTF/TTF）支持的OSD字体生成器，自动计算最佳var_coords")
     parser.add_argument("--width", type=int, required=True, help="字体位图宽度")
     parser.add_argument("--height", type=int, required=True, help="字体位图高度")
-    parser.add_argument("--font", type=str, required=True, help="OTF或TTF字体文件路径（可变字体）")
+    parser.add_argument("--font", type=str, required=True, help="OTF/TTF字体文件路径（可变字体），或 BDF/内嵌位图点阵字体")
     parser.add_argument("--chars", type=str, default="0123456789- :", help="需要生成的字符")
     parser.add_argument("--outline_width", type=int, default=1, help="描边宽度（像素）")
     parser.add_argument("--auto_font_size", type=int, default=1, choices=[0,1], help="自动计算最大字体像素大小")
     parser.add_argument("--sizes", type=int, nargs="*", default=[], help="批量测试字体像素大小，覆盖auto_font_size")
     parser.add_argument("--preview_dir", type=str, default="previews", help="预览图保存目录")
-    args = parser.parse_args()
+    parser.add_argument("--emit_metrics", type=int, default=0, choices=[0,1], help="输出 advance/bearing/kerning 表，用于比例排版")
+    parser.add_argument("--atlas", type=int, default=0, choices=[0,1], help="输出单张 I4 图集 + 矩形表，替代逐字符数组")
+    parser.add_argument("--atlas_align", type=int, default=4, help="图集行跨度对齐字节数（0 或 1 表示不额外补齐，宽度仍取偶数像素）")
+    parser.add_argument("--format", type=str, default="i4", choices=["auto", *FORMATS, *PIXEL_FORMATS], help="输出格式，auto 按实际灰度级数选择最小位深；argb1555 等为预转换的设备像素格式")
+    parser.add_argument("--body_color", type=lambda v: int(v, 0), default=DEFAULT_BODY_COLOR, help=f"设备像素格式的主体颜色（ARGB8888，默认 0x{DEFAULT_BODY_COLOR:08X}）")
+    parser.add_argument("--outline_color", type=lambda v: int(v, 0), default=DEFAULT_OUTLINE_COLOR, help=f"设备像素格式的描边颜色（ARGB8888，默认 0x{DEFAULT_OUTLINE_COLOR:08X}）")
+    parser.add_argument("--fallback_fonts", type=str, nargs="*", default=[], help="回退字体列表（按顺序），主字体缺字时使用")
+    parser.add_argument("--split_c", type=int, default=0, choices=[0,1], help="数据写入 .c，.h 只含 extern 声明，避免每个包含者各存一份字体")
+    parser.add_argument("--types_header", type=str, default=None, help="split_c 时 .c/.h 需要包含的类型定义头文件（声明 bitmap_i4_t 等，split_c 时必填）")
+    parser.add_argument("--emit_blit", type=int, default=0, choices=[0,1], help="同时输出该尺寸与格式专用的 C 绘制函数（font_blit_*.h）")
+    parser.add_argument("--dedup", type=str, default="none", choices=list(DEDUP_MODES), help="字模去重：glyph 合并相同字模数组，rows 使用共享行字典（仅 I4）")
+    parser.add_argument("--axes", type=str, nargs="+", default=list(DEFAULT_SEARCH_AXES), help="自动搜索的可变字体轴（按标签，如 opsz wdth wght XTRA GRAD）")
+    parser.add_argument("--axis_search", type=str, default="descent", choices=list(AXIS_SEARCH_METHODS), help="轴参数搜索方式：坐标下降或有界随机搜索 + 下降精修")
+    parser.add_argument("--no-search-cache", dest="no_search_cache", action="store_true", help="忽略像素大小/轴参数搜索缓存（.osd_search_cache.json），重新搜索")
+    parser.add_argument("--backend", type=str, default="freetype", choices=list(BACKENDS), help="渲染后端：freetype（默认）/ pil（i4.py）/ ftstroke（ft2bitmap_gen.c）")
+    return parser
+
+def search_max_font_size(font_path, canvas_size, outline_width, var_coords=None, measured=None, stats=None, use_cache=True):
+    """带持久缓存的 find_max_font_size；measured 只减少探测渲染、不影响结果，不参与缓存键"""
+    search = {"min_size": 5, "max_size": 256, "test_char": "0"}
+    params = dict(search, canvas=list(canvas_size), outline_width=outline_width, var_coords=var_coords)
+    return cached_search("max_font_size", font_path, params, lambda: find_max_font_size(
+        font_path, canvas_size, outline_width, var_coords=var_coords, measured=measured, stats=stats, **search), use_cache)
+
+def search_best_var_coords(font_path, canvas_size, outline_width, font_pixel_size, use_cache=True,
+                           tags=DEFAULT_SEARCH_AXES, method="descent"):
+    """带持久缓存的 find_best_var_coords"""
+    search = {"test_char": "0", "tags": list(tags), "method": method}
+    params = dict(search, canvas=list(canvas_size), outline_width=outline_width, font_pixel_size=font_pixel_size)
+    return cached_search("best_var_coords", font_path, params, lambda: find_best_var_coords(
+        font_path, canvas_size, outline_width, font_pixel_size, **search), use_cache)
+
+def resolve_size_and_axes(args, bitmap_font, measured=None, stats=None):
+    """
+    按命令行参数确定像素大小与轴参数，返回 (font_pixel_size, var_coords)。
+    measured 为同一字体各尺寸共享的测试字符位图尺寸记录（见 find_max_font_size），本次探测结果也会写入；
+    stats 用于累计探测渲染次数；搜索结果按输入哈希持久缓存，args.no_search_cache 为真时强制重新搜索
+    """
+    use_cache = not getattr(args, "no_search_cache", False)
+    font_pixel_size = None
+    var_coords = None
+    if bitmap_font:
+        # 点阵字体按原始像素导入，无需搜索像素大小与轴参数
+        return font_pixel_size, var_coords
+    if args.auto_font_size:
+        print("🔍 自动查找最大字体像素大小...")
+        # 优先用小尺寸参数
+        var_coords = get_small_size_var_coords(args.width, args.height)
+        font_pixel_size = search_max_font_size(args.font, (args.width, args.height), args.outline_width, var_coords=var_coords,
+                                               measured=measured, stats=stats, use_cache=use_cache)
+    else:
+        font_pixel_size = args.height
 
-    if not (args.font.lower().endswith('.ttf') or args.font.lower().endswith('.otf')):
-        print("Error: 仅支持 .ttf 和 .otf 字体文件！")
+    # 优先用小尺寸参数
+    if var_coords is None:
+        var_coords = get_small_size_var_coords(args.width, args.height)
+    if var_coords is None:
+        var_coords = search_best_var_coords(args.font, (args.width, args.height), args.outline_width, font_pixel_size, use_cache,
+                                            args.axes, args.axis_search)
+    print(f"变量字体轴参数: {var_coords}")
+    return font_pixel_size, var_coords
+
+if __name__ == "__main__":
+    from osd_backends import RenderTarget, render_cells
+
+    args = build_arg_parser().parse_args()
+
+    if not args.font.lower().endswith(('.ttf', '.otf', '.bdf')):
+        print("Error: 仅支持 .ttf、.otf 和 .bdf 字体文件！")
+        exit(1)
+    for path in args.fallback_fonts:
+        if not (path.lower().endswith('.ttf') or path.lower().endswith('.otf')):
+            print("Error: 仅支持 .ttf 和 .otf 字体文件！")
+            exit(1)
+    bitmap_font = is_bitmap_font(args.font)
+    if bitmap_font and args.sizes:
+        print("Error: 点阵字体不可缩放，不支持 --sizes")
+        exit(1)
+    if args.backend != "freetype" and (bitmap_font or args.fallback_fonts):
+        print("Error: 点阵字体与回退字体链仅支持 freetype 后端")
+        exit(1)
+    if args.split_c and not args.types_header:
+        # .c 没有包含者可以先提供 bitmap_*_t 等类型定义，必须自己包含类型定义头文件
+        print("Error: --split_c 1 需要同时指定 --types_header")
         exit(1)
 
     os.makedirs(args.preview_dir, exist_ok=True)
@@ -286,12 +716,17 @@ if __name__ == "__main__":
             out_size = (args.width, args.height)
             var_coords = get_small_size_var_coords(args.width, args.height)
             if var_coords is None:
-                var_coords = find_best_var_coords(args.font, out_size, args.outline_width, size)
+                var_coords = search_best_var_coords(args.font, out_size, args.outline_width, size, not args.no_search_cache,
+                                                    args.axes, args.axis_search)
             print(f"变量字体轴参数: {var_coords}")
-            suffix = ""
-            if var_coords:
-                suffix = f"_wdth{int(var_coords[0])}_wght{int(var_coords[1])}"
+            suffix = var_coords_suffix(var_coords)
+            backend_cells = None
+            if args.backend != "freetype":
+                suffix += f"_{args.backend}"
             preview_path = os.path.join(args.preview_dir, f"preview_{args.width}x{args.height}_size{size}{suffix}.png")
+            if args.backend != "freetype":
+                target = RenderTarget(args.font, out_size, size, args.outline_width, var_coords)
+                backend_cells = render_cells(args.backend, args.chars, target)
             generate_preview_image(
                 args.chars,
                 args.font,
@@ -299,40 +734,43 @@ if __name__ == "__main__":
                 args.outline_width,
                 font_pixel_size=size,
                 save_path=preview_path,
-                var_coords=var_coords
+                var_coords=var_coords,
+                cells=backend_cells,
+                fallback_fonts=args.fallback_fonts
             )
     else:
-        font_pixel_size = None
-        if args.auto_font_size:
-            print("🔍 自动查找最大字体像素大小...")
-            # 优先用小尺寸参数
-            var_coords = get_small_size_var_coords(args.width, args.height)
-            if var_coords is not None:
-                font_pixel_size = find_max_font_size(args.font, (args.width, args.height), args.outline_width, var_coords=var_coords)
-            else:
-                font_pixel_size = find_max_font_size(args.font, (args.width, args.height), args.outline_width)
-        else:
-            font_pixel_size = args.height
+        font_pixel_size, var_coords = resolve_size_and_axes(args, bitmap_font)
 
-        # 优先用小尺寸参数
-        if 'var_coords' not in locals() or var_coords is None:
-            var_coords = get_small_size_var_coords(args.width, args.height)
-        if var_coords is None:
-            var_coords = find_best_var_coords(args.font, (args.width, args.height), args.outline_width, font_pixel_size)
-        print(f"变量字体轴参数: {var_coords}")
+        backend_cells = None
+        if args.backend != "freetype":
+            target = RenderTarget(args.font, (args.width, args.height), font_pixel_size, args.outline_width, var_coords)
+            backend_cells = render_cells(args.backend, args.chars, target)
+            print(f"🔧 渲染后端: {args.backend}")
 
-        export_chars_black_white_gray_i4_header(
+        cells = export_chars_black_white_gray_i4_header(
             args.chars,
             args.font,
             (args.width, args.height),
             outline_width=args.outline_width,
             font_pixel_size=font_pixel_size,
-            var_coords=var_coords
+            var_coords=var_coords,
+            emit_metrics=bool(args.emit_metrics),
+            atlas_align=args.atlas_align if args.atlas else None,
+            out_format=args.format,
+            fallback_fonts=args.fallback_fonts,
+            cells=backend_cells,
+            split_c=bool(args.split_c),
+            types_header=args.types_header,
+            emit_blit=bool(args.emit_blit),
+            body_color=args.body_color,
+            outline_color=args.outline_color,
+            dedup=args.dedup
         )
-        suffix = ""
-        if var_coords:
-            suffix = f"_wdth{int(var_coords[0])}_wght{int(var_coords[1])}"
-        preview_path = os.path.join(args.preview_dir, f"preview_{args.width}x{args.height}_size{font_pixel_size}{suffix}.png")
+        suffix = var_coords_suffix(var_coords)
+        if args.backend != "freetype":
+            suffix += f"_{args.backend}"
+        size_label = f"size{font_pixel_size}" if not bitmap_font else "bitmap"
+        preview_path = os.path.join(args.preview_dir, f"preview_{args.width}x{args.height}_{size_label}{suffix}.png")
         generate_preview_image(
             args.chars,
             args.font,
@@ -340,5 +778,6 @@ if __name__ == "__main__":
             args.outline_width,
             font_pixel_size=font_pixel_size,
             save_path=preview_path,
-            var_coords=var_coords
+            var_coords=var_coords,
+            cells=cells
         )
\ No newline at end of file
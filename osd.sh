@@ -2,6 +2,7 @@
 
 rm previews/* font/*.h
 
+# 也可用 python3 osd_watch.py --once 1 --out_dir font 在同一进程内构建，各尺寸的像素大小搜索共享已渲染的探测结果，输出与逐条运行一致
 python3 osd.py --width 8 --height 16 --font ./fonts/RobotoFlex-VariableFont_GRAD,XOPQ,XTRA,YOPQ,YTAS,YTDE,YTFI,YTLC,YTUC,opsz,slnt,wdth,wght.ttf --chars "0123456789- :" --outline_width 1 --auto_font_size 1
 python3 osd.py --width 16 --height 32 --font ./fonts/RobotoFlex-VariableFont_GRAD,XOPQ,XTRA,YOPQ,YTAS,YTDE,YTFI,YTLC,YTUC,opsz,slnt,wdth,wght.ttf --chars "0123456789- :" --outline_width 2 --auto_font_size 1
 python3 osd.py --width 24 --height 48 --font ./fonts/RobotoFlex-VariableFont_GRAD,XOPQ,XTRA,YOPQ,YTAS,YTDE,YTFI,YTLC,YTUC,opsz,slnt,wdth,wght.ttf --chars "0123456789- :" --outline_width 2 --auto_font_size 1
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+OSD 字形图集（atlas）
+- 将同一尺寸的全部字形裁剪到有效像素区域后，用 shelf 算法打包进一张 I4 表面
+- 行跨度（stride）按指定字节数对齐，方便 SoC 2D 加速器单源 blit
+- 输出图集数据 + 矩形表，替代逐字符的 char_* 数组
+"""
+import numpy as np
+
+
+def crop_glyph(levels):
+    """裁剪到非零像素包围盒，返回 (子图, dx, dy)；空白字形返回 0x0 子图"""
+    ys, xs = np.nonzero(levels)
+    if ys.size == 0:
+        return levels[:0, :0], 0, 0
+    y0, y1 = ys.min(), ys.max() + 1
+    x0, x1 = xs.min(), xs.max() + 1
+    # I4 两像素一字节，左边界取偶数，保证每个字形按字节起始
+    x0 -= x0 % 2
+    return levels[y0:y1, x0:x1], int(x0), int(y0)
+
+
+def _align(value, align):
+    return (value + align - 1) // align * align
+
+
+def shelf_pack(sizes, atlas_width):
+    """
+    shelf 打包：按高度降序逐行摆放，放不下则另起一行。
+    sizes 为 [(w, h), ...]，返回 ([(x, y), ...], 图集高度)。
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [(0, 0)] * len(sizes)
+    shelf_y = 0
+    shelf_h = 0
+    cursor_x = 0
+    for i in order:
+        gw, gh = sizes[i]
+        if gw == 0 or gh == 0:
+            continue
+        gw = _align(gw, 2)
+        if cursor_x + gw > atlas_width:
+            shelf_y += shelf_h
+            shelf_h = 0
+            cursor_x = 0
+        positions[i] = (cursor_x, shelf_y)
+        cursor_x += gw
+        shelf_h = max(shelf_h, gh)
+    return positions, shelf_y + shelf_h
+
+
+def build_atlas(cells, stride_align=4, atlas_width=None):
+    """
+    将字符格列表打包为 I4 图集。
+    返回 (atlas_levels[H, W], rects)，rects 每项为 (x, y, w, h, dx, dy)，
+    其中 (dx, dy) 为该矩形在原字符格内的偏移。
+    """
+    crops = [crop_glyph(c) for c in cells]
+    sizes = [(g.shape[1], g.shape[0]) for g, _, _ in crops]
+    # I4 行必须按字节对齐（宽度取偶数）；stride_align 为 0 / 1 时只是不再额外补齐行跨度
+    align_px = max(stride_align, 1) * 2
+    max_w = max([_align(w, 2) for w, _ in sizes] + [2])
+    if atlas_width is None:
+        area = sum(_align(w, 2) * h for w, h in sizes)
+        atlas_width = max(max_w, int(np.ceil(np.sqrt(area))))
+    atlas_width = _align(max(atlas_width, max_w), align_px)
+
+    positions, atlas_height = shelf_pack(sizes, atlas_width)
+    atlas = np.zeros((max(atlas_height, 1), atlas_width), dtype=np.uint8)
+    rects = []
+    for (g, dx, dy), (x, y) in zip(crops, positions):
+        gh, gw = g.shape
+        atlas[y:y + gh, x:x + gw] = g
+        rects.append((x, y, gw, gh, dx, dy))
+    return atlas, rects
+
+
+def atlas_cell(atlas, rect, cell_size):
+    """从图集还原完整字符格（用于预览与校验）"""
+    w, h = cell_size
+    x, y, gw, gh, dx, dy = rect
+    cell = np.zeros((h, w), dtype=np.uint8)
+    cell[dy:dy + gh, dx:dx + gw] = atlas[y:y + gh, x:x + gw]
+    return cell
+
+
+def atlas_header_lines(table_name, chars, atlas, rects, packed):
+    """生成图集头文件主体：尺寸宏、图集数据与矩形表"""
+    atlas_h, atlas_w = atlas.shape
+    stride = atlas_w // 2
+    prefix = table_name.upper()
+    lines = [
+        f"// I4 atlas: {atlas_w}x{atlas_h} px, stride {stride} bytes, 2 pixels per byte.",
+        f"#define {prefix}_ATLAS_WIDTH {atlas_w}",
+        f"#define {prefix}_ATLAS_HEIGHT {atlas_h}",
+        f"#define {prefix}_ATLAS_STRIDE {stride}",
+        "",
+        f"static const uint8_t {table_name}_atlas[{len(packed)}] = {{",
+    ]
+    for i in range(0, len(packed), stride):
+        lines.append("    " + ", ".join(f"0x{val:02X}" for val in packed[i:i + stride]) + ",")
+    lines.append("};")
+    lines.append("")
+    lines.append("// { x, y, w, h, dx, dy }: source rect in the atlas and its offset inside the glyph cell.")
+    lines.append(f"static const uint16_t {table_name}_rects[{len(rects)}][6] = {{")
+    for c, rect in zip(chars, rects):
+        label = c if c.isprintable() and c not in "\\" else f"U+{ord(c):04X}"
+        lines.append(f"    {{ {', '.join(str(v) for v in rect)} }}, // '{label}'")
+    lines.append("};")
+    lines.append("")
+    return lines
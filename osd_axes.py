@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+可变字体轴参数
+- var_coords 统一为 {轴标签: 设计坐标}（如 {"wdth": 85, "wght": 400}），按字体 fvar 中的轴顺序展开后再设置，
+  未指定的轴保持默认值；RobotoFlex 等轴较多的字体不再因按位置传参把数值写到错误的轴上
+- 轴参数优化：在任意轴子集（opsz / wdth / wght / XTRA / GRAD …）上做坐标下降或有界随机搜索，
+  每个坐标组合只渲染一次（记忆化），代价远低于把固定网格扩展到多维
+"""
+import numpy as np
+import freetype
+
+AXIS_SEARCH_METHODS = ("descent", "random")
+DEFAULT_SEARCH_AXES = ("wdth", "wght")
+# 随机搜索的采样数，之后再以小步长坐标下降精修
+RANDOM_SEARCH_SAMPLES = 32
+
+
+def axis_design_coords(face, settings):
+    """按轴标签（wdth/wght/...）设置坐标，其余轴保持默认值"""
+    axes = face.get_variation_info().axes
+    coords = []
+    for axis in axes:
+        value = settings.get(axis.tag, axis.default)
+        coords.append(float(min(max(value, axis.minimum), axis.maximum)))
+    return coords
+
+
+def apply_var_coords(face, var_coords):
+    """按轴标签设置可变字体坐标；var_coords 为空或字体不可变时保持默认实例"""
+    if not var_coords or not face.has_multiple_masters:
+        return
+    face.set_var_design_coords(axis_design_coords(face, var_coords))
+
+
+def var_coords_key(var_coords):
+    """可哈希的轴参数表示，用于缓存键"""
+    return tuple(sorted((var_coords or {}).items()))
+
+
+def var_coords_suffix(var_coords):
+    """预览文件名后缀，如 _wdth85_wght400"""
+    return "".join(f"_{tag}{int(v)}" for tag, v in (var_coords or {}).items())
+
+
+def optimize_var_coords(font_path, canvas_size, outline_width, font_pixel_size, tags=DEFAULT_SEARCH_AXES,
+                        method="descent", test_char="0", seed=0, stats=None):
+    """
+    在 tags 指定的轴上搜索能放入字符格且测试字符位图面积最大的坐标，返回 {轴标签: 坐标}；
+    字体不可变、不含这些轴或没有任何坐标放得下时返回 None。
+    放不下的坐标按超出像素数打负分，使搜索能从放不下的起点走向可行区域。
+    stats 不为 None 时把渲染次数累加到 stats["probes"]
+    """
+    face = freetype.Face(font_path)
+    if not face.has_multiple_masters:
+        return None
+    axes = {a.tag: a for a in face.get_variation_info().axes}
+    tags = [t for t in dict.fromkeys(tags) if t in axes]
+    if not tags:
+        return None
+    bounds = {t: (int(np.ceil(axes[t].minimum)), int(np.floor(axes[t].maximum))) for t in tags}
+    avail_w = canvas_size[0] - 2 * outline_width
+    avail_h = canvas_size[1] - 2 * outline_width
+    scores = {}
+
+    def clamp(tag, value):
+        lo, hi = bounds[tag]
+        return int(min(max(int(round(value)), lo), hi))
+
+    def score(point):
+        key = tuple(point[t] for t in tags)
+        if key not in scores:
+            if stats is not None:
+                stats["probes"] = stats.get("probes", 0) + 1
+            try:
+                face.set_var_design_coords(axis_design_coords(face, point))
+                face.set_pixel_sizes(0, font_pixel_size)
+                face.load_char(test_char, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_NORMAL)
+                bw, bh = face.glyph.bitmap.width, face.glyph.bitmap.rows
+                overflow = max(0, bw - avail_w) + max(0, bh - avail_h)
+                scores[key] = (1, bw * bh) if overflow == 0 else (0, -overflow)
+            except Exception:
+                scores[key] = (0, -float("inf"))
+        return scores[key]
+
+    def descent(point, steps):
+        best = score(point)
+        min_steps = {t: max(1, (bounds[t][1] - bounds[t][0]) // 100) for t in tags}
+        while True:
+            improved = False
+            for tag in tags:
+                for direction in (1, -1):
+                    cand = dict(point, **{tag: clamp(tag, point[tag] + direction * steps[tag])})
+                    if cand[tag] == point[tag]:
+                        continue
+                    s = score(cand)
+                    if s > best:
+                        point, best, improved = cand, s, True
+                        break
+            if improved:
+                continue
+            if all(steps[t] <= min_steps[t] for t in tags):
+                return point, best
+            steps = {t: max(min_steps[t], steps[t] // 2) for t in tags}
+
+    spans = {t: bounds[t][1] - bounds[t][0] for t in tags}
+    start = {t: clamp(t, axes[t].default) for t in tags}
+    if method == "random":
+        rng = np.random.default_rng(seed)
+        candidates = [start] + [{t: clamp(t, rng.uniform(*bounds[t])) for t in tags} for _ in range(RANDOM_SEARCH_SAMPLES)]
+        start = max(candidates, key=score)
+        point, best = descent(start, {t: max(1, spans[t] // 16) for t in tags})
+    elif method == "descent":
+        point, best = descent(start, {t: max(1, spans[t] // 4) for t in tags})
+    else:
+        raise ValueError(f"未知轴参数搜索方式: {method}")
+    return point if best[0] == 1 else None
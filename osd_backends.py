@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+可插拔渲染后端
+- 统一接口：rasterize（栅格化）→ outline（描边）→ place（放入字符格）→ quantize（I4 量化）
+- freetype：osd.py 流程（FreeType + 方形膨胀描边 + 度量居中），与默认输出逐字节一致
+- pil：i4.py 流程（PIL 单次栅格化 + 圆盘最大值滤波 + 按比例缩放居中）
+- ftstroke：fontgen_generator/ft2bitmap_gen.c 流程（FT_Stroker 描边 + 拉伸到字符格 + 双线性缩放）
+- 命令行对同一组目标运行所有后端，输出耗时、与参考后端的像素一致率和差异图
+"""
+from collections import namedtuple
+from PIL import Image, ImageFont
+import numpy as np
+import freetype
+import argparse
+import time
+import os
+
+from osd import get_small_size_var_coords, find_max_font_size, place_glyph, outline_and_quantize
+from ft_bitmap import bitmap_array
+from osd_axes import apply_var_coords, axis_design_coords, var_coords_key
+from osd_sdf import parse_target
+import i4
+
+# 渲染目标：所有后端共用同一组参数
+RenderTarget = namedtuple("RenderTarget", "font_path out_size font_pixel_size outline_width var_coords")
+# rasterize 的输出：coverage 为 (h, w) 灰度；width/rows 为裁剪前的位图尺寸
+Raster = namedtuple("Raster", "coverage left top advance width rows")
+# outline 的输出：合成灰度图（0 背景 / 描边灰 / 255 主体），origin 为 coverage 左上角在其中的位置
+Outlined = namedtuple("Outlined", "image origin_x origin_y")
+Backend = namedtuple("Backend", "name description rasterize outline place quantize")
+
+_face_cache = {}
+_pil_font_cache = {}
+
+
+def _ft_face(target):
+    key = (target.font_path, var_coords_key(target.var_coords), target.font_pixel_size)
+    if key not in _face_cache:
+        face = freetype.Face(target.font_path)
+        try:
+            apply_var_coords(face, target.var_coords)
+        except Exception as e:
+            print(f"⚠️ 设置变量字体轴值失败: {e}")
+        face.set_pixel_sizes(0, target.font_pixel_size)
+        _face_cache[key] = face
+    return _face_cache[key]
+
+
+def _pil_font(target):
+    key = (target.font_path, var_coords_key(target.var_coords), target.font_pixel_size)
+    if key not in _pil_font_cache:
+        font = ImageFont.truetype(target.font_path, target.font_pixel_size)
+        face = freetype.Face(target.font_path)
+        if target.var_coords and face.has_multiple_masters:
+            try:
+                # PIL 按 fvar 轴顺序取值，这里按轴标签展开
+                font.set_variation_by_axes(axis_design_coords(face, target.var_coords))
+            except OSError as e:
+                print(f"⚠️ PIL 设置变量字体轴值失败，使用默认实例: {e}")
+        _pil_font_cache[key] = font
+    return _pil_font_cache[key]
+
+
+def _paste(canvas, image, x, y):
+    """把 image 粘贴到 canvas 的 (x, y)，超出部分裁掉"""
+    h, w = canvas.shape
+    ih, iw = image.shape
+    sx0, sy0 = max(0, -x), max(0, -y)
+    dx0, dy0 = max(0, x), max(0, y)
+    dx1, dy1 = min(w, x + iw), min(h, y + ih)
+    if dx1 > dx0 and dy1 > dy0:
+        canvas[dy0:dy1, dx0:dx1] = image[sy0:sy0 + dy1 - dy0, sx0:sx0 + dx1 - dx0]
+    return canvas
+
+
+def _threshold_levels(canvas, high, low):
+    levels = np.zeros(canvas.shape, dtype=np.uint8)
+    levels[canvas >= low] = 0x8
+    levels[canvas >= high] = 0xF
+    return levels
+
+
+# ---------------- freetype：osd.py ----------------
+# 直接调用 osd.py 构建所用的 place_glyph / outline_and_quantize，避免两份定位、裁剪与描边逻辑各自演变。
+# osd.py 先把位图放入字符格再描边，因此 rasterize 已完成定位（coverage 即整个字符格），place 原样返回
+
+def ft_rasterize(char, target):
+    w, h = target.out_size
+    face = _ft_face(target)
+    canvas = np.zeros((h, w), dtype=np.uint8)
+    place_glyph(face, char, target.out_size, canvas)
+    glyph = face.glyph
+    return Raster(canvas, 0, 0, glyph.advance.x, glyph.bitmap.width, glyph.bitmap.rows)
+
+
+def ft_outline(char, raster, target):
+    # 灰度级 0 / 8 / F 还原为 0 / 136（描边灰）/ 255，由 ft_quantize 再量化回同样的灰度级
+    levels = outline_and_quantize(raster.coverage, target.outline_width)
+    return Outlined(levels * 17, 0, 0)
+
+
+def ft_place(char, raster, outlined, target):
+    return outlined.image
+
+
+def ft_quantize(canvas, target):
+    return _threshold_levels(canvas, 200, 100)
+
+
+# ---------------- pil：i4.py ----------------
+
+def pil_rasterize(char, target):
+    font = _pil_font(target)
+    coverage = i4.glyph_mask(char, font)
+    left, top, right, bottom = font.getbbox(char)
+    return Raster(coverage, left, -top, int(font.getlength(char) * 64), coverage.shape[1], coverage.shape[0])
+
+
+def pil_outline(char, raster, target):
+    image = np.asarray(i4.outline_coverage(raster.coverage, target.outline_width))
+    return Outlined(image, target.outline_width, target.outline_width)
+
+
+def pil_place(char, raster, outlined, target):
+    w, h = target.out_size
+    if not outlined.image.any():
+        return np.zeros((h, w), dtype=np.uint8)
+    # 空白字符外的字形裁剪到非零区域后按比例缩放居中，与 i4.py 相同
+    return np.asarray(i4.fit_to_cell(Image.fromarray(outlined.image, mode="L"), target.out_size))
+
+
+def pil_quantize(canvas, target):
+    return _threshold_levels(canvas, 200, 80)
+
+
+# ---------------- ftstroke：ft2bitmap_gen.c ----------------
+
+# C 版本在行高 <= 16px 时不描边，窄符号使用最近邻缩放
+FTSTROKE_SMALL_HEIGHT = 16
+FTSTROKE_NEAREST_CHARS = "-:.,"
+
+
+def fts_rasterize(char, target):
+    face = _ft_face(target)
+    face.load_char(char, freetype.FT_LOAD_RENDER)
+    glyph = face.glyph
+    bitmap = glyph.bitmap
+    arr = bitmap_array(bitmap).copy()
+    return Raster(arr, glyph.bitmap_left, glyph.bitmap_top, glyph.advance.x, bitmap.width, bitmap.rows)
+
+
+def fts_outline(char, raster, target):
+    face = _ft_face(target)
+    if (face.size.height >> 6) <= FTSTROKE_SMALL_HEIGHT or target.outline_width <= 0:
+        return Outlined(raster.coverage.copy(), 0, 0)
+
+    face.load_char(char, freetype.FT_LOAD_NO_BITMAP)
+    stroker = freetype.Stroker()
+    stroker.set(int(target.outline_width * 64), freetype.FT_STROKER_LINECAP_ROUND, freetype.FT_STROKER_LINEJOIN_ROUND, 0)
+    stroked = face.glyph.get_glyph()
+    stroked.stroke(stroker, True)
+    border = stroked.to_bitmap(freetype.FT_RENDER_MODE_NORMAL, 0, True)
+    outline_val = bitmap_array(border.bitmap)
+
+    # 主体按描边位图坐标对齐：offset = 主体左上角相对描边位图的位置
+    origin_x, origin_y = raster.left - border.left, border.top - raster.top
+    body = _paste(np.zeros_like(outline_val), raster.coverage, origin_x, origin_y)
+    image = np.zeros_like(outline_val)
+    image[outline_val > 0] = 64
+    image[body > 0] = 192
+    image[body > 160] = 255
+    return Outlined(image, origin_x, origin_y)
+
+
+def _scale_bilinear(src, dst_w, dst_h):
+    """与 C 版 scale_bitmap 相同：左上角对齐采样，float32 运算，结果截断取整"""
+    src_h, src_w = src.shape
+    if (src_w, src_h) == (dst_w, dst_h):
+        return src.copy()
+    x_ratio = np.float32(src_w) / np.float32(dst_w)
+    y_ratio = np.float32(src_h) / np.float32(dst_h)
+    sx = np.arange(dst_w, dtype=np.float32) * x_ratio
+    sy = np.arange(dst_h, dtype=np.float32) * y_ratio
+    x1, y1 = sx.astype(np.int32), sy.astype(np.int32)
+    x2, y2 = np.minimum(x1 + 1, src_w - 1), np.minimum(y1 + 1, src_h - 1)
+    dx, dy = (sx - x1)[None, :], (sy - y1)[:, None]
+    s = src.astype(np.float32)
+    out = (s[y1][:, x1] * (1 - dx) * (1 - dy) + s[y1][:, x2] * dx * (1 - dy)
+           + s[y2][:, x1] * (1 - dx) * dy + s[y2][:, x2] * dx * dy)
+    return out.astype(np.uint8)
+
+
+def fts_place(char, raster, outlined, target):
+    w, h = target.out_size
+    src = outlined.image
+    if src.size == 0:
+        return np.zeros((h, w), dtype=np.uint8)
+    if char in FTSTROKE_NEAREST_CHARS:
+        src_h, src_w = src.shape
+        sx = (np.arange(w, dtype=np.float32) * np.float32(src_w / w)).astype(np.int32)
+        sy = (np.arange(h, dtype=np.float32) * np.float32(src_h / h)).astype(np.int32)
+        return src[sy][:, sx]
+    return _scale_bilinear(src, w, h)
+
+
+def fts_quantize(canvas, target):
+    return _threshold_levels(canvas, 192, 64)
+
+
+BACKENDS = {
+    "freetype": Backend("freetype", "osd.py: FreeType + 方形膨胀", ft_rasterize, ft_outline, ft_place, ft_quantize),
+    "pil": Backend("pil", "i4.py: PIL + 圆盘最大值滤波", pil_rasterize, pil_outline, pil_place, pil_quantize),
+    "ftstroke": Backend("ftstroke", "ft2bitmap_gen.c: FT_Stroker + 双线性", fts_rasterize, fts_outline, fts_place, fts_quantize),
+}
+
+
+def render_levels(backend, char, target):
+    """依次执行后端四个阶段，返回 (h, w) 的 I4 灰度级数组"""
+    raster = backend.rasterize(char, target)
+    outlined = backend.outline(char, raster, target)
+    canvas = backend.place(char, raster, outlined, target)
+    return backend.quantize(canvas, target)
+
+
+def render_cells(backend_name, chars, target):
+    backend = BACKENDS[backend_name]
+    return [render_levels(backend, c, target) for c in chars]
+
+
+def diff_image(reference, cells, scale=4):
+    """参考后端与被测后端的差异图：一致像素按灰度显示，不一致像素标红"""
+    ref = np.concatenate(reference, axis=1)
+    cur = np.concatenate(cells, axis=1)
+    gray = (cur * 17).astype(np.uint8)
+    rgb = np.stack([gray, gray, gray], axis=-1)
+    rgb[ref != cur] = (255, 0, 0)
+    img = Image.fromarray(rgb, mode="RGB")
+    return img.resize((img.width * scale, img.height * scale), Image.NEAREST)
+
+
+def compare_backends(chars, font_path, targets, backends, reference="freetype", repeat=3, preview_dir=None):
+    """在相同目标上运行各后端，返回 [(尺寸, 后端, 毫秒/字符集, 一致率)]"""
+    rows = []
+    for out_size, outline_width in targets:
+        var_coords = get_small_size_var_coords(*out_size)
+        font_pixel_size = find_max_font_size(font_path, out_size, outline_width, var_coords=var_coords)
+        target = RenderTarget(font_path, out_size, font_pixel_size, outline_width, var_coords)
+        ref_cells = render_cells(reference, chars, target)
+        sheets = []
+        for name in backends:
+            render_cells(name, chars, target)  # 预热字体缓存
+            t0 = time.perf_counter()
+            for _ in range(repeat):
+                cells = render_cells(name, chars, target)
+            ms = (time.perf_counter() - t0) * 1000 / repeat
+            agree = float(np.mean([np.mean(a == b) for a, b in zip(ref_cells, cells)]))
+            rows.append((out_size, name, ms, agree))
+            sheets.append(diff_image(ref_cells, cells))
+        if preview_dir:
+            sheet = Image.new("RGB", (sheets[0].width, sum(s.height + 4 for s in sheets)))
+            y = 0
+            for s in sheets:
+                sheet.paste(s, (0, y))
+                y += s.height + 4
+            path = os.path.join(preview_dir, f"backends_{out_size[0]}x{out_size[1]}.png")
+            sheet.save(path)
+            print(f"✅ 差异图保存至: {path}（自上而下: {', '.join(backends)}；红色为与 {reference} 不一致的像素）")
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="渲染后端对比：耗时、像素一致率与差异图")
+    parser.add_argument("--font", type=str, required=True, help="OTF或TTF字体文件路径（可变字体）")
+    parser.add_argument("--chars", type=str, default="0123456789- :", help="需要生成的字符")
+    parser.add_argument("--targets", type=str, nargs="+", default=["8x16:1", "16x32:2", "24x48:2", "48x96:4"], help="目标尺寸与描边宽度，如 16x32:2")
+    parser.add_argument("--backends", type=str, nargs="+", default=list(BACKENDS), choices=list(BACKENDS), help="参与对比的后端")
+    parser.add_argument("--reference", type=str, default="freetype", choices=list(BACKENDS), help="一致率的参考后端")
+    parser.add_argument("--min_agreement", type=float, default=0.9, help="可接受的最低像素一致率")
+    parser.add_argument("--repeat", type=int, default=3, help="计时重复次数")
+    parser.add_argument("--preview_dir", type=str, default="previews", help="差异图保存目录")
+    args = parser.parse_args()
+
+    os.makedirs(args.preview_dir, exist_ok=True)
+    targets = [parse_target(t) for t in args.targets]
+    rows = compare_backends(args.chars, args.font, targets, args.backends, args.reference, args.repeat, args.preview_dir)
+
+    print(f"{'size':>6} {'backend':>9} {'ms':>8} {'agree':>7}")
+    for out_size, name, ms, agree in rows:
+        print(f"{out_size[0]:>2}x{out_size[1]:<3} {name:>9} {ms:8.1f} {agree:7.1%}")
+    for out_size, _ in targets:
+        ok = [r for r in rows if r[0] == out_size and r[3] >= args.min_agreement]
+        if ok:
+            best = min(ok, key=lambda r: r[2])
+            print(f"✅ {out_size[0]}x{out_size[1]}: 最快的可接受后端为 {best[1]}（{best[2]:.1f} ms，一致率 {best[3]:.1%}）")
+        else:
+            print(f"⚠️ {out_size[0]}x{out_size[1]}: 没有后端达到 {args.min_agreement:.0%} 一致率")
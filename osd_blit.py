@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+C 绘制函数生成器
+- 为每个 (宽, 高, 格式, 目标像素格式) 生成专用的 static inline 绘制函数：
+  行内像素完全展开，按 32 位字整体跳过透明区域，通过查找表写入叠加层像素
+- 同时生成查找表构造函数：I4 灰度级在描边色与主体色之间插值，并转换为目标像素格式
+- 主机侧测试：用系统编译器编译生成的代码，与通用逐像素解包循环比较结果并计时
+"""
+import subprocess
+import argparse
+import tempfile
+import glob
+import re
+import os
+
+from osd_header import load_header
+from osd_formats import build_palette, distinct_levels, encode_glyph
+
+BLIT_FORMATS = ("i4", "i2", "i1m", "i1")
+# 目标像素格式：(C 类型, 由 8 位 a/r/g/b 组装像素的 C 表达式)
+DST_FORMATS = {
+    "argb8888": ("uint32_t", "((uint32_t)a << 24) | ((uint32_t)r << 16) | ((uint32_t)g << 8) | (uint32_t)b"),
+    "argb1555": ("uint16_t", "(uint16_t)(((a >= 128) << 15) | ((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3))"),
+}
+
+
+def row_bytes(fmt, w):
+    """每行字节数：i4 为连续打包（宽度为偶数时每行 w/2 字节），其余格式按字节对齐"""
+    if fmt == "i4":
+        return w // 2
+    if fmt == "i2":
+        return (w + 3) // 4
+    return (w + 7) // 8
+
+
+def supports(fmt, out_size):
+    # i4 数据整体连续打包，宽度为奇数时行不以字节起始，只能用通用循环
+    return fmt in BLIT_FORMATS and not (fmt == "i4" and out_size[0] % 2)
+
+
+def _chunks(n):
+    """把一行 n 字节切成 4/2/1 字节的块，用于按字跳过透明区域"""
+    out, o = [], 0
+    for size in (4, 2, 1):
+        while n - o >= size:
+            out.append((o, size))
+            o += size
+    return out
+
+
+def _load(ptr, o, size):
+    return {4: f"osd_load32({ptr} + {o})", 2: f"osd_load16({ptr} + {o})", 1: f"{ptr}[{o}]"}[size]
+
+
+def _pixel_lines(fmt, byte_index, w):
+    """单个源字节对应的像素写入语句"""
+    lines = []
+    if fmt == "i4":
+        for k, expr in enumerate((f"s[{byte_index}] >> 4", f"s[{byte_index}] & 0xF")):
+            x = byte_index * 2 + k
+            if x < w:
+                lines.append(f"v = {expr}; if (v) d[{x}] = lut[v];")
+    elif fmt == "i2":
+        for k in range(4):
+            x = byte_index * 4 + k
+            if x < w:
+                lines.append(f"v = (s[{byte_index}] >> {6 - 2 * k}) & 3; if (v) d[{x}] = lut[v];")
+    elif fmt == "i1m":
+        for k in range(8):
+            x = byte_index * 8 + k
+            if x < w:
+                bit = 0x80 >> k
+                lines.append(f"if (s[{byte_index}] & 0x{bit:02X}) d[{x}] = body; else if (o[{byte_index}] & 0x{bit:02X}) d[{x}] = outline;")
+    else:
+        for k in range(8):
+            x = byte_index * 8 + k
+            if x < w:
+                lines.append(f"if (s[{byte_index}] & 0x{0x80 >> k:02X}) d[{x}] = on;")
+    return lines
+
+
+def blit_function_name(fmt, out_size, dst):
+    return f"osd_blit_{fmt}_{out_size[0]}x{out_size[1]}_{dst}"
+
+
+def blit_function_lines(fmt, out_size, dst):
+    """生成一个专用绘制函数"""
+    w, h = out_size
+    pix_t = DST_FORMATS[dst][0]
+    rb = row_bytes(fmt, w)
+    name = blit_function_name(fmt, out_size, dst)
+    if fmt == "i1m":
+        params = f"{pix_t} *dst, int dst_stride, const uint8_t *body_plane, const uint8_t *outline_plane, {pix_t} body, {pix_t} outline"
+    elif fmt == "i1":
+        params = f"{pix_t} *dst, int dst_stride, const uint8_t *src, {pix_t} on"
+    else:
+        params = f"{pix_t} *dst, int dst_stride, const uint8_t *src, const {pix_t} *lut"
+    lut_note = {
+        "i4": " lut: 16 entries indexed by I4 level (osd_blit_lut_{dst}).",
+        "i2": " lut: 4 entries indexed by I2 value (osd_blit_lut_i2_{dst}).",
+    }.get(fmt, "").format(dst=dst)
+    lines = [
+        f"// {w}x{h} {fmt.upper()} -> {dst.upper()}. dst_stride is in pixels; transparent pixels are not written.{lut_note}",
+        f"static inline void {name}({params})",
+        "{",
+    ]
+    if fmt in ("i4", "i2"):
+        lines.append("    unsigned v;")
+    lines.append(f"    for (int y = 0; y < {h}; y++) {{")
+    if fmt == "i1m":
+        lines.append(f"        const uint8_t *s = body_plane + y * {rb};")
+        lines.append(f"        const uint8_t *o = outline_plane + y * {rb};")
+    else:
+        lines.append(f"        const uint8_t *s = src + y * {rb};")
+    lines.append(f"        {pix_t} *d = dst + y * dst_stride;")
+    for o, size in _chunks(rb):
+        test = _load("s", o, size)
+        if fmt == "i1m":
+            test = f"({test} | {_load('o', o, size)})"
+        lines.append(f"        if ({test}) {{")
+        for b in range(o, o + size):
+            lines.extend("            " + stmt for stmt in _pixel_lines(fmt, b, w))
+        lines.append("        }")
+    lines.append("    }")
+    lines.append("}")
+    lines.append("")
+    return lines
+
+
+def lut_function_lines(dst):
+    """I4 灰度级 -> 目标像素查找表：1~8 为描边色（透明度随灰度递增），9~15 由描边色过渡到主体色"""
+    pix_t, pack = DST_FORMATS[dst]
+    return [
+        "// Build the I4 level lookup table from 0xAARRGGBB body/outline colors. lut[0] is transparent and never written.",
+        f"static inline void osd_blit_lut_{dst}({pix_t} lut[16], uint32_t body, uint32_t outline)",
+        "{",
+        "    lut[0] = 0;",
+        "    for (int l = 1; l < 16; l++) {",
+        "        unsigned c[4];",
+        "        for (int k = 0; k < 4; k++) {",
+        "            int cb = (body >> (8 * k)) & 0xFF, co = (outline >> (8 * k)) & 0xFF;",
+        "            if (l <= 8)",
+        "                c[k] = k == 3 ? co * l / 8 : co;",
+        "            else",
+        "                c[k] = co + (cb - co) * (l - 8) / 7;",
+        "        }",
+        "        unsigned a = c[3], r = c[2], g = c[1], b = c[0];",
+        f"        lut[l] = {pack};",
+        "    }",
+        "}",
+        "",
+    ]
+
+
+def lut_i2_function_lines(dst):
+    """I2 索引 -> 目标像素查找表：经调色板（i2_WxH_palette，索引 -> I4 灰度级）取 I4 查找表中的颜色"""
+    pix_t = DST_FORMATS[dst][0]
+    return [
+        "// Build the I2 lookup table: palette[] (i2_WxH_palette) maps each 2-bit index to an I4 level,",
+        f"// lut16 is the table filled by osd_blit_lut_{dst}().",
+        f"static inline void osd_blit_lut_i2_{dst}({pix_t} lut[4], const {pix_t} lut16[16], const uint8_t palette[4])",
+        "{",
+        "    for (int i = 0; i < 4; i++)",
+        "        lut[i] = lut16[palette[i] & 0xF];",
+        "}",
+        "",
+    ]
+
+
+def blit_header_lines(fmt, out_size, dsts=tuple(DST_FORMATS)):
+    w, h = out_size
+    guard = f"FONT_BLIT_{fmt.upper()}_{w}x{h}_H"
+    lines = [
+        f"#ifndef {guard}",
+        f"#define {guard}",
+        "",
+        "#include <stdint.h>",
+        "#include <string.h>",
+        "",
+        f"// Auto-generated blitters for {w}x{h} {fmt.upper()} glyphs: unrolled rows, word-at-a-time transparent skip.",
+        "",
+        "#ifndef OSD_BLIT_LOADERS",
+        "#define OSD_BLIT_LOADERS",
+        "static inline uint32_t osd_load32(const uint8_t *p) { uint32_t v; memcpy(&v, p, 4); return v; }",
+        "static inline uint16_t osd_load16(const uint8_t *p) { uint16_t v; memcpy(&v, p, 2); return v; }",
+        "#endif",
+        "",
+    ]
+    for dst in dsts:
+        lines.append(f"#ifndef OSD_BLIT_LUT_{dst.upper()}")
+        lines.append(f"#define OSD_BLIT_LUT_{dst.upper()}")
+        lines.extend(lut_function_lines(dst))
+        lines.append("#endif")
+        lines.append("")
+        if fmt == "i2":
+            lines.append(f"#ifndef OSD_BLIT_LUT_I2_{dst.upper()}")
+            lines.append(f"#define OSD_BLIT_LUT_I2_{dst.upper()}")
+            lines.extend(lut_i2_function_lines(dst))
+            lines.append("#endif")
+            lines.append("")
+        lines.extend(blit_function_lines(fmt, out_size, dst))
+    lines.append(f"#endif // {guard}")
+    return lines
+
+
+def write_blit_header(fmt, out_size, out_dir=None, dsts=tuple(DST_FORMATS)):
+    filename = f"font_blit_{fmt}_{out_size[0]}x{out_size[1]}.h"
+    if out_dir is not None:
+        filename = os.path.join(out_dir, filename)
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write("\n".join(blit_header_lines(fmt, out_size, dsts)))
+    return filename
+
+
+# ---------------- 主机侧测试 ----------------
+
+_REFERENCE_C = r"""
+/* Generic reference: runtime width/height, unpacks pixel by pixel. */
+static void ref_blit(PIX_T *dst, int stride, const uint8_t *src, const uint8_t *src2, int fmt, int w, int h,
+                     const PIX_T *lut, PIX_T c0, PIX_T c1)
+{
+    for (int y = 0; y < h; y++) {
+        for (int x = 0; x < w; x++) {
+            unsigned v;
+            if (fmt == 0) {
+                int i = y * w + x;
+                v = (i & 1) ? (src[i >> 1] & 0xF) : (src[i >> 1] >> 4);
+                if (v) dst[y * stride + x] = lut[v];
+            } else if (fmt == 1) {
+                v = (src[y * ((w + 3) / 4) + x / 4] >> (6 - 2 * (x % 4))) & 3;
+                if (v) dst[y * stride + x] = lut[v];
+            } else if (fmt == 2) {
+                int i = y * ((w + 7) / 8) + x / 8, bit = 0x80 >> (x % 8);
+                if (src[i] & bit) dst[y * stride + x] = c0;
+                else if (src2[i] & bit) dst[y * stride + x] = c1;
+            } else {
+                if (src[y * ((w + 7) / 8) + x / 8] & (0x80 >> (x % 8))) dst[y * stride + x] = c0;
+            }
+        }
+    }
+}
+"""
+
+
+def _c_array(name, data):
+    return f"static const uint8_t {name}[{max(len(data), 1)}] = {{ {', '.join(str(int(v)) for v in data) or '0'} }};"
+
+
+def harness_source(cells, fmt, out_size, dst, iterations):
+    """生成测试程序：校验专用函数与参考实现的输出一致，并分别计时"""
+    w, h = out_size
+    pix_t = DST_FORMATS[dst][0]
+    levels = distinct_levels(cells)
+    palette = build_palette(levels) if fmt == "i2" else None
+    planes = [encode_glyph(c, fmt, palette) for c in cells]
+    n = len(cells)
+    fmt_id = BLIT_FORMATS.index(fmt)
+    stride = w * n
+    lines = ["#include <stdio.h>", "#include <time.h>", f"#define PIX_T {pix_t}", '#include "blit.h"', _REFERENCE_C]
+    for i, p in enumerate(planes):
+        lines.append(_c_array(f"g{i}a", p[0]))
+        lines.append(_c_array(f"g{i}b", p[1] if len(p) > 1 else []))
+    lines.append(f"static const uint8_t *ga[{n}] = {{ {', '.join(f'g{i}a' for i in range(n))} }};")
+    lines.append(f"static const uint8_t *gb[{n}] = {{ {', '.join(f'g{i}b' for i in range(n))} }};")
+    if palette is not None:
+        # 通过生成的 osd_blit_lut_i2_* 构造 I2 查找表，一并校验该函数
+        lines.append(f"static const uint8_t palette[4] = {{ {', '.join(str(v) for v in palette)} }};")
+        palette_init = f"osd_blit_lut_i2_{dst}(lut, lut16, palette);"
+    else:
+        palette_init = "memcpy(lut, lut16, sizeof(lut16));"
+    name = blit_function_name(fmt, out_size, dst)
+    if fmt == "i1m":
+        fast_call = f"{name}(fb + i * {w}, {stride}, ga[i], gb[i], lut16[15], lut16[8])"
+    elif fmt == "i1":
+        fast_call = f"{name}(fb + i * {w}, {stride}, ga[i], lut16[15])"
+    else:
+        fast_call = f"{name}(fb + i * {w}, {stride}, ga[i], lut)"
+    ref_call = f"ref_blit(fb + i * {w}, {stride}, ga[i], gb[i], {fmt_id}, {w}, {h}, lut, lut16[15], lut16[8])"
+    lines.append(f"""
+static {pix_t} fb[{h} * {stride}], fb_ref[{h} * {stride}];
+
+static double now(void) {{ struct timespec t; clock_gettime(CLOCK_MONOTONIC, &t); return t.tv_sec + t.tv_nsec * 1e-9; }}
+
+int main(void)
+{{
+    {pix_t} lut16[16], lut[16];
+    osd_blit_lut_{dst}(lut16, 0xFFFFFFFFu, 0xFF202020u);
+    {palette_init}
+    for (int i = 0; i < {n}; i++) {ref_call};
+    memcpy(fb_ref, fb, sizeof(fb));
+    memset(fb, 0, sizeof(fb));
+    for (int i = 0; i < {n}; i++) {fast_call};
+    int mismatch = memcmp(fb, fb_ref, sizeof(fb)) != 0;
+
+    double t0 = now();
+    for (int k = 0; k < {iterations}; k++)
+        for (int i = 0; i < {n}; i++) {ref_call};
+    double t1 = now();
+    for (int k = 0; k < {iterations}; k++)
+        for (int i = 0; i < {n}; i++) {fast_call};
+    double t2 = now();
+    volatile {pix_t} sink = fb[{h // 2} * {stride} + {w // 2}];
+    (void)sink;
+    printf("%d %.3f %.3f\\n", mismatch, (t1 - t0) * 1e9 / ({iterations} * {n}), (t2 - t1) * 1e9 / ({iterations} * {n}));
+    return 0;
+}}
+""")
+    return "\n".join(lines)
+
+
+def benchmark(cells, fmt, out_size, dst, iterations=20000, cc="gcc", cflags=("-O2",)):
+    """编译并运行测试程序，返回 (结果一致, 参考 ns/字符, 专用 ns/字符)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "blit.h"), "w", encoding="utf-8") as f:
+            f.write("\n".join(blit_header_lines(fmt, out_size, (dst,))))
+        with open(os.path.join(tmp, "main.c"), "w", encoding="utf-8") as f:
+            f.write(harness_source(cells, fmt, out_size, dst, iterations))
+        exe = os.path.join(tmp, "bench")
+        subprocess.run([cc, *cflags, "-Wall", "-o", exe, os.path.join(tmp, "main.c")], check=True, cwd=tmp)
+        out = subprocess.run([exe], check=True, capture_output=True, text=True).stdout.split()
+    return out[0] == "0", float(out[1]), float(out[2])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="生成专用 C 绘制函数，并在主机上与通用解包循环对比")
+    parser.add_argument("--headers", type=str, nargs="*", default=None, help="I4 头文件列表，默认 font/font_chars_i4_*.h")
+    parser.add_argument("--formats", type=str, nargs="+", default=list(BLIT_FORMATS), choices=list(BLIT_FORMATS), help="字形数据格式")
+    parser.add_argument("--dst", type=str, nargs="+", default=list(DST_FORMATS), choices=list(DST_FORMATS), help="目标像素格式")
+    parser.add_argument("--iterations", type=int, default=20000, help="计时循环次数")
+    parser.add_argument("--cc", type=str, default="gcc", help="C 编译器")
+    parser.add_argument("--emit_dir", type=str, default=None, help="同时把生成的绘制头文件写入该目录")
+    args = parser.parse_args()
+
+    headers = args.headers if args.headers else sorted(glob.glob(os.path.join("font", "font_chars_i4_*.h")))
+    headers.sort(key=lambda p: [int(v) for v in re.findall(r"(\d+)x(\d+)", p)[-1]])
+    print(f"{'target':>7} {'format':>6} {'dst':>9} {'generic ns':>11} {'special ns':>11} {'speedup':>8}  check")
+    for path in headers:
+        header = load_header(path)
+        w, h = header.width, header.height
+        cells = list(header.cells)
+        for fmt in args.formats:
+            if not supports(fmt, (w, h)):
+                print(f"{w:>3}x{h:<3} {fmt:>6} ⚠️ 不支持（奇数宽度 I4 数据不按行对齐）")
+                continue
+            if args.emit_dir:
+                os.makedirs(args.emit_dir, exist_ok=True)
+                write_blit_header(fmt, (w, h), args.emit_dir, args.dst)
+            for dst in args.dst:
+                ok, ref_ns, fast_ns = benchmark(cells, fmt, (w, h), dst, args.iterations, args.cc)
+                print(f"{w:>3}x{h:<3} {fmt:>6} {dst:>9} {ref_ns:11.1f} {fast_ns:11.1f} {ref_ns / fast_ns:7.1f}x  {'✅' if ok else '❌ 输出不一致'}")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+字模数据去重
+- 字形级：打包后内容完全相同的字模数组（如多个空白字符）只保留一份定义，其余以 #define 别名指向它
+- 行级（仅 I4）：所有字形的行放入共享行字典，字形改存行索引，并生成 C 访问函数；
+  '0'、'1'、'8' 等字形的竖笔画在字形内、字形间大量重复
+- 适用于 osd.py 生成的任意逐字符数组格式，在打包之后、写出之前处理
+"""
+import numpy as np
+import re
+
+C_TYPE_BYTES = {"uint8_t": 1, "uint16_t": 2, "uint32_t": 4}
+DEDUP_MODES = ("none", "glyph", "rows")
+
+_ARRAY_START_RE = re.compile(r"static const (\w+) (char_\w+)\[(\d+)\] = \{$")
+
+
+def dedup_arrays(lines):
+    """合并内容相同的 char_* 数组，返回 (行列表, 节省字节数)"""
+    out = []
+    seen = {}
+    defined = set()
+    saved = 0
+
+    def emit(items):
+        # 连续的别名之后与后续内容之间保留一个空行（数组定义以 "};\n" 结尾，自带空行）
+        if out and out[-1].startswith("#define ") and items[0] and not items[0].startswith("#define "):
+            out.append("")
+        out.extend(items)
+
+    i = 0
+    while i < len(lines):
+        m = _ARRAY_START_RE.match(lines[i])
+        if not m:
+            emit(lines[i:i + 1])
+            i += 1
+            continue
+        end = i
+        while not lines[end].startswith("};"):
+            end += 1
+        c_type, name, count = m.groups()
+        key = (c_type, count, tuple(lines[i + 1:end]))
+        if name in defined:
+            # chars 中重复的字符：同名定义已输出，直接丢弃，不计入节省
+            pass
+        elif key in seen:
+            # 别名放在原定义位置，后面的表项仍按原名引用
+            emit([f"#define {name} {seen[key]}"])
+            saved += int(count) * C_TYPE_BYTES[c_type]
+        else:
+            seen[key] = name
+            emit(lines[i:end + 1])
+        defined.add(name)
+        i = end + 1
+    return out, saved
+
+
+def pack_i4_rows(levels):
+    """按行打包 I4（每行字节对齐，奇数宽度行尾补 0），返回 (h, stride) 的 uint8 数组"""
+    h, w = levels.shape
+    if w % 2:
+        levels = np.pad(levels, ((0, 0), (0, 1)))
+    levels = levels.astype(np.uint8)
+    return (levels[:, 0::2] << 4) | levels[:, 1::2]
+
+
+def build_row_dictionary(cells):
+    """返回 (行字典 (R, stride), 每字形行索引 (N, h))；行按首次出现顺序编号"""
+    rows = {}
+    indices = []
+    for cell in cells:
+        packed = pack_i4_rows(cell)
+        indices.append([rows.setdefault(r.tobytes(), len(rows)) for r in packed])
+    stride = (cells[0].shape[1] + 1) // 2 if cells else 0
+    dictionary = np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(rows), stride)
+    return dictionary, np.array(indices, dtype=np.int64).reshape(len(cells), -1)
+
+
+def row_index_type(row_count):
+    return "uint8_t" if row_count <= 0x100 else "uint16_t"
+
+
+def row_dict_header_lines(table_name, chars, cells, safe_char_name):
+    """生成行字典头文件主体：行字典、每字形行索引、索引表与访问函数"""
+    h, w = cells[0].shape
+    dictionary, indices = build_row_dictionary(cells)
+    stride = dictionary.shape[1]
+    idx_type = row_index_type(len(dictionary))
+    prefix = table_name.upper()
+    lines = [
+        f"// I4 row dictionary: {len(dictionary)} unique rows of {stride} bytes (rows byte-aligned, 2 pixels per byte);",
+        f"// each glyph stores {h} row indices. Use {table_name}_row() / {table_name}_unpack() to read glyphs.",
+        f"#define {prefix}_ROW_COUNT {len(dictionary)}",
+        f"#define {prefix}_ROW_STRIDE {stride}",
+        "",
+        f"static const uint8_t {table_name}_rows[{dictionary.size}] = {{",
+    ]
+    for row in dictionary:
+        lines.append("    " + ", ".join(f"0x{val:02X}" for val in row) + ",")
+    lines.append("};")
+    lines.append("")
+    names = []
+    for c, idx in zip(chars, indices):
+        name = f"char_{safe_char_name(c)}_{table_name}_rows"
+        names.append(name)
+        lines.append(f"static const {idx_type} {name}[{h}] = {{")
+        lines.append("    " + ", ".join(str(int(v)) for v in idx) + ",")
+        lines.append("};\n")
+    lines.append(f"static const {idx_type} *const {table_name}_glyph_rows[{len(chars)}] = {{")
+    lines.extend(f"    {name}," for name in names)
+    lines.append("};")
+    lines.append("")
+    lines.extend([
+        f"// Row y of glyph g: {stride} bytes of I4 data.",
+        f"static inline const uint8_t *{table_name}_row(int g, int y)",
+        "{",
+        f"    return &{table_name}_rows[{table_name}_glyph_rows[g][y] * {prefix}_ROW_STRIDE];",
+        "}",
+        "",
+        f"// Expand glyph g into dst ({h} rows x {stride} bytes).",
+        f"static inline void {table_name}_unpack(int g, uint8_t *dst)",
+        "{",
+        f"    for (int y = 0; y < {h}; y++) {{",
+        f"        const uint8_t *src = {table_name}_row(g, y);",
+        f"        for (int x = 0; x < {prefix}_ROW_STRIDE; x++)",
+        f"            *dst++ = src[x];",
+        "    }",
+        "}",
+        "",
+    ])
+    return lines
+
+
+def dedup_sizes(cells, ptr_size=4):
+    """
+    估算 I4 去重后的占用，返回 {"i4_dedup": (数据字节, 表字节), "i4_rows": (数据字节, 表字节)}。
+    i4_dedup 仍用 bitmap_i4_t 表；i4_rows 为行字典 + 去重后的行索引数组 + 指针表
+    """
+    if not cells:
+        return {"i4_dedup": (0, 0), "i4_rows": (0, 0)}
+    h, w = cells[0].shape
+    entry = 8 + ptr_size
+    unique_glyphs = len({c.tobytes() for c in cells})
+    dictionary, indices = build_row_dictionary(cells)
+    idx_bytes = C_TYPE_BYTES[row_index_type(len(dictionary))]
+    unique_indices = len({idx.tobytes() for idx in indices})
+    return {
+        "i4_dedup": (unique_glyphs * ((w * h + 1) // 2), len(cells) * entry),
+        "i4_rows": (dictionary.size + unique_indices * h * idx_bytes, len(cells) * ptr_size),
+    }
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+OSD 时间戳脏区更新工具
+- 基于 osd.py（或 ft2bitmap_gen.c）生成的 font_chars_i4_WxH.h 字模表
+- 比较前后两帧字符串，只输出发生变化的字符格 / 脏矩形
+- 模拟器统计每帧写入字节数，并与整串重绘对比
+"""
+from datetime import datetime, timedelta
+from collections import namedtuple
+import numpy as np
+import argparse
+
+from osd_header import load_header, unpack_i4_cells
+from osd import pack_i4
+
+# 一次 blit 操作：目标位置 (x, y)、尺寸 (w, h)、源字符及其字模内的起始行
+BlitOp = namedtuple("BlitOp", ["x", "y", "w", "h", "char", "src_row"])
+
+
+def load_i4_header(header_path):
+    """读取生成的 I4 头文件（osd.py 或 ft2bitmap_gen.c，见 osd_header），返回 (w, h, {char: levels[h, w]})"""
+    header = load_header(header_path)
+    return header.width, header.height, dict(zip(header.chars, header.cells))
+
+
+def cell_origin(index, cell_size, origin=(0, 0), spacing=0):
+    # 等宽布局：第 index 个字符格左上角坐标
+    w, _ = cell_size
+    return origin[0] + index * (w + spacing), origin[1]
+
+
+def _glyph(glyphs, c, cell_size):
+    g = glyphs.get(c)
+    if g is None:
+        # 缺字或超出字符串长度的格子按空白处理
+        g = glyphs.get(" ")
+    if g is None:
+        g = np.zeros((cell_size[1], cell_size[0]), dtype=np.uint8)
+    return g
+
+
+def diff_cells(prev, curr, glyphs, cell_size, origin=(0, 0), spacing=0, tight=True):
+    """
+    计算 prev -> curr 需要更新的 blit 操作。
+    tight=True 时，每个变化格只更新前后字模实际不同的行区间。
+    """
+    w, h = cell_size
+    ops = []
+    for i in range(max(len(prev), len(curr))):
+        a = prev[i] if i < len(prev) else None
+        b = curr[i] if i < len(curr) else " "
+        if a == b:
+            continue
+        old = _glyph(glyphs, a, cell_size) if a is not None else None
+        new = _glyph(glyphs, b, cell_size)
+        y0, y1 = 0, h
+        if tight and old is not None:
+            rows = np.flatnonzero(np.any(old != new, axis=1))
+            if rows.size == 0:
+                # 字模相同（例如都显示为空白），无需写入
+                continue
+            y0, y1 = int(rows[0]), int(rows[-1]) + 1
+        x, y = cell_origin(i, cell_size, origin, spacing)
+        ops.append(BlitOp(x, y + y0, w, y1 - y0, b, y0))
+    return ops
+
+
+def merge_dirty_rects(ops):
+    """把水平相邻的 blit 合并成脏矩形 (x, y, w, h)，适合整块 DMA 的 2D 引擎"""
+    rects = []
+    for op in sorted(ops, key=lambda o: o.x):
+        if rects:
+            x, y, rw, rh = rects[-1]
+            if x + rw == op.x:
+                ny0 = min(y, op.y)
+                ny1 = max(y + rh, op.y + op.h)
+                rects[-1] = (x, ny0, rw + op.w, ny1 - ny0)
+                continue
+        rects.append((op.x, op.y, op.w, op.h))
+    return rects
+
+
+def patch_buffer(op, glyphs, cell_size):
+    """生成某个 blit 对应的 I4 打包数据（只包含脏行）"""
+    g = _glyph(glyphs, op.char, cell_size)
+    return pack_i4(g[op.src_row : op.src_row + op.h])
+
+
+def op_bytes(op):
+    return (op.w * op.h + 1) // 2
+
+
+def render_full(text, glyphs, cell_size, fb, origin=(0, 0), spacing=0):
+    w, h = cell_size
+    for i, c in enumerate(text):
+        x, y = cell_origin(i, cell_size, origin, spacing)
+        fb[y : y + h, x : x + w] = _glyph(glyphs, c, cell_size)
+    return len(text) * ((w * h + 1) // 2)
+
+
+def apply_ops(ops, glyphs, cell_size, fb):
+    """与设备端相同，按 patch_buffer 打包出的 I4 数据写入帧缓冲，返回写入字节数"""
+    touched = 0
+    for op in ops:
+        patch = patch_buffer(op, glyphs, cell_size)
+        fb[op.y : op.y + op.h, op.x : op.x + op.w] = unpack_i4_cells(patch[np.newaxis], op.w, op.h)[0]
+        touched += len(patch)
+    return touched
+
+
+def simulate(frames, glyphs, cell_size, tight=True, verify=True):
+    """
+    逐帧模拟：返回每帧 (脏区字节数, 整串重绘字节数) 列表。
+    verify=True 时用整串重绘结果校验增量更新后的帧缓冲。
+    """
+    w, h = cell_size
+    max_len = max(len(s) for s in frames)
+    fb = np.zeros((h, max_len * w), dtype=np.uint8)
+    ref = np.zeros_like(fb)
+    stats = []
+    prev = ""
+    for text in frames:
+        ops = diff_cells(prev, text, glyphs, cell_size, tight=tight)
+        dirty = apply_ops(ops, glyphs, cell_size, fb)
+        ref[:] = 0
+        full = render_full(text, glyphs, cell_size, ref)
+        if verify and not np.array_equal(fb[:, : len(text) * w], ref[:, : len(text) * w]):
+            raise AssertionError(f"增量更新结果与整串重绘不一致: {prev!r} -> {text!r}")
+        stats.append((dirty, full))
+        prev = text
+    return stats
+
+
+def timestamp_frames(count, fmt="%Y-%m-%d %H:%M:%S", start=None, step=1):
+    start = start or datetime(2024, 12, 31, 23, 59, 0)
+    return [(start + timedelta(seconds=i * step)).strftime(fmt) for i in range(count)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OSD 时间戳脏区更新模拟器（统计每帧写入字节数）")
+    parser.add_argument("--header", type=str, required=True, help="osd.py 生成的 font_chars_i4_WxH.h")
+    parser.add_argument("--frames", type=int, default=3600, help="模拟帧数（每帧 1 秒）")
+    parser.add_argument("--format", type=str, default="%Y-%m-%d %H:%M:%S", help="时间戳格式（strftime）")
+    parser.add_argument("--prev", type=str, default=None, help="只比较两条字符串：前一帧")
+    parser.add_argument("--next", type=str, default=None, help="只比较两条字符串：后一帧")
+    parser.add_argument("--cell_only", action="store_true", help="按整格更新，不裁剪到脏行")
+    args = parser.parse_args()
+
+    w, h, glyphs = load_i4_header(args.header)
+    cell_size = (w, h)
+
+    if args.prev is not None and args.next is not None:
+        ops = diff_cells(args.prev, args.next, glyphs, cell_size, tight=not args.cell_only)
+        for op in ops:
+            print(f"blit '{op.char}' rows {op.src_row}..{op.src_row + op.h - 1} -> ({op.x}, {op.y}) {op.w}x{op.h}, {op_bytes(op)} bytes")
+        for rect in merge_dirty_rects(ops):
+            print(f"dirty rect: x={rect[0]} y={rect[1]} w={rect[2]} h={rect[3]}")
+        full = len(args.next) * ((w * h + 1) // 2)
+        print(f"✅ 写入 {sum(op_bytes(op) for op in ops)} bytes，整串重绘 {full} bytes")
+    else:
+        frames = timestamp_frames(args.frames, args.format)
+        stats = simulate(frames, glyphs, cell_size, tight=not args.cell_only)
+        # 第一帧必然整串绘制，不计入稳态统计
+        steady = stats[1:] or stats
+        dirty = sum(s[0] for s in steady)
+        full = sum(s[1] for s in steady)
+        print(f"字模 {w}x{h}，{len(frames)} 帧，格式 '{args.format}'")
+        print(f"平均每帧: 脏区 {dirty / len(steady):.1f} bytes，整串重绘 {full / len(steady):.1f} bytes")
+        print(f"最大单帧脏区: {max(s[0] for s in steady)} bytes")
+        print(f"✅ 带宽节省: {100.0 * (1 - dirty / full):.1f}%")
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+字体 Flash / RAM 占用分析
+- 读取生成的 I4 头文件，按多种存储格式估算：总字节、每字形字节、相对原始 I4 的压缩比、
+  每字符的估算绘制开销，以及绘制时所需的解码缓冲 RAM
+- 格式：原始 I4、裁剪 I4、RLE、I2 调色板、I1 主体+描边、I4 图集，以及字形级 / 行字典去重后的 I4
+- 可保存为 JSON 并与上一次构建的报告对比
+"""
+import numpy as np
+import argparse
+import glob
+import json
+import os
+
+from osd_dirty import load_i4_header
+from osd_atlas import crop_glyph, build_atlas, atlas_cell
+from osd_dedup import dedup_sizes
+from osd_formats import build_palette, distinct_levels, encode_glyph, decode_glyph
+
+REPORT_FORMATS = ("i4", "i4_crop", "rle", "i2", "i1m", "atlas", "i4_dedup", "i4_rows")
+# bitmap_i4_t / bitmap_i2_t：int width, int height, const uint8_t *pdata
+TABLE_INT_BYTES = 4
+# 裁剪格式每字形额外保存 dx, dy, w, h（各 1 字节）
+CROP_META_BYTES = 4
+# 图集矩形表每项 6 个 uint16
+ATLAS_RECT_BYTES = 12
+RLE_MAX_RUN = 16
+
+
+def rle_encode(levels):
+    """按行优先扫描的游程编码：每字节高 4 位为灰度级，低 4 位为 游程-1（最长 16）"""
+    flat = levels.reshape(-1)
+    if flat.size == 0:
+        return []
+    change = np.flatnonzero(np.diff(flat)) + 1
+    starts = np.concatenate([[0], change])
+    ends = np.concatenate([change, [flat.size]])
+    out = []
+    for s, e in zip(starts, ends):
+        level = int(flat[s])
+        run = int(e - s)
+        while run > 0:
+            n = min(run, RLE_MAX_RUN)
+            out.append((level << 4) | (n - 1))
+            run -= n
+    return out
+
+
+def rle_decode(data, w, h):
+    flat = np.concatenate([np.full((b & 0xF) + 1, b >> 4, dtype=np.uint8) for b in data]) if data else np.zeros(0, np.uint8)
+    return flat.reshape(h, w)
+
+
+def glyph_costs(levels, fmt, palette=None):
+    """单个字形：(数据字节, 绘制开销)。开销单位为“像素操作”：解码/写出一个像素或处理一个游程各计 1"""
+    h, w = levels.shape
+    if fmt == "i4":
+        return (w * h + 1) // 2, w * h
+    if fmt == "i4_crop":
+        g, _, _ = crop_glyph(levels)
+        gh, gw = g.shape
+        return (gw + 1) // 2 * gh, gw * gh
+    if fmt == "rle":
+        runs = rle_encode(levels)
+        # 透明游程直接跳过，只有非零像素需要写出
+        return len(runs), len(runs) + int(np.count_nonzero(levels))
+    planes = encode_glyph(levels, fmt, palette)
+    return sum(len(p) for p in planes), w * h * len(planes)
+
+
+def round_trip(levels, fmt, palette=None):
+    """按格式编码再解码，返回还原后的灰度级数组；与输入相同即为无损"""
+    h, w = levels.shape
+    if fmt == "rle":
+        return rle_decode(rle_encode(levels), w, h)
+    if fmt == "i4_crop":
+        g, dx, dy = crop_glyph(levels)
+        out = np.zeros_like(levels)
+        out[dy:dy + g.shape[0], dx:dx + g.shape[1]] = g
+        return out
+    return decode_glyph(encode_glyph(levels, fmt, palette), fmt, w, h, palette)
+
+
+def analyze_cells(cells, cell_size, ptr_size=4, stride_align=4):
+    """返回 {格式: 统计}；有损（灰度级超出格式容量）的格式会标记 lossless=False"""
+    w, h = cell_size
+    n = len(cells)
+    entry = 2 * TABLE_INT_BYTES + ptr_size
+    levels = distinct_levels(cells)
+    raw_total = n * ((w * h + 1) // 2 + entry)
+    report = {}
+    dedup = dedup_sizes(cells, ptr_size)
+    for fmt in REPORT_FORMATS:
+        if fmt in dedup:
+            data, meta = dedup[fmt]
+            # 去重后按字形平均分摊数据；访问时逐像素读取，与原始 I4 相同
+            per_glyph = [data / n] * n if n else []
+            ops = [w * h] * n
+            scratch = 0
+            # 去重只合并完全相同的字模 / 行，不改变内容
+            lossless = True
+        elif fmt == "atlas":
+            atlas, rects = build_atlas(cells, stride_align=stride_align)
+            data = atlas.shape[0] * atlas.shape[1] // 2
+            meta = n * ATLAS_RECT_BYTES + ptr_size
+            per_glyph = [(r[2] + 1) // 2 * r[3] for r in rects]
+            ops = [r[2] * r[3] for r in rects]
+            scratch = 0
+            lossless = all(np.array_equal(atlas_cell(atlas, r, cell_size), c) for r, c in zip(rects, cells))
+        else:
+            palette = None
+            if fmt == "i2":
+                # 超过 4 级时 i2 放不下，仍按同样的位深估算大小（报告中标为有损）
+                palette = build_palette(levels) if len([v for v in levels if v != 0]) <= 3 else [0] * 4
+            costs = [glyph_costs(c, fmt, palette) for c in cells]
+            per_glyph = [b for b, _ in costs]
+            ops = [o for _, o in costs]
+            data = sum(per_glyph)
+            meta = n * entry
+            if fmt == "i4_crop":
+                meta += n * CROP_META_BYTES
+            elif fmt == "i2":
+                meta += len(palette)
+            elif fmt == "i1m":
+                # bitmap_i1m_t 分别指向主体与描边两个平面
+                meta += n * ptr_size
+            lossless = all(np.array_equal(round_trip(c, fmt, palette), c) for c in cells)
+            # OSD 硬件按 I4 取数：需要先解码到一个字符格大小的 I4 缓冲
+            scratch = (w * h + 1) // 2 if fmt in ("rle", "i2", "i1m") else 0
+        total = data + meta
+        report[fmt] = {
+            "data_bytes": int(data),
+            "meta_bytes": int(meta),
+            "total_bytes": int(total),
+            "glyph_bytes_avg": float(np.mean(per_glyph)) if per_glyph else 0.0,
+            "glyph_bytes_max": int(np.ceil(max(per_glyph))) if per_glyph else 0,
+            "ratio": raw_total / total if total else 0.0,
+            "blit_ops_avg": float(np.mean(ops)) if ops else 0.0,
+            "scratch_ram": int(scratch),
+            "lossless": bool(lossless),
+        }
+    return report
+
+
+def analyze_headers(header_paths, ptr_size=4, stride_align=4):
+    """返回 {"WxH": {"glyphs": N, "formats": {...}}}"""
+    result = {}
+    for path in header_paths:
+        w, h, glyphs = load_i4_header(path)
+        cells = list(glyphs.values())
+        result[f"{w}x{h}"] = {
+            "header": os.path.basename(path),
+            "glyphs": len(cells),
+            "formats": analyze_cells(cells, (w, h), ptr_size, stride_align),
+        }
+    return result
+
+
+def _target_order(item):
+    return [int(v) for v in item[0].split("x")]
+
+
+def print_report(report, previous=None):
+    print(f"{'target':>7} {'format':>8} {'total':>8} {'data':>8} {'meta':>6} {'avg/gl':>7} {'max/gl':>7} {'ratio':>6} {'ops/ch':>7} {'ram':>5}  {'Δtotal' if previous else ''}")
+    for target, info in sorted(report.items(), key=_target_order):
+        for fmt, st in info["formats"].items():
+            delta = ""
+            if previous:
+                prev = previous.get(target, {}).get("formats", {}).get(fmt)
+                if prev is None:
+                    delta = "new"
+                else:
+                    d = st["total_bytes"] - prev["total_bytes"]
+                    delta = f"{d:+d} ({d / prev['total_bytes']:+.1%})" if prev["total_bytes"] else f"{d:+d}"
+            lossy = "" if st["lossless"] else " (有损)"
+            print(f"{target:>7} {fmt:>8} {st['total_bytes']:8d} {st['data_bytes']:8d} {st['meta_bytes']:6d} "
+                  f"{st['glyph_bytes_avg']:7.1f} {st['glyph_bytes_max']:7d} {st['ratio']:5.2f}x {st['blit_ops_avg']:7.0f} "
+                  f"{st['scratch_ram']:5d}  {delta}{lossy}")
+    if previous:
+        for target in sorted(set(previous) - set(report)):
+            print(f"{target:>7} ⚠️ 上一次报告中存在，本次已移除")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="分析生成字体在各存储格式下的 Flash / RAM 占用与绘制开销")
+    parser.add_argument("--headers", type=str, nargs="*", default=None, help="I4 头文件列表，默认 font/font_chars_i4_*.h")
+    parser.add_argument("--ptr_size", type=int, default=4, help="目标平台指针字节数")
+    parser.add_argument("--atlas_align", type=int, default=4, help="图集行跨度对齐字节数（0 或 1 表示不额外补齐，宽度仍取偶数像素）")
+    parser.add_argument("--json", type=str, default=None, help="将报告写入 JSON 文件")
+    parser.add_argument("--compare", type=str, default=None, help="与上一次构建的 JSON 报告对比")
+    args = parser.parse_args()
+
+    headers = args.headers if args.headers else sorted(glob.glob(os.path.join("font", "font_chars_i4_*.h")))
+    if not headers:
+        print("Error: 未找到 I4 头文件")
+        exit(1)
+    report = analyze_headers(headers, args.ptr_size, args.atlas_align)
+    previous = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+    print_report(report, previous)
+    for target, info in sorted(report.items(), key=_target_order):
+        best = min((st["total_bytes"], fmt) for fmt, st in info["formats"].items() if st["lossless"])
+        print(f"✅ {target}: 最小无损格式 {best[1]}（{best[0]} 字节）")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✅ 报告保存至: {args.json}")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+OSD 字形输出格式
+- i4 : 4bpp 灰度，每字节 2 像素（原有格式）
+- i2 : 2bpp 索引色 + 调色板，每字节 4 像素
+- i1m: 1bpp 主体平面 + 1bpp 描边平面
+- i1 : 1bpp 单平面（仅两级灰度时）
+每行按字节对齐，高位在前。
+"""
+import numpy as np
+
+FORMATS = ("i4", "i2", "i1m", "i1")
+
+# 每种格式的每像素位数（i1m 为两个 1bpp 平面）
+FORMAT_BPP = {"i4": 4, "i2": 2, "i1m": 2, "i1": 1}
+
+
+def distinct_levels(cells):
+    if len(cells) == 0:
+        return []
+    return [int(v) for v in np.unique(np.concatenate([np.ravel(c) for c in cells]))]
+
+
+def choose_format(levels):
+    """根据实际用到的灰度级数自动选择最小位深"""
+    if len(levels) <= 2:
+        return "i1"
+    if len(levels) <= 4:
+        return "i2"
+    return "i4"
+
+
+def build_palette(levels):
+    # 透明色（0x0）固定为索引 0
+    palette = [0] + [v for v in levels if v != 0]
+    if len(palette) > 4:
+        # 索引超出 2 位会把相邻像素的数据打乱
+        raise ValueError(f"i2 调色板最多 4 级灰度（含透明），实际需要 {len(palette)} 级: {[hex(v) for v in levels]}")
+    return palette + [0] * (4 - len(palette))
+
+
+def pack_bits(values, bpp):
+    """按行打包 (h, w) 的小整数数组，每行补齐到整字节"""
+    h, w = values.shape
+    per_byte = 8 // bpp
+    padded_w = (w + per_byte - 1) // per_byte * per_byte
+    padded = np.zeros((h, padded_w), dtype=np.uint8)
+    padded[:, :w] = values
+    groups = padded.reshape(h, padded_w // per_byte, per_byte)
+    shifts = np.arange(per_byte - 1, -1, -1, dtype=np.uint8) * bpp
+    return (groups << shifts).sum(axis=2, dtype=np.uint16).astype(np.uint8).reshape(-1)
+
+
+def unpack_bits(data, bpp, w, h):
+    per_byte = 8 // bpp
+    stride = (w + per_byte - 1) // per_byte
+    data = np.asarray(data, dtype=np.uint8).reshape(h, stride)
+    shifts = np.arange(per_byte - 1, -1, -1, dtype=np.uint8) * bpp
+    values = (data[:, :, None] >> shifts) & ((1 << bpp) - 1)
+    return values.reshape(h, stride * per_byte)[:, :w].astype(np.uint8)
+
+
+def encode_glyph(levels, fmt, palette=None):
+    """
+    将 I4 灰度级数组编码为指定格式。
+    返回平面列表：i1m 为 [主体, 描边]，其余为单个平面。
+    """
+    if fmt == "i4":
+        return [pack_bits(levels, 4)]
+    if fmt == "i2":
+        lut = np.zeros(16, dtype=np.uint8)
+        for idx, v in enumerate(palette):
+            if v != 0:
+                lut[v] = idx
+        return [pack_bits(lut[levels], 2)]
+    if fmt == "i1m":
+        body = levels == 0xF
+        outline = (levels != 0) & ~body
+        return [pack_bits(body.astype(np.uint8), 1), pack_bits(outline.astype(np.uint8), 1)]
+    if fmt == "i1":
+        return [pack_bits((levels != 0).astype(np.uint8), 1)]
+    raise ValueError(f"未知输出格式: {fmt}")
+
+
+def decode_glyph(planes, fmt, w, h, palette=None, on_level=0xF):
+    """encode_glyph 的逆过程，返回 I4 灰度级数组（用于预览与校验）"""
+    if fmt == "i4":
+        return unpack_bits(planes[0], 4, w, h)
+    if fmt == "i2":
+        return np.array(palette, dtype=np.uint8)[unpack_bits(planes[0], 2, w, h)]
+    if fmt == "i1m":
+        body = unpack_bits(planes[0], 1, w, h).astype(bool)
+        outline = unpack_bits(planes[1], 1, w, h).astype(bool)
+        levels = np.zeros((h, w), dtype=np.uint8)
+        levels[outline] = 0x8
+        levels[body] = 0xF
+        return levels
+    if fmt == "i1":
+        return unpack_bits(planes[0], 1, w, h) * np.uint8(on_level)
+    raise ValueError(f"未知输出格式: {fmt}")
+
+
+def format_header_lines(chars, cells, fmt, out_size, safe_char_name, palette=None, on_level=0xF):
+    """生成指定格式的字模数组与 bitmap_<fmt>_t 表"""
+    w, h = out_size
+    bpp = 1 if fmt in ("i1m", "i1") else FORMAT_BPP[fmt]
+    stride = (w * bpp + 7) // 8
+    lines = []
+    if fmt == "i2":
+        lines.append("// 2bpp palette: index -> I4 level.")
+        lines.append(f"static const uint8_t i2_{w}x{h}_palette[4] = {{ {', '.join(f'0x{v:X}' for v in palette)} }};")
+        lines.append("")
+    elif fmt == "i1":
+        lines.append(f"#define I1_{w}x{h}_ON_LEVEL 0x{on_level:X}")
+        lines.append("")
+
+    plane_names = ["body", "outline"] if fmt == "i1m" else [None]
+    entries = []
+    for c, cell in zip(chars, cells):
+        planes = encode_glyph(cell, fmt, palette)
+        names = []
+        for plane_name, data in zip(plane_names, planes):
+            name = f"char_{safe_char_name(c)}_{w}x{h}_{fmt}" + (f"_{plane_name}" if plane_name else "")
+            names.append(name)
+            lines.append(f"static const uint8_t {name}[{len(data)}] = {{")
+            for i in range(0, len(data), stride):
+                lines.append("    " + ", ".join(f"0x{val:02X}" for val in data[i:i + stride]) + ",")
+            lines.append("};\n")
+        if fmt == "i1m":
+            entries.append(f"    {{ .width = {w}, .height = {h}, .pbody = {names[0]}, .poutline = {names[1]} }},")
+        else:
+            entries.append(f"    {{ .width = {w}, .height = {h}, .pdata = {names[0]} }},")
+    lines.append(f"static const bitmap_{fmt}_t {fmt}_{w}x{h}[{len(chars)}] = {{")
+    lines.extend(entries)
+    lines.append("};")
+    lines.append("")
+    return lines
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+生成头文件的快速读取与对比
+- load_header 解析两种 I4 头文件，直接得到 (N, h, w) 灰度级数组，无需原字体与生成参数：
+  osd.py 输出（char_<safe>_WxH_i4[N]，含 --dedup glyph 的 #define 别名与 --dedup rows 的行字典；
+  --split_c 时读取 .c）与 fontgen_generator/ft2bitmap_gen.c 输出（char_<HEX>_WxH_i4[]，每行补齐到偶数宽度）
+- 分词：整个文件作为字节数组一次性定位全部 0xHH 并查表解码，各数组按正文区间切片，不逐个调用 int()
+- 对比两组头文件：逐字形统计像素差异，输出 旧 / 新 / 差异 三行对比图（红色为不同像素）
+"""
+from collections import namedtuple
+from PIL import Image
+import numpy as np
+import argparse
+import glob
+import json
+import re
+import os
+
+FontHeader = namedtuple("FontHeader", "path flavor width height chars cells")
+# status: same / changed / added / removed / resized；pixels 为不同像素数，max_delta 为最大灰度级差
+GlyphDiff = namedtuple("GlyphDiff", "char status pixels max_delta")
+
+# 各模式以字面量开头，re 可先做子串查找；数组正文的结尾用 bytes.find 定位，避免惰性匹配逐字符回溯
+_ARRAY_RE = re.compile(rb"const\s+uint(?:8|16|32)_t\s+(\w+)\[\d*\]\s*=\s*\{")
+_ALIAS_RE = re.compile(rb"#define[ \t]+(char_\w+)[ \t]+(char_\w+)[ \t]*$", re.M)
+_TABLE_RE = re.compile(rb"const\s+bitmap_i4_t\s+i4_\d+x\d+\[\d*\]\s*=\s*\{(.*?)\};", re.S)
+_GLYPH_ROWS_RE = re.compile(rb"const\s+uint8_t\s*\*\s*const\s+\w+_glyph_rows\[\d*\]\s*=\s*\{(.*?)\};", re.S)
+_NAME_RE = re.compile(rb"char_\w+")
+_I4_NAME_RE = re.compile(r"char_(\w+?)_(\d+)x(\d+)_i4$")
+_ROWS_NAME_RE = re.compile(r"char_(\w+?)_i4_(\d+)x(\d+)_rows$")
+
+_HEX_LUT = np.zeros(256, dtype=np.uint8)
+for _i, _c in enumerate(b"0123456789ABCDEF"):
+    _HEX_LUT[_c] = _i
+    _HEX_LUT[_c | 0x20] = _i
+
+
+def _char_from_name(name, flavor):
+    """
+    字模数组名中的字符：osd.py 为原字符或 u + 至少四位十六进制码（safe_char_name），
+    ft2bitmap_gen.c 为至少两位十六进制码（%02X），码位更大时位数随之增加
+    """
+    if flavor == "ft2bitmap_gen":
+        return chr(int(name, 16))
+    if len(name) > 1 and name[0] == "u":
+        return chr(int(name[1:], 16))
+    return name
+
+
+def _hex_tokens(buf):
+    """返回 (位置, 值)：buf 中每个 0xHH 的起始偏移及其字节值"""
+    pos = np.flatnonzero((buf[:-3] == ord("0")) & ((buf[1:-2] | 0x20) == ord("x")))
+    return pos, (_HEX_LUT[buf[pos + 2]] << 4) | _HEX_LUT[buf[pos + 3]]
+
+
+def unpack_i4_cells(data, w, h):
+    """(N, L) 的 I4 字节 -> (N, h, w)；L 为 ceil(w/2)*h 时按行补齐解释（ft2bitmap_gen.c），否则按连续像素流"""
+    n, length = data.shape
+    levels = np.empty((n, length * 2), dtype=np.uint8)
+    levels[:, 0::2] = data >> 4
+    levels[:, 1::2] = data & 0xF
+    if w % 2 and length == (w + 1) // 2 * h:
+        return levels.reshape(n, h, w + 1)[:, :, :w]
+    return levels[:, :w * h].reshape(n, h, w)
+
+
+def load_header(path):
+    """读取生成的 I4 头文件，返回 FontHeader（chars 按字模表顺序，cells 为 (N, h, w) uint8）"""
+    with open(path, "rb") as f:
+        text = f.read()
+    pos, values = _hex_tokens(np.frombuffer(text, dtype=np.uint8))
+
+    def hex_bytes(span):
+        lo, hi = np.searchsorted(pos, span)
+        return values[lo:hi]
+
+    arrays = {m.group(1).decode(): (m.end(), text.find(b"};", m.end())) for m in _ARRAY_RE.finditer(text)}
+    aliases = {a.decode(): t.decode() for a, t in _ALIAS_RE.findall(text)}
+    flavor = "ft2bitmap_gen" if b"Auto-generated font data" in text else "osd"
+
+    def resolve(name):
+        while name in aliases:
+            name = aliases[name]
+        return name
+
+    table = _TABLE_RE.search(text) or _GLYPH_ROWS_RE.search(text)
+    if table:
+        names = [n.decode() for n in _NAME_RE.findall(table.group(1))]
+    else:
+        names = list(arrays) + list(aliases)
+
+    glyphs = [(m, name) for name in names for m in [_I4_NAME_RE.match(name) or _ROWS_NAME_RE.match(name)] if m]
+    glyphs = [(m, name) for m, name in glyphs if resolve(name) in arrays]
+    if not glyphs:
+        raise ValueError(f"{path}: 未找到 I4 字模数组")
+    w, h = int(glyphs[0][0].group(2)), int(glyphs[0][0].group(3))
+    glyphs = [(m, name) for m, name in glyphs if (int(m.group(2)), int(m.group(3))) == (w, h)]
+    chars = "".join(_char_from_name(m.group(1), flavor) for m, _ in glyphs)
+
+    if glyphs[0][1].endswith("_rows"):
+        # 行字典：共享行表 + 每字形 h 个行索引（十进制）
+        table_name = f"i4_{w}x{h}_rows"
+        stride = (w + 1) // 2
+        rows = unpack_i4_cells(hex_bytes(arrays[table_name]).reshape(-1, stride), w, 1)[:, 0]
+        index = np.stack([
+            np.array(re.findall(rb"\d+", text[slice(*arrays[resolve(name)])]), dtype=np.int64) for _, name in glyphs
+        ])
+        cells = rows[index]
+    else:
+        cells = unpack_i4_cells(np.stack([hex_bytes(arrays[resolve(name)]) for _, name in glyphs]), w, h)
+    return FontHeader(path, flavor, w, h, chars, cells)
+
+
+def diff_glyphs(old, new):
+    """逐字形比较两个 FontHeader，按 old 的字符顺序（新增字符在后）返回 GlyphDiff 列表"""
+    old_cells = dict(zip(old.chars, old.cells))
+    new_cells = dict(zip(new.chars, new.cells))
+    diffs = []
+    for c in dict.fromkeys(old.chars + new.chars):
+        a, b = old_cells.get(c), new_cells.get(c)
+        if b is None:
+            diffs.append(GlyphDiff(c, "removed", None, None))
+        elif a is None:
+            diffs.append(GlyphDiff(c, "added", None, None))
+        elif a.shape != b.shape:
+            diffs.append(GlyphDiff(c, "resized", None, None))
+        else:
+            delta = np.abs(a.astype(np.int16) - b)
+            pixels = int(np.count_nonzero(delta))
+            diffs.append(GlyphDiff(c, "changed" if pixels else "same", pixels, int(delta.max())))
+    return diffs
+
+
+def diff_image(old, new, diffs, scale=4, margin=2):
+    """三行对比图：旧、新、差异（相同像素按新灰度显示，不同像素标红）；缺失或尺寸不同的字形留空"""
+    old_cells = dict(zip(old.chars, old.cells))
+    new_cells = dict(zip(new.chars, new.cells))
+    w, h = max(old.width, new.width), max(old.height, new.height)
+    img = np.zeros((3 * (h + margin) + margin, len(diffs) * (w + margin) + margin, 3), dtype=np.uint8)
+    img[:] = (30, 30, 30)
+    for i, d in enumerate(diffs):
+        x = margin + i * (w + margin)
+        for row, cell in enumerate((old_cells.get(d.char), new_cells.get(d.char))):
+            if cell is not None:
+                y = margin + row * (h + margin)
+                img[y:y + cell.shape[0], x:x + cell.shape[1]] = (cell * 17)[..., None]
+        if d.pixels is not None:
+            a, b = old_cells[d.char], new_cells[d.char]
+            gray = (b * 17).astype(np.uint8)
+            rgb = np.stack([gray, gray, gray], axis=-1)
+            rgb[a != b] = (255, 0, 0)
+            y = margin + 2 * (h + margin)
+            img[y:y + b.shape[0], x:x + b.shape[1]] = rgb
+    out = Image.fromarray(img, mode="RGB")
+    return out.resize((out.width * scale, out.height * scale), Image.NEAREST)
+
+
+def pair_headers(old, new):
+    """old/new 为文件时直接配对；为目录时按文件名配对其中的 .h/.c，返回 (配对列表, 仅旧, 仅新)"""
+    if not os.path.isdir(old) and not os.path.isdir(new):
+        return [(old, new)], [], []
+    old_names = {os.path.basename(p) for p in glob.glob(os.path.join(old, "*.[hc]"))}
+    new_names = {os.path.basename(p) for p in glob.glob(os.path.join(new, "*.[hc]"))}
+    pairs = [(os.path.join(old, n), os.path.join(new, n)) for n in sorted(old_names & new_names)]
+    return pairs, sorted(old_names - new_names), sorted(new_names - old_names)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="读取生成的 I4 头文件并逐字形对比两组构建结果")
+    parser.add_argument("--old", type=str, required=True, help="旧头文件或目录")
+    parser.add_argument("--new", type=str, default=None, help="新头文件或目录（省略时只读取 --old 并输出字形预览）")
+    parser.add_argument("--diff_dir", type=str, default="previews/header_diff", help="差异图 / 预览图保存目录")
+    parser.add_argument("--scale", type=int, default=4, help="图片放大倍数")
+    parser.add_argument("--json", type=str, default=None, help="将逐字形差异写入 JSON 文件")
+    parser.add_argument("--fail_on_diff", type=int, default=0, choices=[0,1], help="存在差异时以非零状态退出")
+    args = parser.parse_args()
+
+    os.makedirs(args.diff_dir, exist_ok=True)
+    if args.new is None:
+        paths = sorted(glob.glob(os.path.join(args.old, "*.[hc]"))) if os.path.isdir(args.old) else [args.old]
+        for path in paths:
+            try:
+                header = load_header(path)
+            except ValueError as e:
+                print(f"⚠️ {e}")
+                continue
+            preview = diff_image(header, header, [GlyphDiff(c, "same", None, None) for c in header.chars], args.scale)
+            preview = preview.crop((0, 0, preview.width, preview.height // 3))
+            save_path = os.path.join(args.diff_dir, os.path.splitext(os.path.basename(path))[0] + ".png")
+            preview.save(save_path)
+            print(f"✅ {path}: {header.flavor} {header.width}x{header.height} {len(header.chars)} 个字形 {header.chars!r}，预览: {save_path}")
+        exit(0)
+
+    pairs, only_old, only_new = pair_headers(args.old, args.new)
+    for name in only_old:
+        print(f"⚠️ 仅存在于旧构建: {name}")
+    for name in only_new:
+        print(f"⚠️ 仅存在于新构建: {name}")
+    report = {}
+    changed_total = 0
+    for old_path, new_path in pairs:
+        try:
+            old, new = load_header(old_path), load_header(new_path)
+        except ValueError as e:
+            print(f"⚠️ {e}")
+            continue
+        diffs = diff_glyphs(old, new)
+        changed = [d for d in diffs if d.status != "same"]
+        changed_total += len(changed)
+        name = os.path.basename(new_path)
+        report[name] = [d._asdict() for d in diffs]
+        if not changed:
+            print(f"✅ {name}: {len(diffs)} 个字形完全一致")
+            continue
+        pixels = sum(d.pixels or 0 for d in changed)
+        save_path = os.path.join(args.diff_dir, os.path.splitext(name)[0] + "_diff.png")
+        diff_image(old, new, diffs, args.scale).save(save_path)
+        print(f"🔍 {name}: {len(changed)}/{len(diffs)} 个字形有差异，共 {pixels} 像素，差异图: {save_path}")
+        for d in changed:
+            detail = f"{d.pixels} 像素，最大灰度差 {d.max_delta}" if d.pixels is not None else d.status
+            print(f"    {d.char!r}: {detail}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.fail_on_diff and (changed_total or only_old or only_new):
+        exit(1)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+设备叠加层像素格式
+- 在生成阶段把量化后的 I4 字形一次性转换为编码器 OSD 叠加层的原生像素格式，
+  设备端绘制只需 memcpy / DMA，无需逐帧逐像素查表转换
+- 注册表：ARGB1555、ARGB4444、ARGB8888、AYUV（BT.601 有限范围）、CLUT8（8 位索引 + ARGB8888 调色板）
+- 灰度级到颜色的映射与 osd_blit 生成的查找表一致：1~8 为描边色（透明度递增），9~15 由描边色过渡到主体色
+"""
+from collections import namedtuple
+import numpy as np
+
+# c_type: 数组元素类型；pack: (N, 4) 的 ARGB 通道 -> 像素值数组
+PixelFormat = namedtuple("PixelFormat", "name c_type bytes_per_pixel description pack")
+
+DEFAULT_BODY_COLOR = 0xFFFFFFFF
+DEFAULT_OUTLINE_COLOR = 0xFF888888
+
+
+def level_colors(body=DEFAULT_BODY_COLOR, outline=DEFAULT_OUTLINE_COLOR):
+    """返回 (16, 4) 的 uint8 数组：每个 I4 灰度级对应的 A/R/G/B"""
+    cb = np.array([(body >> s) & 0xFF for s in (24, 16, 8, 0)], dtype=np.int32)
+    co = np.array([(outline >> s) & 0xFF for s in (24, 16, 8, 0)], dtype=np.int32)
+    lut = np.zeros((16, 4), dtype=np.int32)
+    for level in range(1, 16):
+        if level <= 8:
+            lut[level] = co
+            lut[level, 0] = co[0] * level // 8
+        else:
+            # 与 C 版一致：整数除法向零取整
+            lut[level] = co + np.trunc((cb - co) * (level - 8) / 7).astype(np.int32)
+    return lut.astype(np.uint8)
+
+
+def _channels(argb):
+    return [argb[..., i].astype(np.uint32) for i in range(4)]
+
+
+def _pack_argb8888(argb):
+    a, r, g, b = _channels(argb)
+    return (a << 24) | (r << 16) | (g << 8) | b
+
+
+def _pack_argb1555(argb):
+    a, r, g, b = _channels(argb)
+    return (((a >= 128).astype(np.uint32) << 15) | ((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)).astype(np.uint16)
+
+
+def _pack_argb4444(argb):
+    a, r, g, b = _channels(argb)
+    return (((a >> 4) << 12) | ((r >> 4) << 8) | ((g >> 4) << 4) | (b >> 4)).astype(np.uint16)
+
+
+def _pack_ayuv(argb):
+    """BT.601 有限范围（Y 16~235，UV 16~240），按 0xAAYYUUVV 存放"""
+    a = argb[..., 0].astype(np.uint32)
+    r, g, b = (argb[..., i].astype(np.float64) for i in (1, 2, 3))
+    y = np.round(16 + (65.738 * r + 129.057 * g + 25.064 * b) / 256)
+    u = np.round(128 + (-37.945 * r - 74.494 * g + 112.439 * b) / 256)
+    v = np.round(128 + (112.439 * r - 94.154 * g - 18.285 * b) / 256)
+    y, u, v = (np.clip(c, 0, 255).astype(np.uint32) for c in (y, u, v))
+    return (a << 24) | (y << 16) | (u << 8) | v
+
+
+PIXEL_FORMATS = {
+    "argb1555": PixelFormat("argb1555", "uint16_t", 2, "16bpp ARGB1555 (1-bit alpha)", _pack_argb1555),
+    "argb4444": PixelFormat("argb4444", "uint16_t", 2, "16bpp ARGB4444", _pack_argb4444),
+    "argb8888": PixelFormat("argb8888", "uint32_t", 4, "32bpp ARGB8888", _pack_argb8888),
+    "ayuv": PixelFormat("ayuv", "uint32_t", 4, "32bpp AYUV 0xAAYYUUVV, BT.601 limited range", _pack_ayuv),
+    "clut8": PixelFormat("clut8", "uint8_t", 1, "8bpp palette index into clut8_{w}x{h}_palette (ARGB8888)", None),
+}
+
+
+def clut8_palette(levels, body=DEFAULT_BODY_COLOR, outline=DEFAULT_OUTLINE_COLOR):
+    """CLUT8 调色板：索引 0 固定为透明，其余按实际用到的灰度级排列；返回 (ARGB8888 列表, 灰度级 -> 索引表)"""
+    colors = _pack_argb8888(level_colors(body, outline))
+    used = [v for v in levels if v != 0]
+    index = np.zeros(16, dtype=np.uint8)
+    for i, v in enumerate(used, start=1):
+        index[v] = i
+    return [0] + [int(colors[v]) for v in used], index
+
+
+def convert_cells(cells, fmt, body=DEFAULT_BODY_COLOR, outline=DEFAULT_OUTLINE_COLOR, levels=None):
+    """把 (h, w) 灰度级字符格批量转换为目标像素格式；返回 (像素数组列表, CLUT8 调色板或 None)"""
+    stack = np.stack(cells)
+    if fmt == "clut8":
+        if levels is None:
+            levels = sorted(int(v) for v in np.unique(stack))
+        palette, index = clut8_palette(levels, body, outline)
+        return list(index[stack]), palette
+    pixels = PIXEL_FORMATS[fmt].pack(level_colors(body, outline)[stack])
+    # 灰度级 0 为完全透明，统一写 0，便于设备端按 0 判断透明
+    pixels[stack == 0] = 0
+    return list(pixels), None
+
+
+def pixel_format_description(fmt, out_size):
+    w, h = out_size
+    return f"// {fmt.upper()} Font: {PIXEL_FORMATS[fmt].description.format(w=w, h=h)}, 0 = transparent. Size {w}x{h}, ready for memcpy/DMA."
+
+
+def pixel_format_header_lines(chars, cells, fmt, out_size, safe_char_name, body=DEFAULT_BODY_COLOR, outline=DEFAULT_OUTLINE_COLOR):
+    """生成预转换像素数组与 bitmap_<fmt>_t 表，返回 (行列表, 数据总字节数)"""
+    w, h = out_size
+    spec = PIXEL_FORMATS[fmt]
+    digits = spec.bytes_per_pixel * 2
+    pixels, palette = convert_cells(cells, fmt, body, outline)
+    lines = [f"// body color 0x{body:08X}, outline color 0x{outline:08X}"]
+    if palette is not None:
+        lines.append(f"static const uint32_t clut8_{w}x{h}_palette[{len(palette)}] = {{ {', '.join(f'0x{v:08X}' for v in palette)} }};")
+    lines.append("")
+    entries = []
+    for c, data in zip(chars, pixels):
+        name = f"char_{safe_char_name(c)}_{w}x{h}_{fmt}"
+        entries.append(f"    {{ .width = {w}, .height = {h}, .pdata = {name} }},")
+        lines.append(f"static const {spec.c_type} {name}[{w * h}] = {{")
+        for row in data:
+            lines.append("    " + ", ".join(f"0x{int(v):0{digits}X}" for v in row) + ",")
+        lines.append("};\n")
+    lines.append(f"static const bitmap_{fmt}_t {fmt}_{w}x{h}[{len(chars)}] = {{")
+    lines.extend(entries)
+    lines.append("};")
+    lines.append("")
+    return lines, len(chars) * w * h * spec.bytes_per_pixel
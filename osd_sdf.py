@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SDF（有向距离场）母版字形
+- 每个字符只在高分辨率下渲染一次，转换为有向距离场并缓存到磁盘
+- 8x16 ~ 48x96 各尺寸、任意描边宽度的 I4 输出均由母版重采样 + 阈值得到，无需重新栅格化
+- 也可直接输出 SDF 本身，供运行时缩放文字的设备使用
+"""
+from scipy.ndimage import distance_transform_edt, map_coordinates
+from types import SimpleNamespace
+import numpy as np
+import freetype
+import argparse
+import hashlib
+import os
+
+from osd import (
+    get_small_size_var_coords, glyph_placement, safe_char_name,
+    export_chars_black_white_gray_i4_header, generate_preview_image,
+)
+from osd_formats import FORMATS
+from font_scan import font_hash
+from ft_bitmap import bitmap_array
+from osd_axes import apply_var_coords, var_coords_key
+
+MASTER_PIXEL_SIZE = 256
+# 主体阈值偏移（目标像素）：原流程以覆盖率 > 10/255 判定主体，比 50% 轮廓略粗
+BODY_BIAS = 0.35
+SDF_CACHE_DIR = ".sdf_cache"
+
+
+def _cache_path(cache_dir, digest, var_coords, master_px, char):
+    key = f"{digest}|{var_coords_key(var_coords)}|{master_px}|{ord(char)}"
+    return os.path.join(cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".npz")
+
+
+def _master_face(font_path, var_coords, master_px):
+    face = freetype.Face(font_path)
+    try:
+        apply_var_coords(face, var_coords)
+    except Exception as e:
+        print(f"⚠️ 设置变量字体轴值失败: {e}")
+    face.set_pixel_sizes(0, master_px)
+    return face
+
+
+def render_master(face, char, master_px):
+    """在母版分辨率下渲染字符并计算有向距离场（内部为正，单位：母版像素）"""
+    face.load_char(char, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_NORMAL)
+    glyph = face.glyph
+    bitmap = glyph.bitmap
+    pad = master_px // 4
+    arr = bitmap_array(bitmap)
+    mask = np.zeros((bitmap.rows + 2 * pad, bitmap.width + 2 * pad), dtype=bool)
+    mask[pad:pad + bitmap.rows, pad:pad + bitmap.width] = arr > 127
+    if mask.any():
+        sdf = distance_transform_edt(mask) - distance_transform_edt(~mask)
+    else:
+        sdf = np.full(mask.shape, -float(pad))
+    return {
+        "sdf": sdf.astype(np.float16),
+        "pad": pad,
+        "width": bitmap.width,
+        "rows": bitmap.rows,
+        "left": glyph.bitmap_left,
+        "top": glyph.bitmap_top,
+        "advance": glyph.advance.x,
+    }
+
+
+def load_masters(chars, font_path, var_coords=None, master_px=MASTER_PIXEL_SIZE, cache_dir=SDF_CACHE_DIR):
+    """读取（或生成并缓存）字符集的 SDF 母版；返回 ({char: master}, 新渲染数量)"""
+    digest = font_hash(font_path)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    masters = {}
+    face = None
+    rendered = 0
+    for c in chars:
+        if c in masters:
+            continue
+        path = _cache_path(cache_dir, digest, var_coords, master_px, c) if cache_dir else None
+        if path and os.path.exists(path):
+            with np.load(path) as data:
+                masters[c] = {k: (data[k] if k == "sdf" else int(data[k])) for k in data.files}
+            continue
+        if face is None:
+            face = _master_face(font_path, var_coords, master_px)
+        masters[c] = render_master(face, c, master_px)
+        rendered += 1
+        if path:
+            np.savez_compressed(path, **masters[c])
+    return masters, rendered
+
+
+def _scaled_glyph(master, scale):
+    # 构造与 FreeType glyph 同形的对象，复用 osd.glyph_placement 的居中规则
+    return SimpleNamespace(
+        bitmap=SimpleNamespace(width=int(round(master["width"] * scale)), rows=int(round(master["rows"] * scale))),
+        bitmap_left=int(round(master["left"] * scale)),
+        bitmap_top=int(round(master["top"] * scale)),
+        advance=SimpleNamespace(x=master["advance"] * scale),
+    )
+
+
+def sample_distance(master, char, out_size, font_pixel_size, master_px=MASTER_PIXEL_SIZE):
+    """把母版 SDF 重采样到目标字符格，返回以目标像素为单位的有向距离 (h, w)"""
+    w, h = out_size
+    scale = font_pixel_size / master_px
+    offset_x, offset_y = glyph_placement(char, _scaled_glyph(master, scale), out_size)
+    ys, xs = np.mgrid[0:h, 0:w].astype(np.float32)
+    # 目标像素中心 -> 母版坐标
+    mx = (xs + 0.5 - offset_x) / scale - 0.5 + master["pad"]
+    my = (ys + 0.5 - offset_y) / scale - 0.5 + master["pad"]
+    sdf = master["sdf"].astype(np.float32)
+    far = -float(master["pad"])
+    d = map_coordinates(sdf, [my, mx], order=1, mode="constant", cval=far)
+    return d * scale
+
+
+def levels_from_distance(d, outline_width):
+    """阈值化得到 I4 灰度级：主体 0xF，描边 0x8"""
+    body = d >= -BODY_BIAS
+    levels = np.zeros(d.shape, dtype=np.uint8)
+    if outline_width > 0:
+        levels[d >= -(BODY_BIAS + outline_width)] = 0x8
+    levels[body] = 0xF
+    return levels
+
+
+def sdf_bytes(d, spread):
+    """SDF 输出格式：128 为轮廓，每 spread 像素变化 127"""
+    return np.clip(np.round(128 + d * (127.0 / spread)), 0, 255).astype(np.uint8)
+
+
+def fit_pixel_size(masters, chars, out_size, outline_width, master_px=MASTER_PIXEL_SIZE, min_size=5, max_size=256):
+    """只用母版度量（无需渲染）求字符集都能放入字符格的最大像素大小"""
+    w, h = out_size
+    best = min_size
+    for px in range(min_size, max_size + 1):
+        scale = px / master_px
+        fits = all(
+            round(masters[c]["width"] * scale) + 2 * outline_width <= w
+            and round(masters[c]["rows"] * scale) + 2 * outline_width <= h
+            for c in chars
+        )
+        if not fits:
+            break
+        best = px
+    return best
+
+
+def sdf_header_lines(chars, fields, out_size, spread):
+    w, h = out_size
+    lines = [
+        f"#ifndef FONT_SDF_{w}x{h}_H",
+        f"#define FONT_SDF_{w}x{h}_H",
+        "",
+        "#include <stdint.h>",
+        "",
+        f"// SDF Font: 8-bit signed distance, 128 = glyph edge, +/-127 = +/-{spread} px. Size {w}x{h}, 1 byte per pixel.",
+        "",
+    ]
+    entries = []
+    for c, field in zip(chars, fields):
+        data = field.reshape(-1)
+        name = f"char_{safe_char_name(c)}_{w}x{h}_sdf"
+        entries.append(f"    {{ .width = {w}, .height = {h}, .pdata = {name} }},")
+        lines.append(f"static const uint8_t {name}[{len(data)}] = {{")
+        for i in range(0, len(data), w):
+            lines.append("    " + ", ".join(f"0x{val:02X}" for val in data[i:i + w]) + ",")
+        lines.append("};\n")
+    lines.append(f"static const bitmap_sdf_t sdf_{w}x{h}[{len(chars)}] = {{")
+    lines.extend(entries)
+    lines.append("};")
+    lines.append("")
+    lines.append(f"#endif // FONT_SDF_{w}x{h}_H")
+    return lines
+
+
+def parse_target(text):
+    """'16x32:2' -> ((16, 32), 2)；省略描边宽度时默认为 1"""
+    size, _, ow = text.partition(":")
+    w, h = size.lower().split("x")
+    return (int(w), int(h)), int(ow) if ow else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SDF 母版字形：一次渲染，派生所有尺寸与描边宽度的 OSD 字体")
+    parser.add_argument("--font", type=str, required=True, help="OTF或TTF字体文件路径（可变字体）")
+    parser.add_argument("--chars", type=str, default="0123456789- :", help="需要生成的字符")
+    parser.add_argument("--targets", type=str, nargs="+", default=["8x16:1", "16x32:2", "24x48:2", "48x96:4"], help="目标尺寸与描边宽度，如 16x32:2")
+    parser.add_argument("--master_size", type=int, default=MASTER_PIXEL_SIZE, help="母版渲染像素大小")
+    parser.add_argument("--format", type=str, default="i4", choices=["auto", *FORMATS], help="I4 派生输出格式")
+    parser.add_argument("--emit_sdf", type=int, default=0, choices=[0, 1], help="同时输出 SDF 格式头文件")
+    parser.add_argument("--sdf_spread", type=float, default=4.0, help="SDF 输出的距离范围（像素）")
+    parser.add_argument("--cache_dir", type=str, default=SDF_CACHE_DIR, help="SDF 母版缓存目录，空字符串表示不缓存")
+    parser.add_argument("--preview_dir", type=str, default="previews", help="预览图保存目录")
+    args = parser.parse_args()
+
+    os.makedirs(args.preview_dir, exist_ok=True)
+    masters_by_coords = {}
+    for target in args.targets:
+        out_size, outline_width = parse_target(target)
+        var_coords = get_small_size_var_coords(*out_size)
+        key = var_coords_key(var_coords)
+        if key not in masters_by_coords:
+            masters, rendered = load_masters(args.chars, args.font, var_coords, args.master_size, args.cache_dir or None)
+            print(f"🧊 SDF 母版 var_coords={var_coords}: 渲染 {rendered} 个，缓存命中 {len(set(args.chars)) - rendered} 个")
+            masters_by_coords[key] = masters
+        masters = masters_by_coords[key]
+
+        font_pixel_size = fit_pixel_size(masters, args.chars, out_size, outline_width, args.master_size)
+        distances = [sample_distance(masters[c], c, out_size, font_pixel_size, args.master_size) for c in args.chars]
+        cells = [levels_from_distance(d, outline_width) for d in distances]
+        print(f"===> {out_size[0]}x{out_size[1]} font_pixel_size={font_pixel_size} outline_width={outline_width}")
+        cells = export_chars_black_white_gray_i4_header(
+            args.chars, args.font, out_size, outline_width=outline_width, font_pixel_size=font_pixel_size,
+            var_coords=var_coords, out_format=args.format, cells=cells
+        )
+        if args.emit_sdf:
+            sdf_filename = f"font_chars_sdf_{out_size[0]}x{out_size[1]}.h"
+            fields = [sdf_bytes(d, args.sdf_spread) for d in distances]
+            with open(sdf_filename, "w", encoding="utf-8") as f:
+                f.write("\n".join(sdf_header_lines(args.chars, fields, out_size, args.sdf_spread)))
+            print(f"✅ SDF header saved: {sdf_filename}")
+        preview_path = os.path.join(args.preview_dir, f"preview_{out_size[0]}x{out_size[1]}_size{font_pixel_size}_sdf.png")
+        generate_preview_image(args.chars, args.font, out_size, outline_width, font_pixel_size, preview_path, var_coords=var_coords, cells=cells)
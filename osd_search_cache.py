@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+像素大小 / 轴参数搜索结果的持久缓存
+- find_max_font_size 与 find_best_var_coords 的结果只取决于字体内容、字符格尺寸、描边宽度、
+  测试字符与搜索范围；以这些输入的哈希为键保存在一个小 JSON 文件中
+- 键中包含字体内容哈希，字体文件变化后旧结果自然失效
+- 重复构建时直接跳过搜索阶段；--no-search-cache 可强制重新搜索（结果仍会写回缓存）
+- 写回时先与磁盘上的条目合并并经进程独有的临时文件替换，进程池中多个 worker 可共用同一缓存文件
+"""
+import hashlib
+import json
+import os
+
+from font_scan import font_hash
+
+CACHE_PATH = ".osd_search_cache.json"
+CACHE_VERSION = 2
+
+_stores = {}
+
+
+def search_key(kind, font_path, params):
+    """kind 为搜索类型（如 max_font_size），params 为其余影响结果的输入（需可 JSON 序列化）"""
+    # font_hash 按 (路径, 修改时间, 大小) 持久缓存，字体未变化时不会重新读取
+    payload = json.dumps([CACHE_VERSION, kind, font_hash(font_path), params], sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _read(cache_path):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == CACHE_VERSION:
+            return data.get("entries", {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _load(cache_path):
+    if cache_path not in _stores:
+        _stores[cache_path] = _read(cache_path)
+    return _stores[cache_path]
+
+
+def _save(cache_path, entries):
+    # 其他进程在本进程加载之后写入的条目一并保留
+    for key, entry in _read(cache_path).items():
+        entries.setdefault(key, entry)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": CACHE_VERSION, "entries": entries}, f)
+    os.replace(tmp_path, cache_path)
+
+
+def cached_search(kind, font_path, params, compute, use_cache=True, cache_path=CACHE_PATH):
+    """
+    命中缓存时直接返回保存的结果，否则调用 compute() 并写回缓存。
+    use_cache 为 False 时不读取缓存（仍写回，便于之后的构建复用）；cache_path 为空时完全不缓存
+    """
+    if not cache_path:
+        return compute()
+    entries = _load(cache_path)
+    key = search_key(kind, font_path, params)
+    if use_cache and key in entries:
+        return entries[key]["result"]
+    result = compute()
+    entries[key] = {"kind": kind, "font": os.path.basename(font_path), "params": params, "result": result}
+    try:
+        _save(cache_path, entries)
+    except OSError as e:
+        print(f"⚠️ 搜索缓存写入失败: {e}")
+    return result
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+参数扫描
+- 对 字符格尺寸 × 描边宽度 × 轴参数设置（× 可选的像素大小）的笛卡尔积逐点拟合像素大小与轴参数、渲染字符集并评估可读性
+- 各点在进程池中并行执行：字体经共享内存分发（font_shm），像素大小 / 轴参数搜索结果共用持久缓存（osd_search_cache）
+- 输出一张带标签的合成对比图（每行一个参数点）和一份拟合参数 JSON 表
+- 轴参数设置：auto（按 --axes 搜索）、preset（小尺寸预设）、default（字体默认实例）或 wdth=85,wght=400
+- 点阵字体（BDF / 固定尺寸字体）与 osd.py 一样直接导入原生点阵，不做像素大小与轴参数搜索，只扫描 尺寸 × 描边
+"""
+import numpy as np
+import freetype
+import argparse
+import itertools
+import json
+import time
+import os
+
+from PIL import Image, ImageDraw
+
+from osd import get_small_size_var_coords, search_max_font_size, search_best_var_coords, render_glyphs_batch, outline_and_quantize_batch
+from bitmap_font import is_bitmap_font, render_bitmap_font_canvases
+from osd_axes import AXIS_SEARCH_METHODS, DEFAULT_SEARCH_AXES, apply_var_coords, var_coords_suffix
+from font_select import legibility_metrics, composite_score
+from font_shm import font_face, font_pool
+
+AXIS_SETTINGS = ("auto", "preset", "default")
+# 点阵字体专用的设置：原生点阵，无像素大小与轴参数
+BITMAP_SETTING = "bitmap"
+SHEET_MARGIN = 4
+SHEET_BACKGROUND = (30, 30, 30)
+# 与 generate_preview_image 相同的配色：主体白、亮描边红、描边灰，其余为背景
+PREVIEW_LUT = np.array([
+    (255, 255, 255) if v * 17 >= 220 else (255, 0, 0) if v * 17 >= 150 else (200, 200, 200) if v * 17 >= 80 else SHEET_BACKGROUND
+    for v in range(16)
+], dtype=np.uint8)
+
+
+def parse_size(text):
+    """'16x32' -> (16, 32)"""
+    w, h = text.lower().split("x")
+    return int(w), int(h)
+
+
+def parse_axis_setting(text):
+    """'wdth=85,wght=400' -> {"wdth": 85.0, "wght": 400.0}；auto / preset / default 原样返回"""
+    if text in AXIS_SETTINGS:
+        return text
+    coords = {}
+    for item in text.split(","):
+        tag, _, value = item.partition("=")
+        coords[tag.strip()] = float(value)
+    return coords
+
+
+def sweep_points(targets, outline_widths, axis_settings, sizes=()):
+    """参数点的笛卡尔积；sizes 为空时每个点自动拟合像素大小"""
+    return [
+        {"size": out_size, "outline_width": ow, "axes": setting, "font_pixel_size": px}
+        for out_size, ow, setting, px in itertools.product(targets, outline_widths, axis_settings, list(sizes) or [None])
+    ]
+
+
+def _overflow_chars(face, chars, out_size, outline_width):
+    """位图加描边超出字符格的字符"""
+    over = []
+    for c in chars:
+        face.load_char(c, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_NORMAL)
+        bitmap = face.glyph.bitmap
+        if bitmap.width + 2 * outline_width > out_size[0] or bitmap.rows + 2 * outline_width > out_size[1]:
+            over.append(c)
+    return over
+
+
+def sweep_point(job):
+    """
+    拟合并渲染一个参数点，返回 (结果行, (N, h, w) 灰度级数组)；失败时数组为 None。
+    轴参数为 auto 时先按默认实例拟合像素大小，再在该大小上搜索轴参数（与 osd.py 大尺寸时一致）
+    """
+    font_path, chars, point, tags, method, use_cache = job
+    out_size, ow, setting = point["size"], point["outline_width"], point["axes"]
+    label = setting if isinstance(setting, str) else "manual"
+    row = {"width": out_size[0], "height": out_size[1], "outline_width": ow, "axes": label}
+    t0 = time.perf_counter()
+    try:
+        if setting == BITMAP_SETTING:
+            canvases, info = render_bitmap_font_canvases(chars, font_path, out_size)
+            cells = outline_and_quantize_batch(np.stack(canvases), ow)
+            row.update(var_coords=None, font_pixel_size=None, bitmap=info, overflow="")
+            return _finish_row(row, cells, out_size, t0), cells
+        if setting == "preset":
+            var_coords = get_small_size_var_coords(*out_size)
+        elif setting in ("auto", "default"):
+            var_coords = None
+        else:
+            var_coords = setting
+        px = point["font_pixel_size"] or search_max_font_size(font_path, out_size, ow, var_coords=var_coords, use_cache=use_cache)
+        if setting == "auto":
+            var_coords = search_best_var_coords(font_path, out_size, ow, px, use_cache, tags, method)
+
+        face = font_face(font_path)
+        apply_var_coords(face, var_coords)
+        face.set_pixel_sizes(0, px)
+        overflow = _overflow_chars(face, chars, out_size, ow)
+        cells = render_glyphs_batch([face] * len(chars), chars, out_size, ow)
+        row.update(var_coords=var_coords, font_pixel_size=px, overflow="".join(overflow))
+        return _finish_row(row, cells, out_size, t0), cells
+    except Exception as e:
+        print(f"⚠️ {out_size[0]}x{out_size[1]} ow={ow} axes={setting}: {e}")
+        return dict(row, error=str(e)), None
+
+
+def _finish_row(row, cells, out_size, t0):
+    """补上可读性指标、综合评分与耗时"""
+    metrics = legibility_metrics(cells)
+    stroke, distinct, fill = metrics
+    row.update(stroke=stroke, distinct=distinct, fill=fill, score=composite_score(metrics, out_size),
+               ms=(time.perf_counter() - t0) * 1000)
+    return row
+
+
+def run_sweep(font_path, chars, points, tags=DEFAULT_SEARCH_AXES, method="descent", use_cache=True, workers=None):
+    """在进程池中执行全部参数点，返回与 points 同序的 [(结果行, 灰度级数组)]"""
+    jobs = [(font_path, chars, p, tuple(tags), method, use_cache) for p in points]
+    with font_pool([font_path], workers) as pool:
+        return list(pool.map(sweep_point, jobs))
+
+
+def glyph_strip(cells, scale=1):
+    """(N, h, w) 灰度级数组 -> 横向排列、按预览配色着色的 RGB 图"""
+    n, h, w = cells.shape
+    strip = np.empty((h, n * (w + SHEET_MARGIN) - SHEET_MARGIN, 3), dtype=np.uint8)
+    strip[:] = SHEET_BACKGROUND
+    for i, cell in enumerate(cells):
+        x = i * (w + SHEET_MARGIN)
+        strip[:, x:x + w] = PREVIEW_LUT[cell]
+    img = Image.fromarray(strip, mode="RGB")
+    return img.resize((img.width * scale, img.height * scale), Image.NEAREST)
+
+
+def row_label(row):
+    if "error" in row:
+        return f"{row['width']}x{row['height']} ow{row['outline_width']} {row['axes']}: {row['error']}"
+    suffix = var_coords_suffix(row["var_coords"]).lstrip("_").replace("_", " ") or "default"
+    clip = f" clip:{row['overflow']}" if row["overflow"] else ""
+    if row["font_pixel_size"] is None:
+        return f"{row['width']}x{row['height']} ow{row['outline_width']} {row['bitmap']} score {row['score']:.3f}"
+    return (f"{row['width']}x{row['height']} ow{row['outline_width']} px{row['font_pixel_size']} "
+            f"{row['axes']}:{suffix} score {row['score']:.3f}{clip}")
+
+
+def composite_sheet(results, save_path, scale=2):
+    """每个参数点一行：左侧标签，右侧字符集"""
+    strips = [glyph_strip(cells, scale) if cells is not None else None for _, cells in results]
+    labels = [row_label(row) for row, _ in results]
+    measure = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    label_w = int(max(measure.textlength(t) for t in labels)) + 2 * SHEET_MARGIN
+    heights = [max(s.height if s else 0, 12) for s in strips]
+    sheet_w = label_w + max((s.width for s in strips if s), default=0) + SHEET_MARGIN
+    sheet_h = sum(h + SHEET_MARGIN for h in heights) + SHEET_MARGIN
+
+    sheet = Image.new("RGB", (sheet_w, sheet_h), SHEET_BACKGROUND)
+    draw = ImageDraw.Draw(sheet)
+    y = SHEET_MARGIN
+    for label, strip, h in zip(labels, strips, heights):
+        draw.text((SHEET_MARGIN, y + (h - 10) // 2), label, fill=(200, 200, 200))
+        if strip is not None:
+            sheet.paste(strip, (label_w, y))
+        y += h + SHEET_MARGIN
+    sheet.save(save_path)
+    return sheet
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="参数扫描：并行拟合 尺寸 × 描边 × 轴参数 的笛卡尔积，输出合成对比图与参数表")
+    parser.add_argument("--font", type=str, required=True, help="OTF/TTF字体文件路径（可变字体）")
+    parser.add_argument("--chars", type=str, default="0123456789- :", help="需要生成的字符")
+    parser.add_argument("--targets", type=str, nargs="+", default=["8x16", "16x32", "24x48", "48x96"], help="字符格尺寸，如 16x32")
+    parser.add_argument("--outline_widths", type=int, nargs="+", default=[1, 2], help="描边宽度")
+    parser.add_argument("--axis_settings", type=str, nargs="+", default=list(AXIS_SETTINGS), help="轴参数设置：auto / preset / default 或 wdth=85,wght=400")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[], help="字体像素大小（省略时每个点自动拟合）")
+    parser.add_argument("--axes", type=str, nargs="+", default=list(DEFAULT_SEARCH_AXES), help="auto 设置搜索的可变字体轴")
+    parser.add_argument("--axis_search", type=str, default="descent", choices=list(AXIS_SEARCH_METHODS), help="轴参数搜索方式")
+    parser.add_argument("--workers", type=int, default=None, help="并行进程数（默认 CPU 核数）")
+    parser.add_argument("--scale", type=int, default=2, help="对比图放大倍数")
+    parser.add_argument("--sheet", type=str, default="previews/sweep.png", help="合成对比图保存路径")
+    parser.add_argument("--json", type=str, default="previews/sweep.json", help="拟合参数表保存路径")
+    parser.add_argument("--no-search-cache", dest="no_search_cache", action="store_true", help="忽略像素大小 / 轴参数搜索缓存，强制重新搜索")
+    args = parser.parse_args()
+
+    axis_settings = [parse_axis_setting(s) for s in args.axis_settings]
+    if is_bitmap_font(args.font):
+        # 与 osd.py 一致：点阵字体使用原生尺寸，像素大小与轴参数都不适用
+        if args.sizes:
+            parser.error("--sizes 不适用于点阵字体（BDF / 固定尺寸字体）")
+        print(f"🔲 点阵字体直接导入，忽略轴参数设置: {args.font}")
+        axis_settings = [BITMAP_SETTING]
+    points = sweep_points([parse_size(t) for t in args.targets], args.outline_widths, axis_settings, args.sizes)
+    print(f"🔍 {len(points)} 个参数点")
+    t0 = time.perf_counter()
+    results = run_sweep(args.font, args.chars, points, args.axes, args.axis_search, not args.no_search_cache, args.workers)
+    elapsed = time.perf_counter() - t0
+
+    for path in (args.sheet, args.json):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+    composite_sheet(results, args.sheet, args.scale)
+    rows = [row for row, _ in results]
+    with open(args.json, "w", encoding="utf-8") as f:
+        json.dump({"font": args.font, "chars": args.chars, "points": rows}, f, ensure_ascii=False, indent=2)
+
+    print(f"{'size':>6} {'ow':>2} {'px':>3} {'score':>6}  axes")
+    for row in rows:
+        if "error" not in row:
+            print(f"{row['width']:>2}x{row['height']:<3} {row['outline_width']:>2} {row['font_pixel_size'] or '-':>3} {row['score']:6.3f}  "
+                  f"{row['axes']} {row['var_coords'] or {}}{'  ⚠️ clip ' + row['overflow'] if row['overflow'] else ''}")
+    print(f"✅ {len(points)} 个参数点用时 {elapsed:.2f}s，对比图: {args.sheet}，参数表: {args.json}")
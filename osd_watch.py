@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+监视模式：常驻进程，修改参数或字体后只重建受影响的目标与字形
+- 构建清单即 osd.sh：逐行解析其中的 `python3 osd.py ...` 命令，按 宽x高 区分目标
+- 轮询清单与字体文件的修改时间；未变化的目标不重建
+- 像素大小/轴参数搜索结果、FreeType face、已渲染字形都保留在内存中，
+  只渲染参数变化后新增或失效的字形，单个尺寸的修改通常在 100 ms 内完成
+- 同一字体各尺寸的像素大小搜索共享测试字符的位图尺寸记录，已测过的像素大小不再渲染，结果与 osd.py 单独运行一致
+"""
+import argparse
+import freetype
+import shlex
+import time
+import os
+
+import osd
+from osd import (
+    build_arg_parser, resolve_size_and_axes, get_small_size_var_coords, search_best_var_coords, select_glyph_fonts, render_glyphs_batch,
+    export_chars_black_white_gray_i4_header, generate_preview_image,
+)
+from bitmap_font import is_bitmap_font
+import osd_backends
+from osd_axes import apply_var_coords, var_coords_key, var_coords_suffix
+
+_faces = {}
+
+
+def font_stamp(path):
+    """文件修改时间与大小，作为字体是否变化的依据"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def load_manifest(manifest_path):
+    """解析 osd.sh 中的 osd.py 命令，返回 {(宽, 高): args}；相对路径按清单所在目录解析"""
+    base = os.path.dirname(os.path.abspath(manifest_path))
+    parser = build_arg_parser()
+    targets = {}
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            tokens = shlex.split(line)
+            scripts = [i for i, t in enumerate(tokens) if os.path.basename(t) == "osd.py"]
+            if not scripts:
+                continue
+            args = parser.parse_args(tokens[scripts[0] + 1:])
+            if args.split_c and not args.types_header:
+                raise ValueError(f"{args.width}x{args.height}: --split_c 1 需要同时指定 --types_header")
+            args.font = os.path.join(base, args.font)
+            args.fallback_fonts = [os.path.join(base, p) for p in args.fallback_fonts]
+            args.preview_dir = os.path.join(base, args.preview_dir)
+            targets[(args.width, args.height)] = args
+    return targets
+
+
+def _face(path, var_coords, font_pixel_size):
+    key = (path, font_stamp(path), var_coords_key(var_coords), font_pixel_size)
+    if key not in _faces:
+        face = freetype.Face(path)
+        try:
+            apply_var_coords(face, var_coords)
+        except Exception as e:
+            print(f"⚠️ 设置变量字体轴值失败: {e}")
+        face.set_pixel_sizes(0, font_pixel_size)
+        _faces[key] = face
+    return _faces[key]
+
+
+def forget_font(path):
+    """字体文件变化后丢弃与之相关的 face 与覆盖缓存"""
+    for key in [k for k in _faces if k[0] == path]:
+        del _faces[key]
+    osd._cmap_coverage_cache.pop(path, None)
+    osd_backends._face_cache.clear()
+    osd_backends._pil_font_cache.clear()
+
+
+def render_missing(args, entry, font_pixel_size, var_coords):
+    """只渲染缓存中没有的字形，返回 (字符格列表, 新渲染数量)"""
+    out_size = (args.width, args.height)
+    fonts = [args.font] + list(args.fallback_fonts)
+    render_key = (tuple(font_stamp(p) for p in fonts), tuple(fonts), args.outline_width,
+                  font_pixel_size, var_coords_key(var_coords), args.backend)
+    if entry.get("render_key") != render_key:
+        entry["render_key"] = render_key
+        entry["glyphs"] = {}
+    glyphs = entry["glyphs"]
+    missing = [c for c in dict.fromkeys(args.chars) if c not in glyphs]
+    if missing:
+        if args.backend != "freetype":
+            target = osd_backends.RenderTarget(args.font, out_size, font_pixel_size, args.outline_width, var_coords)
+            glyphs.update(zip(missing, osd_backends.render_cells(args.backend, missing, target)))
+        else:
+            faces = [_face(gf, var_coords if gf == args.font else None, font_pixel_size)
+                     for gf in select_glyph_fonts(missing, fonts)]
+            glyphs.update(zip(missing, render_glyphs_batch(faces, missing, out_size, args.outline_width)))
+    return [glyphs[c] for c in args.chars], len(missing)
+
+
+def build_target(args, entry, out_dir, ladder=None, stats=None):
+    """
+    构建单个目标（头文件 + 预览），entry 为该目标跨轮次保留的缓存；返回新渲染的字形数。
+    ladder 为 {字体: 位图尺寸记录}（见 find_max_font_size 的 measured），同一字体的各尺寸共享
+    """
+    out_size = (args.width, args.height)
+    bitmap_font = is_bitmap_font(args.font)
+    os.makedirs(args.preview_dir, exist_ok=True)
+    # 像素大小/轴参数搜索的全部输入：resolve_size_and_axes 与 search_best_var_coords 读取的参数
+    search_key = (font_stamp(args.font), args.font, args.width, args.height, args.outline_width, args.auto_font_size,
+                  tuple(args.axes), args.axis_search, args.no_search_cache)
+    backend_suffix = f"_{args.backend}" if args.backend != "freetype" else ""
+
+    if args.sizes:
+        rendered = 0
+        for size in args.sizes:
+            size_entry = entry.setdefault(("size", size), {})
+            if size_entry.get("search_key") != search_key:
+                size_entry["search_key"] = search_key
+                var_coords = get_small_size_var_coords(args.width, args.height)
+                if var_coords is None:
+                    var_coords = search_best_var_coords(args.font, out_size, args.outline_width, size, not args.no_search_cache,
+                                                        args.axes, args.axis_search)
+                size_entry["var_coords"] = var_coords
+            var_coords = size_entry["var_coords"]
+            cells, n = render_missing(args, size_entry, size, var_coords)
+            rendered += n
+            suffix = var_coords_suffix(var_coords)
+            preview_path = os.path.join(args.preview_dir, f"preview_{args.width}x{args.height}_size{size}{suffix}{backend_suffix}.png")
+            generate_preview_image(args.chars, args.font, out_size, args.outline_width, size, preview_path,
+                                   var_coords=var_coords, cells=cells)
+        return rendered
+
+    if entry.get("search_key") != search_key:
+        entry["search_key"] = search_key
+        measured = ladder.setdefault(args.font, {}) if ladder is not None else None
+        entry["search"] = resolve_size_and_axes(args, bitmap_font, measured, stats)
+    font_pixel_size, var_coords = entry["search"]
+
+    if bitmap_font:
+        # 点阵字体直接导入，本身无需缓存
+        cells, rendered = None, len(args.chars)
+    else:
+        cells, rendered = render_missing(args, entry, font_pixel_size, var_coords)
+    cells = export_chars_black_white_gray_i4_header(
+        args.chars, args.font, out_size,
+        outline_width=args.outline_width, font_pixel_size=font_pixel_size, var_coords=var_coords,
+        emit_metrics=bool(args.emit_metrics), atlas_align=args.atlas_align if args.atlas else None,
+        out_format=args.format, fallback_fonts=args.fallback_fonts, cells=cells, out_dir=out_dir,
+        split_c=bool(args.split_c), types_header=args.types_header, emit_blit=bool(args.emit_blit),
+        body_color=args.body_color, outline_color=args.outline_color, dedup=args.dedup,
+    )
+    suffix = var_coords_suffix(var_coords) + backend_suffix
+    size_label = f"size{font_pixel_size}" if not bitmap_font else "bitmap"
+    preview_path = os.path.join(args.preview_dir, f"preview_{args.width}x{args.height}_{size_label}{suffix}.png")
+    generate_preview_image(args.chars, args.font, out_size, args.outline_width, font_pixel_size, preview_path,
+                           var_coords=var_coords, cells=cells)
+    return rendered
+
+
+def target_fonts(args):
+    return [args.font] + list(args.fallback_fonts)
+
+
+def watch(manifest_path, out_dir, interval=0.2, once=False):
+    state = {}
+    targets = {}
+    manifest_stamp = None
+    font_stamps = {}
+    # 同一字体各尺寸共享的测试字符位图尺寸，像素大小搜索时已测过的不再渲染
+    ladder = {}
+    while True:
+        stamp = font_stamp(manifest_path)
+        changed = set()
+        if stamp != manifest_stamp:
+            manifest_stamp = stamp
+            try:
+                new_targets = load_manifest(manifest_path)
+            except (SystemExit, ValueError) as e:
+                print(f"⚠️ 清单解析失败，保持上一次的目标: {e}")
+                new_targets = targets
+            for key, args in new_targets.items():
+                if key not in targets or vars(targets[key]) != vars(args):
+                    changed.add(key)
+            for key in set(targets) - set(new_targets):
+                state.pop(key, None)
+            targets = new_targets
+
+        for path in {p for args in targets.values() for p in target_fonts(args)}:
+            stamp = font_stamp(path)
+            if path in font_stamps and font_stamps[path] != stamp:
+                forget_font(path)
+                ladder.pop(path, None)
+                changed.update(key for key, args in targets.items() if path in target_fonts(args))
+            font_stamps[path] = stamp
+
+        stats = {}
+        # 按尺寸从小到大构建
+        for key in sorted(changed):
+            args = targets[key]
+            if font_stamp(args.font) is None:
+                print(f"⚠️ 字体不存在: {args.font}")
+                continue
+            t0 = time.perf_counter()
+            rendered = build_target(args, state.setdefault(key, {}), out_dir, ladder, stats)
+            ms = (time.perf_counter() - t0) * 1000
+            print(f"🔁 {key[0]}x{key[1]}: 渲染 {rendered}/{len(args.chars)} 个字形，用时 {ms:.0f} ms")
+        if stats.get("probes"):
+            print(f"🔍 像素大小搜索共探测渲染 {stats['probes']} 次")
+
+        if once:
+            return state
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="监视 osd.sh 与字体文件，增量重建受影响的 OSD 字体头文件")
+    parser.add_argument("--manifest", type=str, default="osd.sh", help="构建清单（osd.sh）")
+    parser.add_argument("--out_dir", type=str, default="font", help="头文件输出目录")
+    parser.add_argument("--interval", type=float, default=0.2, help="轮询间隔（秒）")
+    parser.add_argument("--once", type=int, default=0, choices=[0, 1], help="只构建一次后退出")
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    print(f"👀 监视 {args.manifest} 及其引用的字体，Ctrl+C 退出")
+    try:
+        watch(args.manifest, args.out_dir, args.interval, bool(args.once))
+    except KeyboardInterrupt:
+        print("👋 已退出监视")